@@ -0,0 +1,85 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Benchmark for the HTML text extraction backends;
+    Compares BeautifulSoup (html.parser, full DOM) with the streaming `HTMLTextExtractor`
+    across generated HTML files of growing size: throughput (MB/s) and peak Python memory.
+Example:
+    python -m benchmarks.bench_html_extract --sizes 0.1 1 10
+"""
+
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+from src.core.html_extractor import extract_html_text
+
+
+def generate_html(html_file: str, size_mb: float, seed: int = 42):
+    """Generate an HTML file of about `size_mb` MB, looking like generated documentation."""
+    rnd = random.Random(seed)
+    target_size = int(size_mb * 1024 * 1024)
+    with open(html_file, 'w', encoding='utf-8') as file:
+        file.write("<!DOCTYPE html><html><head><title>Generated Doc</title>"
+                   "<style>body { font-family: sans-serif; }</style></head><body>\n")
+        written = 0
+        while written < target_size:
+            words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 9))) for _ in range(rnd.randint(8, 25))]
+            block = (f"<div class='section'><h2>Section {written}</h2><p>{' '.join(words)}. "
+                     f"<a href='#s{written}'>link</a> <b>{words[0]}</b> &amp; more.</p>"
+                     f"<script>var id = {written};</script></div>\n")
+            file.write(block)
+            written += len(block)
+        file.write("</body></html>\n")
+
+
+def bs4_extract(html_file: str) -> tuple:
+    with open(html_file, 'rb') as file:
+        page_soup = BeautifulSoup(file, 'html.parser')
+    return page_soup.title.text if page_soup.title else None, page_soup.text
+
+
+def measure(func, *args) -> tuple:
+    """Run the given function twice (timed, then traced); returns (result, seconds, peak MB)."""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc slows the run down, so the memory is measured separately
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML text extraction backends.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.1, 1, 10], help="HTML file sizes in MB")
+    args = parser.parse_args()
+
+    print(f"{'size (MB)':>9} {'bs4 (MB/s)':>11} {'bs4 peak (MB)':>14} {'stream (MB/s)':>14} {'stream peak (MB)':>17}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            html_file = os.path.join(tmp_dir, f"doc_{size_mb}.html")
+            generate_html(html_file, size_mb)
+            file_mb = os.path.getsize(html_file) / (1024 * 1024)
+
+            expected, bs4_time, bs4_peak = measure(bs4_extract, html_file)
+            result, stream_time, stream_peak = measure(extract_html_text, html_file)
+            if result != expected:
+                raise AssertionError(f"Extracted text differs from BeautifulSoup for {file_mb:.1f} MB")
+
+            print(f"{file_mb:>9.1f} {file_mb / bs4_time:>11.2f} {bs4_peak:>14.1f} "
+                  f"{file_mb / stream_time:>14.2f} {stream_peak:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Benchmark for the keyword matcher engines;
+    Compares the matcher engines against the original nested loop
+    (every keyword against every sentence) as the keyword count and document size grow.
+@note: The keywords and sentences are generated (seeded), no document is needed.
+Example:
+    python -m benchmarks.bench_matcher
+    python -m benchmarks.bench_matcher --keywords 10 100 1000 --sentences 1000 10000
+"""
+
+
+import argparse
+import random
+import string
+import time
+
+from src.core.matcher import MATCHER_ENGINES, build_matcher
+
+
+def generate_keywords(count: int, rnd: random.Random) -> list:
+    """Generate the given number of keywords looking like product names/build numbers."""
+    keywords = []
+    for index in range(count):
+        word = "".join(rnd.choices(string.ascii_uppercase, k=rnd.randint(4, 10)))
+        keywords.append(f"{word} {index}.{rnd.randint(0, 99)}")
+    return keywords
+
+
+def generate_sentences(count: int, keywords: list, rnd: random.Random, density: float = 0.01) -> list:
+    """Generate the given number of sentences; `density` of them contain a keyword."""
+    sentences = []
+    for _ in range(count):
+        words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 9))) for _ in range(rnd.randint(8, 30))]
+        if keywords and rnd.random() < density:
+            words.insert(rnd.randint(0, len(words)), rnd.choice(keywords))
+        sentences.append(" ".join(words) + ".")
+    return sentences
+
+
+def nested_loop(keywords: list, sentences: list) -> int:
+    """The original FindKeyword implementation; every keyword against every sentence."""
+    hits = 0
+    for sentence in sentences:
+        for keyword in keywords:
+            if keyword.lower() in sentence.lower():
+                hits += 1
+    return hits
+
+
+def matcher_loop(matcher, sentences: list) -> int:
+    """The matcher implementation; all the keywords against each sentence in one pass."""
+    hits = 0
+    for sentence in sentences:
+        hits += len(matcher.find(sentence))
+    return hits
+
+
+def timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the keyword matcher engines against the nested loop.")
+    parser.add_argument("--keywords", type=int, nargs="+", default=[10, 100, 1000, 5000], help="Keyword counts")
+    parser.add_argument("--sentences", type=int, nargs="+", default=[1000, 10000], help="Sentence counts")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    engines = list(MATCHER_ENGINES)
+    print(f"{'keywords':>9} {'sentences':>10} {'nested (s)':>11} " + " ".join(f"{e + ' (s)':>17}" for e in engines)
+          + f" {'build (s)':>10}")
+
+    for keyword_count in args.keywords:
+        for sentence_count in args.sentences:
+            rnd = random.Random(args.seed)
+            keywords = generate_keywords(keyword_count, rnd)
+            sentences = generate_sentences(sentence_count, keywords, rnd)
+
+            expected, nested_time = timed(nested_loop, keywords, sentences)
+            engine_times = []
+            build_time = 0.0
+            for engine in engines:
+                matcher, elapsed = timed(build_matcher, keywords, engine)
+                build_time = max(build_time, elapsed)
+                hits, elapsed = timed(matcher_loop, matcher, sentences)
+                if hits != expected:
+                    raise AssertionError(f"{engine}: found {hits} hits, expected {expected}")
+                engine_times.append(elapsed)
+
+            print(f"{keyword_count:>9} {sentence_count:>10} {nested_time:>11.3f} "
+                  + " ".join(f"{t:>17.3f}" for t in engine_times) + f" {build_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
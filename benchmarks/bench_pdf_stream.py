@@ -0,0 +1,96 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Benchmark for the streaming PDF scan;
+    Compares `FindKeyword.find()` (collects every match) with `FindKeyword.stream()`
+    (page by page) on a generated PDF: total time, time to the first match and peak Python memory.
+@note: The peak memory is measured with tracemalloc, so it only covers the Python objects
+    (matches, sentences, page text) and not the memory used inside MuPDF.
+Example:
+    python -m benchmarks.bench_pdf_stream --pages 2000
+"""
+
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+import fitz
+from src.core.find_keyword import FindKeyword
+
+
+def generate_pdf(pdf_file: str, pages: int, keywords: list, density: float, seed: int = 42):
+    """Generate a PDF with `pages` pages of sentences; `density` of the sentences contain a keyword."""
+    rnd = random.Random(seed)
+    pdf_doc = fitz.open()
+    for _ in range(pages):
+        lines = []
+        for _ in range(40):
+            words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 8))) for _ in range(rnd.randint(6, 12))]
+            if rnd.random() < density:
+                words.insert(rnd.randint(0, len(words)), rnd.choice(keywords))
+            lines.append(" ".join(words) + ".")
+        page = pdf_doc.new_page()
+        page.insert_textbox(page.rect + (36, 36, -36, -36), " ".join(lines), fontsize=8)
+    pdf_doc.save(pdf_file)
+    pdf_doc.close()
+
+
+def measure(func) -> tuple:
+    """Run the given function; returns (result, seconds, peak MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def first_match(find_keyword: FindKeyword) -> float:
+    """Seconds until the first match is available from the stream."""
+    start = time.perf_counter()
+    stream = find_keyword.stream()
+    next(stream, None)
+    elapsed = time.perf_counter() - start
+    stream.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming PDF scan against find().")
+    parser.add_argument("--pages", type=int, default=500, help="Number of pages in the generated PDF")
+    parser.add_argument("--density", type=float, default=0.2, help="Fraction of sentences containing a keyword")
+    parser.add_argument("--keyword_file", default="./rules/keywords.txt", help="Keyword file")
+    args = parser.parse_args()
+
+    with open(args.keyword_file) as file:
+        keywords = [keyword.strip() for keyword in file if keyword.strip()]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_file = os.path.join(tmp_dir, "bench.pdf")
+        generate_pdf(pdf_file, args.pages, keywords, args.density)
+
+        def new_finder():
+            return FindKeyword(src_file=pdf_file, keywords_file=args.keyword_file, file_ext="pdf")
+
+        (issue_counter, _), find_time, find_peak = measure(lambda: new_finder().find())
+        stream_count, stream_time, stream_peak = measure(lambda: sum(1 for _ in new_finder().stream()))
+        _, gate_time, gate_peak = measure(lambda: list(new_finder().stream(max_matches=1)))
+        first_time = first_match(new_finder())
+
+    print(f"pages: {args.pages}, matches: {issue_counter} (stream: {stream_count})")
+    print(f"{'mode':<22} {'time (s)':>9} {'peak (MB)':>10}")
+    print(f"{'find()':<22} {find_time:>9.3f} {find_peak:>10.2f}")
+    print(f"{'stream()':<22} {stream_time:>9.3f} {stream_peak:>10.2f}")
+    print(f"{'stream(max_matches=1)':<22} {gate_time:>9.3f} {gate_peak:>10.2f}")
+    print(f"{'stream() first match':<22} {first_time:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Benchmark of the keyword search pipeline;
+    Scans a synthetic corpus (see `benchmarks/corpus.py`) per document type and measures the throughput
+    (files/s, MB/s) of `FindKeyword.find()`, the peak RSS and the time of each stage:
+    extraction, segmentation, matching and reporting.
+@note: Each case runs in a fresh process (spawn), so the peak RSS is the one of that case only.
+    The stage times are measured separately from the end-to-end run, with the same building blocks
+    (extractors, `SentenceSpans`, the matcher, `ScanReport`); for TXT files the segmentation is the
+    line index. The results are written as JSON (with the git commit) to compare them between commits.
+Example:
+    python -m benchmarks.bench_pipeline --files 20 --pages 10 --output ./out/benchmarks/pipeline.json
+    python -m benchmarks.bench_pipeline --compare ./out/benchmarks/baseline.json
+"""
+
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import GENERATORS, generate_corpus
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; the peak RSS is not reported
+    resource = None
+
+
+# The pipeline stages, in order
+STAGES = ("extraction", "segmentation", "matching", "reporting")
+
+
+def peak_rss_mb():
+    """The peak resident set size of the current process (MB); None if it can not be measured."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit():
+    """The current git commit, to compare the results between commits (None outside a git checkout)."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def extract_blocks(src_file: str, file_type: str, html_parser: str) -> list:
+    """Extract the text blocks of a document, the same way as `FindKeyword`."""
+    if file_type == "html" and html_parser == "stream":
+        from src.core.html_extractor import HTMLTextExtractor
+        return list(HTMLTextExtractor().iter_text(src_file))
+
+    if file_type == "html":
+        from bs4 import BeautifulSoup
+        with open(src_file, 'rb') as file:
+            return [BeautifulSoup(file, 'html.parser').text]
+
+    if file_type == "pdf":
+        import fitz
+        with fitz.open(src_file) as pdf_doc:
+            return [page.get_text("text") for page in pdf_doc]
+
+    with open(src_file, 'rb') as file:
+        return [file.read().decode("utf-8", errors="replace")]
+
+
+def time_stages(paths: list, file_type: str, html_parser: str, matcher, results: list) -> dict:
+    """Time each stage of the pipeline over all the files; returns `{stage: seconds}`."""
+    from src.core.segmenter import SentenceSpans
+    from src.core.text_scanner import _newline_index
+    from src.utilities.scan_report import ScanReport
+
+    stages = dict.fromkeys(STAGES, 0.0)
+    for src_file in paths:
+        start = time.perf_counter()
+        blocks = extract_blocks(src_file, file_type, html_parser)
+        stages["extraction"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        segments = [_newline_index(block) if file_type == "txt" else SentenceSpans(block) for block in blocks]
+        stages["segmentation"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        if file_type == "txt":
+            for block in blocks:
+                for _ in matcher.iter_matches(block):
+                    pass
+        else:
+            for spans in segments:
+                spans.match(matcher)
+        stages["matching"] += time.perf_counter() - start
+
+    # The run level report of all the files
+    start = time.perf_counter()
+    report = ScanReport(matcher=matcher)
+    for src_file, (issue_counter, file_data) in zip(paths, results):
+        report.add(src_file, issue_counter, file_data)
+    with tempfile.TemporaryDirectory() as report_dir:
+        report.write(report_dir=report_dir)
+    stages["reporting"] += time.perf_counter() - start
+
+    return {stage: round(seconds, 6) for stage, seconds in stages.items()}
+
+
+def run_case(case: dict) -> dict:
+    """Run one benchmark case (a document type/HTML parser) over its files; returns the measures."""
+    from src.core.find_keyword import FindKeyword
+
+    paths, file_type, html_parser = case["paths"], case["file_type"], case["html_parser"]
+    mode = case.get("mode", "report")
+    finder = FindKeyword(src_file=None, keywords_file=case["keywords_file"], file_ext=file_type,
+                         matcher_engine=case["matcher_engine"], html_parser=html_parser, mode=mode)
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+
+    # End-to-end scan (best of `repeat`)
+    best, results = None, []
+    for _ in range(case["repeat"]):
+        start = time.perf_counter()
+        results = [FindKeyword(src_file=path, keywords_file=finder.keywords_file, file_ext=file_type,
+                               matcher=finder.matcher, html_parser=html_parser, mode=mode).find() for path in paths]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    peak_rss = peak_rss_mb()
+
+    # Per stage times (best of `repeat`)
+    stages = None
+    for _ in range(case["repeat"]):
+        times = time_stages(paths, file_type, html_parser, finder.matcher, results)
+        stages = times if stages is None else {stage: min(stages[stage], times[stage]) for stage in STAGES}
+
+    return {
+        "file_type": file_type,
+        "html_parser": html_parser if file_type == "html" else None,
+        "mode": mode,
+        "files": len(paths),
+        "bytes": total_bytes,
+        "matches": sum(max(issue_counter, 0) for issue_counter, _ in results),
+        "seconds": round(best, 6),
+        "files_per_sec": round(len(paths) / best, 3) if best else None,
+        "mb_per_sec": round(total_bytes / (1024 * 1024) / best, 3) if best else None,
+        "peak_rss_mb": round(peak_rss, 2) if peak_rss is not None else None,
+        "stages": stages,
+    }
+
+
+def case_name(result: dict) -> str:
+    return f"{result['file_type']}/{result['html_parser']}" if result["html_parser"] else result["file_type"]
+
+
+def print_results(results: list, baseline: dict = None):
+    """Print the results table; with a baseline, the ratio of the files/s and stage times (new / old)."""
+    header = f"{'case':<12} {'files/s':>9} {'MB/s':>8} {'RSS (MB)':>9} " + " ".join(f"{stage:>13}" for stage in STAGES)
+    print(header)
+    for result in results:
+        rss = f"{result['peak_rss_mb']:>9.1f}" if result["peak_rss_mb"] is not None else f"{'-':>9}"
+        print(f"{case_name(result):<12} {result['files_per_sec']:>9.2f} {result['mb_per_sec']:>8.2f} {rss} "
+              + " ".join(f"{result['stages'][stage]:>13.4f}" for stage in STAGES))
+
+        old = (baseline or {}).get(case_name(result))
+        if old:
+            ratios = [result["stages"][stage] / old["stages"][stage] if old["stages"].get(stage) else float("nan")
+                      for stage in STAGES]
+            print(f"{'  vs base':<12} {result['files_per_sec'] / old['files_per_sec']:>8.2f}x {'':>8} {'':>9} "
+                  + " ".join(f"{ratio:>12.2f}x" for ratio in ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the keyword search pipeline on a synthetic corpus.")
+    parser.add_argument("--corpus", default=None, help="Corpus directory; generated if it has no keywords.txt (default: temporary)")
+    parser.add_argument("--file_types", nargs="+", default=list(GENERATORS), choices=list(GENERATORS), help="Document types")
+    parser.add_argument("--html_parsers", nargs="+", default=["bs4", "stream"], help="HTML parser backends")
+    parser.add_argument("--files", type=int, default=10, help="Number of documents per type")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages per document")
+    parser.add_argument("--sentence_words", type=int, nargs=2, default=(6, 14), help="Min and max words per sentence")
+    parser.add_argument("--density", type=float, default=0.05, help="Fraction of sentences containing a keyword")
+    parser.add_argument("--keywords", type=int, default=50, help="Size of the keyword list")
+    parser.add_argument("--keyword_file", default="./rules/keywords.txt", help="Keywords to start the keyword list with")
+    parser.add_argument("--matcher_engine", default="regex", help="Keyword matcher engine")
+    parser.add_argument("--mode", default="report", choices=["report", "gate"], help="Scan mode of the end-to-end run")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the best time is kept")
+    parser.add_argument("--output", default="./out/benchmarks/pipeline.json", help="JSON results file")
+    parser.add_argument("--compare", default=None, help="JSON results file of a previous run to compare with")
+    parser.add_argument("--in_process", action="store_true", help="Run the cases in this process (no per case peak RSS)")
+    args = parser.parse_args()
+
+    base_keywords = []
+    if os.path.exists(args.keyword_file):
+        with open(args.keyword_file, encoding='utf-8') as file:
+            base_keywords = [keyword.strip() for keyword in file if keyword.strip()]
+
+    params = {
+        "file_types": args.file_types, "files": args.files, "pages": args.pages,
+        "sentence_words": list(args.sentence_words), "density": args.density, "keywords": args.keywords,
+        "matcher_engine": args.matcher_engine, "mode": args.mode, "repeat": args.repeat,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = args.corpus or tmp_dir
+        start = time.perf_counter()
+        corpus = generate_corpus(corpus_dir, args.file_types, args.files, args.pages, tuple(args.sentence_words),
+                                 args.density, args.keywords, base_keywords=base_keywords) \
+            if not os.path.exists(os.path.join(corpus_dir, "keywords.txt")) else None
+        if corpus is None:
+            # Reuse the given corpus
+            corpus = {"keywords_file": os.path.join(corpus_dir, "keywords.txt"),
+                      "files": {file_type: sorted(os.path.join(corpus_dir, file_type, name)
+                                                  for name in os.listdir(os.path.join(corpus_dir, file_type)))
+                                for file_type in args.file_types}}
+        print(f"corpus: {corpus_dir} ({time.perf_counter() - start:.1f} s)")
+
+        cases = []
+        for file_type in args.file_types:
+            for html_parser in (args.html_parsers if file_type == "html" else ["bs4"]):
+                cases.append({"paths": corpus["files"][file_type], "file_type": file_type, "html_parser": html_parser,
+                              "keywords_file": corpus["keywords_file"], "matcher_engine": args.matcher_engine,
+                              "mode": args.mode, "repeat": args.repeat})
+
+        if args.in_process:
+            results = [run_case(case) for case in cases]
+        else:
+            # A fresh process per case
+            context = multiprocessing.get_context("spawn")
+            results = []
+            for case in cases:
+                with context.Pool(1) as pool:
+                    results.append(pool.apply(run_case, (case,)))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = {case_name(result): result for result in json.load(file)["results"]}
+    print_results(results, baseline)
+
+    output = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(output, file, indent=2)
+    print(f"results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
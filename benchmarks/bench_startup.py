@@ -0,0 +1,161 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Benchmark of the startup time;
+    Measures the wall time of short runs, each in a fresh interpreter: the bare interpreter, the import of
+    the engine (`src.core.find_keyword`) and of the parser backends, a CLI scan (`python -m src scan`) of
+    one small file per document type, and the same scan through pytest.
+@note: For the small files of a pre-commit hook the startup (imports, pytest collection) dominates the
+    scan itself. Each case also lists the heavy modules it loaded (from `python -X importtime`), to check
+    that the parser backends are only imported by the file types needing them. The best of `--repeat`
+    runs is kept; the results are written as JSON (with the git commit) to compare them between commits.
+Example:
+    python -m benchmarks.bench_startup --repeat 5 --output ./out/benchmarks/startup.json
+    python -m benchmarks.bench_startup --compare ./out/benchmarks/baseline_startup.json
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_pipeline import git_commit
+
+
+# The repository root; the runs are started from it (`python -m src`, the pytest conftest)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules reported when a case imports them
+HEAVY_MODULES = ("fitz", "bs4", "asyncio", "concurrent.futures", "multiprocessing", "sqlite3")
+
+
+def make_files(work_dir: str) -> dict:
+    """A keyword file and one small clean document per type; returns their paths."""
+    paths = {"keywords_file": os.path.join(work_dir, "keywords.txt")}
+    with open(paths["keywords_file"], 'w', encoding='utf-8') as file:
+        file.write("BANNED KEYWORD\nSAMPLE KEYWORD\n")
+
+    paths["txt"] = os.path.join(work_dir, "doc.txt")
+    with open(paths["txt"], 'w', encoding='utf-8') as file:
+        file.write("A short clean document.\nNothing to report here.\n")
+
+    paths["html"] = os.path.join(work_dir, "doc.html")
+    with open(paths["html"], 'w', encoding='utf-8') as file:
+        file.write("<html><title>Doc</title><body><p>A short clean document.</p></body></html>")
+
+    import fitz
+    paths["pdf"] = os.path.join(work_dir, "doc.pdf")
+    pdf_doc = fitz.open()
+    pdf_doc.new_page().insert_text((72, 72), "A short clean document.")
+    pdf_doc.save(paths["pdf"])
+    pdf_doc.close()
+    return paths
+
+
+def build_cases(paths: dict, work_dir: str, file_types: list, with_pytest: bool = True) -> dict:
+    """The command (argument list) of each case, by case name."""
+    python = [sys.executable]
+    cases = {
+        "python": python + ["-c", "pass"],
+        "import_engine": python + ["-c", "import src.core.find_keyword"],
+        "import_backends": python + ["-c", "import bs4, fitz"],
+    }
+    for file_type in file_types:
+        cases[f"cli_{file_type}"] = python + ["-m", "src", "scan", paths[file_type],
+                                              "--keyword_file", paths["keywords_file"],
+                                              "--rules-cache-dir", os.path.join(work_dir, "rules_cache")]
+    if with_pytest:
+        for file_type in file_types:
+            target_dir = os.path.join(work_dir, f"pytest_{file_type}")
+            os.makedirs(target_dir, exist_ok=True)
+            with open(paths[file_type], 'rb') as src, open(os.path.join(target_dir, os.path.basename(paths[file_type])), 'wb') as dst:
+                dst.write(src.read())
+            # Same scan, without the reports of pytest.ini (addopts) and the caches
+            cases[f"pytest_{file_type}"] = python + [
+                "-m", "pytest", "tests/test_seach_keywords.py", "-q", "-s", "-p", "no:cacheprovider", "-o", "addopts=",
+                "--target_dir", target_dir, "--file_ext", file_type, "--keyword_file", paths["keywords_file"],
+                "--no-cache", "--report_dir", target_dir, "--manifest", os.path.join(target_dir, "manifest.json"),
+                "--rules-cache-dir", os.path.join(work_dir, "rules_cache")]
+    return cases
+
+
+def loaded_modules(command: list) -> list:
+    """The heavy modules (see `HEAVY_MODULES`) imported by the command, from `python -X importtime`."""
+    command = command[:1] + ["-X", "importtime"] + command[1:]
+    stderr = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True).stderr
+    imported = set()
+    for line in stderr.splitlines():
+        if line.startswith("import time:"):
+            imported.add(line.rsplit("|", 1)[-1].strip())
+    return [module for module in HEAVY_MODULES if module in imported]
+
+
+def run_case(name: str, command: list, repeat: int = 3) -> dict:
+    """Run the command `repeat` times; the best wall time is kept."""
+    times = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        completed = subprocess.run(command, cwd=REPO_ROOT, capture_output=True)
+        times.append(time.perf_counter() - start)
+
+    return {
+        "case": name,
+        "best_s": round(min(times), 4),
+        "median_s": round(sorted(times)[len(times) // 2], 4),
+        "exit_code": completed.returncode,
+        "modules": loaded_modules(command),
+    }
+
+
+def print_results(results: list, baseline: dict = None):
+    """Print the results table; with a baseline, the ratio of the best times (new / old)."""
+    print(f"{'case':<16} {'best (s)':>9} {'median (s)':>11} {'exit':>5} {'vs base':>8}  modules")
+    for result in results:
+        old = (baseline or {}).get(result["case"])
+        ratio = f"{result['best_s'] / old['best_s']:>7.2f}x" if old and old["best_s"] else f"{'':>8}"
+        print(f"{result['case']:<16} {result['best_s']:>9.3f} {result['median_s']:>11.3f} {result['exit_code']:>5} "
+              f"{ratio}  {', '.join(result['modules']) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time of the CLI and pytest runs.")
+    parser.add_argument("--file_types", nargs="+", default=["txt", "html", "pdf"], choices=["txt", "html", "pdf"], help="Document types")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the best time is kept")
+    parser.add_argument("--no_pytest", action="store_true", help="Skip the pytest cases")
+    parser.add_argument("--output", default="./out/benchmarks/startup.json", help="JSON results file")
+    parser.add_argument("--compare", default=None, help="JSON results file of a previous run to compare with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = make_files(work_dir)
+        cases = build_cases(paths, work_dir, args.file_types, with_pytest=not args.no_pytest)
+        results = [run_case(name, command, repeat=args.repeat) for name, command in cases.items()]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = {result["case"]: result for result in json.load(file)["results"]}
+    print_results(results, baseline)
+
+    output = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"file_types": args.file_types, "repeat": args.repeat},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(output, file, indent=2)
+    print(f"results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Synthetic corpus generator;
+    Generates HTML, PDF and TXT documents (and their keyword file) to benchmark the keyword search
+    with a configurable number of files/pages, sentence length, keyword density and keyword list size.
+@note: The corpus is reproducible (seeded); the same arguments always generate the same files.
+Example:
+    python -m benchmarks.corpus --out ./out/corpus --file_types html pdf txt --files 20 --pages 10
+"""
+
+
+import argparse
+import os
+import random
+import string
+
+# Sentences per page (a PDF page, an HTML section or a block of TXT lines)
+SENTENCES_PER_PAGE = 40
+
+
+def generate_keywords(base_keywords: list, size: int, seed: int = 42) -> list:
+    """The base keywords, completed with random 2 word keywords up to `size` keywords."""
+    rnd = random.Random(seed)
+    keywords = list(base_keywords[:size])
+    while len(keywords) < size:
+        keywords.append(" ".join("".join(rnd.choices(string.ascii_uppercase, k=rnd.randint(4, 9))) for _ in range(2)))
+    return keywords
+
+
+def generate_sentences(rnd: random.Random, count: int, keywords: list, density: float, sentence_words: tuple) -> list:
+    """Random sentences of `sentence_words` (min, max) words; `density` of them contain a keyword."""
+    sentences = []
+    for _ in range(count):
+        words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 8)))
+                 for _ in range(rnd.randint(*sentence_words))]
+        if keywords and rnd.random() < density:
+            words.insert(rnd.randint(0, len(words)), rnd.choice(keywords))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return sentences
+
+
+def generate_html(html_file: str, pages: list):
+    """Write an HTML document with one section per page."""
+    with open(html_file, 'w', encoding='utf-8') as file:
+        file.write("<!DOCTYPE html><html><head><title>Generated Doc</title>"
+                   "<style>body { font-family: sans-serif; }</style></head><body>\n")
+        for page_number, sentences in enumerate(pages, start=1):
+            file.write(f"<div class='page'><h2>Page {page_number}</h2><p>{' '.join(sentences)}</p>"
+                       f"<script>var page = {page_number};</script></div>\n")
+        file.write("</body></html>\n")
+
+
+def generate_pdf(pdf_file: str, pages: list):
+    """Write a PDF document, one sentence list per page."""
+    import fitz
+
+    pdf_doc = fitz.open()
+    for sentences in pages:
+        page = pdf_doc.new_page()
+        page.insert_textbox(page.rect + (36, 36, -36, -36), " ".join(sentences), fontsize=7)
+    pdf_doc.save(pdf_file)
+    pdf_doc.close()
+
+
+def generate_txt(txt_file: str, pages: list):
+    """Write a text document, one sentence per line and an empty line between the pages."""
+    with open(txt_file, 'w', encoding='utf-8') as file:
+        for sentences in pages:
+            file.write("\n".join(sentences) + "\n\n")
+
+
+# Document generators by file type
+GENERATORS = {
+    "html": generate_html,
+    "pdf": generate_pdf,
+    "txt": generate_txt,
+}
+
+
+def generate_corpus(out_dir: str, file_types=("html", "pdf", "txt"), files: int = 10, pages: int = 10,
+                    sentence_words: tuple = (6, 14), density: float = 0.05, keywords: int = 50,
+                    base_keywords: list = None, seed: int = 42) -> dict:
+    """
+    Generate a corpus of `files` documents per file type, with `pages` pages each.
+
+    Args:
+        out_dir (str): The corpus directory; one sub directory per file type.
+        file_types (tuple): The document types to generate (html, pdf, txt).
+        files (int): The number of documents per file type.
+        pages (int): The number of pages per document.
+        sentence_words (tuple): The (min, max) number of words of a sentence.
+        density (float): The fraction of the sentences containing a keyword.
+        keywords (int): The size of the keyword list.
+        base_keywords (list): The keywords to start the list with (e.g. the real keyword file).
+        seed (int): The random seed.
+    Returns:
+        dict: `{"keywords_file": path, "files": {file type: [paths]}}`.
+    """
+    rnd = random.Random(seed)
+    keyword_list = generate_keywords(base_keywords or [], keywords, seed=seed)
+
+    os.makedirs(out_dir, exist_ok=True)
+    keywords_file = os.path.join(out_dir, "keywords.txt")
+    with open(keywords_file, 'w', encoding='utf-8') as file:
+        file.write("\n".join(keyword_list) + "\n")
+
+    corpus = {"keywords_file": keywords_file, "files": {}}
+    for file_type in file_types:
+        type_dir = os.path.join(out_dir, file_type)
+        os.makedirs(type_dir, exist_ok=True)
+        corpus["files"][file_type] = []
+        for file_number in range(files):
+            doc_pages = [generate_sentences(rnd, SENTENCES_PER_PAGE, keyword_list, density, sentence_words)
+                         for _ in range(pages)]
+            doc_file = os.path.join(type_dir, f"doc_{file_number:05d}.{file_type}")
+            GENERATORS[file_type](doc_file, doc_pages)
+            corpus["files"][file_type].append(doc_file)
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic corpus for the keyword search benchmarks.")
+    parser.add_argument("--out", default="./out/corpus", help="Corpus directory")
+    parser.add_argument("--file_types", nargs="+", default=list(GENERATORS), choices=list(GENERATORS), help="Document types")
+    parser.add_argument("--files", type=int, default=10, help="Number of documents per type")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages per document")
+    parser.add_argument("--sentence_words", type=int, nargs=2, default=(6, 14), help="Min and max words per sentence")
+    parser.add_argument("--density", type=float, default=0.05, help="Fraction of sentences containing a keyword")
+    parser.add_argument("--keywords", type=int, default=50, help="Size of the keyword list")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.out, args.file_types, args.files, args.pages, tuple(args.sentence_words),
+                             args.density, args.keywords)
+    for file_type, paths in corpus["files"].items():
+        print(f"{file_type}: {len(paths)} files in {os.path.join(args.out, file_type)}")
+    print(f"keywords: {corpus['keywords_file']}")
+
+
+if __name__ == "__main__":
+    main()
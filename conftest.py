@@ -1,12 +1,246 @@
+import os
 import pytest
-from src.utilities.utilities import Utilities
+from src.core.batch_scan import scan_files
+from src.core.extractors import EXTRACTORS, load_plugins
+from src.core.find_keyword import FindKeyword, HTML_PARSERS, SCAN_MODES
+from src.core.matcher import KeywordMatcher
+from src.core.page_cache import PageCache
+from src.core.scan_cache import ScanCache
+from src.utilities.file_discovery import FileDiscovery, FileManifest
+from src.utilities.instrumentation import NULL_METRICS, PROFILE_MODES, ScanMetrics
+from src.utilities.scan_report import ScanReport
+from src.utilities.sharding import SHARD_BY, ScanTimings, file_weights, partial_report_name, shard_files
 from src.configs.configs import *
 
 def pytest_addoption(parser):
     """Add custom command line options for pytest."""
-    parser.addoption("--file_ext", action="store", default="html", help="File extension to search for (default: html)")
+    parser.addoption("--file_ext", action="store", default="html", help="File extension(s) to search for, comma separated e.g. html,pdf,txt,docx,md,xml; or 'auto' for every registered document type, each file scanned by its type (default: html)")
     parser.addoption("--target_dir", action="store", default="./out", help="Source directory to search in (default: ./out)")
     parser.addoption("--keyword_file", action="store", default="./rules/keywords.txt", help="Source directory to search in (default: ./rules/keywords.txt)")
+    parser.addoption("--workers", action="store", type=int, default=0, help="Number of worker processes to pre-scan the files with (default: 0, scan in each test)")
+    parser.addoption("--cache-dir", action="store", default="./out/scan_cache", help="Directory of the scan result cache (default: ./out/scan_cache)")
+    parser.addoption("--no-cache", action="store_true", default=False, help="Do not use the scan result cache; scan every file again")
+    parser.addoption("--page-cache", action="store", default="./out/page_cache.sqlite", help="Cache of the PDF page matches; the unchanged pages are not scanned again (default: ./out/page_cache.sqlite; disabled by --no-cache)")
+    parser.addoption("--page-cache-mb", action="store", type=float, default=512, help="Maximum size (MB) of the PDF page cache; the least recently used pages are evicted (default: 512)")
+    parser.addoption("--rules-cache-dir", action="store", default="./out/rules_cache", help="Directory of the compiled keyword rules, shared by the processes of the user; private to the user, not to be shared between users/machines (default: ./out/rules_cache)")
+    parser.addoption("--html_parser", action="store", default="bs4", choices=HTML_PARSERS, help="HTML parser backend: bs4 (BeautifulSoup) or stream (no DOM) (default: bs4)")
+    parser.addoption("--mode", action="store", default="report", choices=SCAN_MODES, help="report: find every keyword match (full detail); gate: stop each file at the first match (CI gating) (default: report)")
+    parser.addoption("--include", action="append", default=[], help="Glob pattern of the files to search in (repeatable; default: all, except the hidden files and folders)")
+    parser.addoption("--exclude", action="append", default=[], help="Glob pattern of the files/folders to skip (repeatable)")
+    parser.addoption("--manifest", action="store", default="./out/file_manifest.json", help="Manifest of the files scanned clean, with their mtime/size (default: ./out/file_manifest.json)")
+    parser.addoption("--changed-only", action="store_true", default=False, help="Only search the files that are new or changed since they were last scanned clean (see --manifest)")
+    parser.addoption("--no-metrics", action="store_true", default=False, help="Do not time the scan stages of each file (open, parse/extraction, segmentation, matching)")
+    parser.addoption("--profile", action="store", default=None, choices=PROFILE_MODES, help="Also capture a cProfile or tracemalloc profile of each file scan (in the HTML report)")
+    parser.addoption("--prefetch", action="store", type=int, default=0, help="Number of files read ahead of the test being run, while it parses its file (default: 0, no prefetch)")
+    parser.addoption("--prefetch-mb", action="store", type=float, default=256, help="Maximum size (MB) of the files read ahead (default: 256)")
+    parser.addoption("--extractor-plugin", action="append", default=[], help="Module registering more document types (see src/core/extractors.py); repeatable")
+    parser.addoption("--shard-index", action="store", type=int, default=0, help="The shard of the files to search in this run, from 0 to --shard-count - 1 (e.g. the CI node index)")
+    parser.addoption("--shard-count", action="store", type=int, default=1, help="Split the files into this many shards (e.g. CI nodes); each shard writes a partial report, merged by 'python -m src merge' (default: 1, no sharding)")
+    parser.addoption("--shard-by", action="store", default="size", choices=SHARD_BY, help="Balance the shards by file size or by the scan time of the previous runs (--shard-timings) (default: size)")
+    parser.addoption("--shard-timings", action="store", default="./out/scan_timings.json", help="Scan time of each file in the previous runs; written by the unsharded runs and by the merge (default: ./out/scan_timings.json)")
+    parser.addoption("--report_dir", action="store", default="./out", help="Directory of the consolidated keyword search report (default: ./out)")
+
+
+# Run level keyword search report; collected by the tests, written at the end of the session
+scan_report_key = pytest.StashKey[ScanReport]()
+
+# The stage timings/counters of all the files scanned in the session
+scan_metrics_key = pytest.StashKey[ScanMetrics]()
+
+# The files to search in; the target directory is only walked once per session
+file_discovery_key = pytest.StashKey[FileDiscovery]()
+file_manifest_key = pytest.StashKey[FileManifest]()
+
+# Reads the files ahead of the tests, in the order of the tests ('--prefetch'); imported only when enabled
+file_prefetcher_key = pytest.StashKey["FilePrefetcher"]()
+
+# The PDF page cache of the session ('--page-cache'), with its hit/miss stats
+page_cache_key = pytest.StashKey[PageCache]()
+
+# The scan time of each file in the previous runs; balances the shards ('--shard-by timings')
+scan_timings_key = pytest.StashKey[ScanTimings]()
+
+# The keyword matcher of the session; compiled only when the keyword search runs (see `get_matcher`)
+matcher_key = pytest.StashKey[KeywordMatcher]()
+
+
+def pytest_configure(config):
+    """Create the run level keyword search report and the file discovery."""
+    # The document types of the plugins are registered before the files are listed
+    load_plugins(config.getoption("--extractor-plugin"))
+    # The report gets the matcher when the keyword search runs (see `get_matcher`)
+    config.stash[scan_report_key] = ScanReport()
+    config.stash[scan_metrics_key] = ScanMetrics()
+
+    config.stash[file_discovery_key] = FileDiscovery(config.getoption("--target_dir"),
+                                                     EXTRACTORS.expand_extensions(config.getoption("--file_ext")),
+                                                     include=config.getoption("--include"),
+                                                     exclude=config.getoption("--exclude"))
+
+    shard_index, shard_count = config.getoption("--shard-index"), config.getoption("--shard-count")
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"Invalid shard: --shard-index {shard_index} must be from 0 to --shard-count - 1 ({shard_count - 1})")
+    config.stash[scan_timings_key] = ScanTimings(config.getoption("--shard-timings"))
+
+
+def get_matcher(config):
+    """
+    Return the keyword matcher of the session; the rules are compiled once (or loaded from
+    '--rules-cache-dir'), on first use: only when the keyword search is collected (or '--workers' scans),
+    so that a unit test run does not compile the rules nor write the artifact.
+    """
+    matcher = config.stash.get(matcher_key, None)
+    if matcher is None:
+        matcher = FindKeyword(src_file=None, keywords_file=config.getoption("--keyword_file"),
+                              rules_cache_dir=config.getoption("--rules-cache-dir")).matcher
+        config.stash[matcher_key] = matcher
+        config.stash[scan_report_key].matcher = matcher
+    return matcher
+
+
+def get_manifest(config) -> FileManifest:
+    """Return the file manifest; loaded on first use (its fingerprint needs the keyword matcher)."""
+    manifest = config.stash.get(file_manifest_key, None)
+    if manifest is None:
+        # The manifest is only valid for the same keywords and extractor settings
+        fingerprint = f"{ScanCache.keywords_hash(get_matcher(config).keywords)}:{FindKeyword.EXTRACTOR_VERSION}:" \
+                      f"{config.getoption('--html_parser')}"
+        manifest = FileManifest(config.getoption("--manifest"), fingerprint=fingerprint)
+        config.stash[file_manifest_key] = manifest
+    return manifest
+
+
+def is_sharded(config) -> bool:
+    """Check if the files are split into shards ('--shard-count' > 1)."""
+    return config.getoption("--shard-count") > 1
+
+
+def get_files(config) -> list:
+    """
+    Return the files to search in (only the new/changed ones when '--changed-only' is given);
+    only the files of this shard when '--shard-count' is given (the same split on every node).
+    """
+    discovery = config.stash[file_discovery_key]
+    if config.getoption("--changed-only"):
+        files = get_manifest(config).changed(discovery.stats())
+    else:
+        files = discovery.files()
+
+    if not is_sharded(config):
+        return files
+    weights = file_weights(discovery.stats(), shard_by=config.getoption("--shard-by"),
+                           timings=config.stash[scan_timings_key].files)
+    return shard_files(files, config.getoption("--shard-index"), config.getoption("--shard-count"), weights=weights)
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Start the file prefetch ('--prefetch') in the order the (selected) tests will scan the files."""
+    depth = config.getoption("--prefetch")
+    if depth <= 0 or config.getoption("--workers") > 0:
+        return
+
+    from src.core.prefetch import FilePrefetcher
+
+    files = []
+    for item in items:
+        src_file = getattr(item, "callspec", None) and item.callspec.params.get("file_list")
+        if src_file and src_file not in files:
+            files.append(src_file)
+    config.stash[file_prefetcher_key] = FilePrefetcher(files, depth=depth,
+                                                       max_buffer_bytes=int(config.getoption("--prefetch-mb") * 1024 * 1024))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the consolidated keyword search report and update the file manifest (only if files were scanned)."""
+    prefetcher = session.config.stash.get(file_prefetcher_key, None)
+    if prefetcher is not None:
+        prefetcher.close()
+    page_cache = session.config.stash.get(page_cache_key, None)
+    if page_cache is not None:
+        page_cache.close()
+
+    scan_report = session.config.stash.get(scan_report_key, None)
+    if scan_report is not None and is_sharded(session.config):
+        write_partial_report(session.config, scan_report)
+        return
+    if scan_report is None or not scan_report.files:
+        return
+
+    issues_path, summary_path = scan_report.write(report_dir=session.config.getoption("--report_dir"))
+    print(f"\nKeyword search report written to {issues_path} (summary: {summary_path})")
+
+    # The scan time of the files balances the next sharded runs ('--shard-by timings')
+    timings = session.config.stash[scan_timings_key]
+    timings.update(scan_report)
+    timings.save()
+
+    # Only the files scanned clean are skipped by '--changed-only'; the others are searched again
+    manifest = get_manifest(session.config)
+    stats = session.config.stash[file_discovery_key].stats()
+    for src_file, result in scan_report.files.items():
+        if result["issue_counter"] == 0 and src_file in stats:
+            manifest.update(src_file, stats[src_file])
+        else:
+            manifest.remove(src_file)
+    manifest.save()
+
+
+def write_partial_report(config, scan_report: ScanReport):
+    """
+    Save the partial report of this shard (even with no file), to be merged with the other shards by
+    'python -m src merge'. The shared file manifest and timings are not written by the shards.
+    """
+    shard_index, shard_count = config.getoption("--shard-index"), config.getoption("--shard-count")
+    scan_report.meta = {
+        "shard": {"index": shard_index, "count": shard_count, "by": config.getoption("--shard-by")},
+        "keywords": ScanCache.keywords_hash(get_matcher(config).keywords),
+    }
+    partial_file = os.path.join(config.getoption("--report_dir"), partial_report_name(shard_index, shard_count))
+    scan_report.save(partial_file)
+    print(f"\nPartial keyword search report of shard {shard_index} (of {shard_count}) written to {partial_file}")
+
+
+@pytest.fixture(scope="session")
+def scan_report(request):
+    """Fixture to provide the run level keyword search report; add each file result to it."""
+    return request.config.stash[scan_report_key]
+
+
+@pytest.fixture
+def scan_metrics(request):
+    """
+    Fixture to provide the stage timers/counters of a file scan (disabled with '--no-metrics').
+    They are added to the JUnit XML properties and the HTML report of the test, and to the run totals.
+    """
+    if request.config.getoption("--no-metrics"):
+        yield NULL_METRICS
+        return
+
+    metrics = ScanMetrics(profile=request.config.getoption("--profile"))
+    yield metrics
+
+    # JUnit XML properties of the test case (e.g. scan_extraction_s, scan_pages)
+    request.node.user_properties.extend(metrics.properties())
+    request.config.stash[scan_metrics_key].merge(metrics)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Add the scan metrics (and profile) of the test to its HTML report."""
+    outcome = yield
+    metrics = getattr(item, "funcargs", {}).get("scan_metrics")
+    if call.when != "call" or metrics is None or not metrics.enabled or not metrics.timings:
+        return
+
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return
+
+    report = outcome.get_result()
+    report.extras = getattr(report, "extras", []) + [extras.text(metrics.format(), name="Scan metrics")]
+    if metrics.profile_report:
+        report.extras.append(extras.text(metrics.profile_report, name=f"Profile ({metrics.profile})"))
 
 
 @pytest.fixture(scope="session")
@@ -21,6 +255,18 @@ def file_ext(request):
     return request.config.getoption("--file_ext")
 
 
+@pytest.fixture(scope="session")
+def scan_mode(request):
+    """Fixture to provide the scan mode (report or gate) for tests."""
+    return request.config.getoption("--mode")
+
+
+@pytest.fixture(scope="session")
+def html_parser(request):
+    """Fixture to provide the HTML parser backend for tests."""
+    return request.config.getoption("--html_parser")
+
+
 @pytest.fixture
 def target_dir(request):
     """Fixture to provide the list of files from the target directory with given extensions for tests."""
@@ -30,9 +276,60 @@ def target_dir(request):
 @pytest.fixture
 def file_list(request):
     """Fixture to provide the list of files from the target directory with given extensions for tests."""
-    given_dir = request.config.getoption("--target_dir")
+    return get_files(request.config)
+
+
+@pytest.fixture
+def src_data(request, file_list):
+    """Fixture to provide the prefetched content of the file ('--prefetch'); None to read the file in the test."""
+    prefetcher = request.config.stash.get(file_prefetcher_key, None)
+    return prefetcher.get(file_list) if prefetcher is not None else None
+
+
+def get_cache_dir(config):
+    """Return the scan result cache directory; None when '--no-cache' is given."""
+    return None if config.getoption("--no-cache") else config.getoption("--cache-dir")
+
+
+@pytest.fixture(scope="session")
+def scan_cache(request):
+    """Fixture to provide the scan result cache (None when '--no-cache' is given)."""
+    cache_dir = get_cache_dir(request.config)
+    return ScanCache(cache_dir=cache_dir) if cache_dir else None
+
+
+def get_page_cache_file(config):
+    """Return the PDF page cache file; None when '--no-cache' is given."""
+    return None if config.getoption("--no-cache") else config.getoption("--page-cache")
+
+
+@pytest.fixture(scope="session")
+def page_cache(request):
+    """Fixture to provide the PDF page cache (None when '--no-cache' is given); its stats are in the reports."""
+    cache_file = get_page_cache_file(request.config)
+    if not cache_file:
+        return None
+    request.config.stash[page_cache_key] = PageCache(cache_file=cache_file,
+                                                     max_size_mb=request.config.getoption("--page-cache-mb"))
+    return request.config.stash[page_cache_key]
+
+
+@pytest.fixture(scope="session")
+def scan_results(request):
+    """Fixture to provide the pre-scanned results {file: ((issue_counter, file_data), elapsed)} when '--workers' is given."""
+    workers = request.config.getoption("--workers")
+    if workers <= 0:
+        return {}
+
     given_extension = request.config.getoption("--file_ext")
-    return Utilities().get_all_files_in_folder(folder_path=given_dir, file_ext=given_extension, resursive=True)
+    keyword_file = request.config.getoption("--keyword_file")
+    files = get_files(request.config)
+    scans = scan_files(files, keywords_file=keyword_file, file_ext=given_extension, workers=workers,
+                       cache_dir=get_cache_dir(request.config), html_parser=request.config.getoption("--html_parser"),
+                       rules_cache_dir=request.config.getoption("--rules-cache-dir"),
+                       mode=request.config.getoption("--mode"), page_cache_file=get_page_cache_file(request.config),
+                       plugins=request.config.getoption("--extractor-plugin"))
+    return {path: (result, elapsed) for path, result, elapsed in scans}
 
 
 def pytest_generate_tests(metafunc):
@@ -46,9 +343,10 @@ def pytest_generate_tests(metafunc):
     #     metafunc.parametrize("file_ext", ["html"], ids=["HTML"])
     
     if "file_list" in metafunc.fixturenames:
-        given_dir = metafunc.config.getoption("target_dir")
-        given_extension = metafunc.config.getoption("file_ext")
-        files = Utilities().get_all_files_in_folder(folder_path=given_dir, file_ext=given_extension, resursive=True)
+        files = get_files(metafunc.config)
+        # The keyword search is collected; its rules are compiled once, for all the files
+        if files:
+            get_matcher(metafunc.config)
         print(f"\nPrepared file list is: {files}\n")
         metafunc.parametrize("file_list", files)
     # ------------------------------------------------------------------
@@ -59,4 +357,32 @@ def pytest_generate_tests(metafunc):
 # =================================================================
 def pytest_html_report_title(report):
     # Fetching the report title from the 'configs.py' for pytest-html report
-    report.title = PYTEST_REPORT_TITLE
\ No newline at end of file
+    report.title = PYTEST_REPORT_TITLE
+
+
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Add the run totals of the scan stages and the slowest documents to the HTML report summary."""
+    import html
+
+    scan_report = session.config.stash.get(scan_report_key, None)
+    if scan_report is None or not scan_report.files:
+        return
+
+    metrics = session.config.stash[scan_metrics_key]
+    if metrics.timings:
+        prefix.append(f"<p><b>Scan stages (all files):</b></p><pre>{html.escape(metrics.format())}</pre>")
+
+    slowest = sorted(scan_report.files.items(), key=lambda item: item[1]["elapsed"], reverse=True)[:SLOWEST_FILES_IN_REPORT]
+    rows = "".join(f"<li>{result['elapsed']:.3f} s: {html.escape(src_file)}</li>" for src_file, result in slowest)
+    prefix.append(f"<p><b>Slowest documents:</b></p><ul>{rows}</ul>")
+
+    page_cache = session.config.stash.get(page_cache_key, None)
+    if page_cache is not None and page_cache.hits + page_cache.misses:
+        prefix.append(f"<p><b>{html.escape(page_cache.format_stats())}</b></p>")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the hit/miss rate of the PDF page cache (if any page was looked up)."""
+    page_cache = config.stash.get(page_cache_key, None)
+    if page_cache is not None and page_cache.hits + page_cache.misses:
+        terminalreporter.write_line(page_cache.format_stats())
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: `python -m src` runs the command line (see `src/cli.py`).
+"""
+
+
+import sys
+
+from src.cli import main
+
+
+sys.exit(main())
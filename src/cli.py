@@ -0,0 +1,198 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Command line entry point;
+    Runs the same keyword search engine as the pytest suite (`FindKeyword`, through `scan_files`)
+    without pytest, e.g. from a pre-commit hook, a CI step or an editor integration.
+@note: The exit code tells the result, so that a hook can gate on it:
+        0  no keyword found
+        1  keywords found (in at least one file)
+        2  error: a file could not be scanned, the keyword file is missing or the arguments are invalid
+    An error takes precedence over the keywords found. Only the modules needed by the scanned file types
+    are imported (e.g. a TXT only run does not load BeautifulSoup or PyMuPDF), see `benchmarks/bench_startup.py`.
+    The files are scanned by their document type (see `src/core/extractors.py`), so a directory of mixed
+    document types is scanned in one run; more types are added with `--plugin`.
+    `merge` combines the partial reports of a sharded pytest run ('--shard-count') into the consolidated
+    report; its exit code is the same as for a scan of all the files (2 also when a shard is missing).
+Example:
+    python -m src scan ./docs --file_ext html,pdf --keyword_file ./rules/keywords.txt
+    python -m src scan README.txt notes.md --mode gate --quiet
+    python -m src merge ./out/shards --report_dir ./out
+"""
+
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from src.core.extractors import EXTRACTORS, load_plugins
+
+
+# Exit codes
+EXIT_CLEAN = 0
+EXIT_FOUND = 1
+EXIT_ERROR = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """The command line parser (one sub command per action)."""
+    parser = argparse.ArgumentParser(prog="python -m src", description="Search documents for keywords.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser("scan", help="Scan files/directories for the keywords; exit code 0 (clean), "
+                                            "1 (keywords found) or 2 (error)")
+    scan.add_argument("paths", nargs="+", help="Files and/or directories to scan")
+    scan.add_argument("--keyword_file", default="./rules/keywords.txt", help="The keyword file (default: ./rules/keywords.txt)")
+    scan.add_argument("--file_ext", default="auto", help="File extension(s) to search for in the directories, comma separated (default: auto, every registered document type)")
+    scan.add_argument("--include", action="append", default=[], help="Glob pattern of the files to search in the directories (repeatable; default: all, except the hidden files and folders)")
+    scan.add_argument("--exclude", action="append", default=[], help="Glob pattern of the files/folders to skip in the directories (repeatable)")
+    scan.add_argument("--mode", default="report", choices=("report", "gate"), help="report: every keyword match; gate: stop each file at the first match (default: report)")
+    scan.add_argument("--html_parser", default="bs4", choices=("bs4", "stream"), help="HTML parser backend (default: bs4)")
+    scan.add_argument("--workers", type=int, default=1, help="Number of worker processes (default: 1, scan in this process)")
+    scan.add_argument("--cache-dir", default=None, help="Directory of the scan result cache (default: none, scan every file)")
+    scan.add_argument("--page-cache", default=None, help="Cache file of the PDF page matches (default: none)")
+    scan.add_argument("--rules-cache-dir", default="./out/rules_cache", help="Directory of the compiled keyword rules (default: ./out/rules_cache)")
+    scan.add_argument("--report_dir", default=None, help="Also write the consolidated report (CSV + summary JSON) to this directory")
+    scan.add_argument("--format", default="text", choices=("text", "json"), help="Output format of the hits (default: text)")
+    scan.add_argument("--quiet", action="store_true", default=False, help="Do not print the hits; only the exit code tells the result")
+    scan.add_argument("--plugin", action="append", default=[], help="Module registering more document types (see src/core/extractors.py); repeatable")
+    scan.add_argument("--verbose", action="store_true", default=False, help="Print the scan errors in detail")
+
+    merge = commands.add_parser("merge", help="Merge the partial reports of the shards of a run into the consolidated "
+                                              "report; exit code 0 (clean), 1 (keywords found) or 2 (error/missing shard)")
+    merge.add_argument("partials", nargs="+", help="Partial report files, or directories of partial reports (find_keyword_partial_*.json)")
+    merge.add_argument("--report_dir", default="./out", help="Directory of the consolidated report (default: ./out)")
+    merge.add_argument("--timings", default="./out/scan_timings.json", help="Record the scan time of the files, to balance the next sharded runs ('--shard-by timings'); empty to skip (default: ./out/scan_timings.json)")
+    merge.add_argument("--quiet", action="store_true", default=False, help="Do not print the summary")
+    return parser
+
+
+def collect_files(paths: list, file_ext: str, include: list = None, exclude: list = None) -> tuple:
+    """
+    List the files to scan: the given files as they are (of any supported type, see `ExtractorRegistry.file_type`),
+    the files of the given directories by extension.
+    Returns `(files, errors)`; the errors are the paths which do not exist or can not be scanned.
+    """
+    from src.utilities.file_discovery import FileDiscovery
+
+    files, errors = [], []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(FileDiscovery(path, EXTRACTORS.expand_extensions(file_ext), include=include,
+                                       exclude=exclude).files())
+        elif not os.path.isfile(path):
+            errors.append((path, "No such file or directory"))
+        elif EXTRACTORS.file_type(path) is None:
+            errors.append((path, f"Unsupported file type; supported: {', '.join(EXTRACTORS.extensions())}"))
+        else:
+            files.append(path)
+
+    # A file given twice (or found in two given directories) is scanned once
+    return list(dict.fromkeys(files)), errors
+
+
+def format_hit(hit) -> str:
+    """One line per hit, like the compilers/linters: `file:[page:]line: keyword: sentence`."""
+    location = f"{hit['page']}:{hit['line']}" if hit.get("page") is not None else f"{hit['line']}"
+    sentence = " ".join(str(hit.get("sentence", "")).split())
+    return f"{hit['file']}:{location}: {hit.get('keyword')}: {sentence}"
+
+
+def run_scan(args) -> int:
+    """Scan the files and print the hits; returns the exit code."""
+    from src.core.batch_scan import scan_files
+    from src.utilities.scan_report import ScanReport
+
+    if not os.path.isfile(args.keyword_file):
+        # FindKeyword would scan with no keyword at all; a gate must not pass silently
+        print(f"Keyword file '{args.keyword_file}' not found.", file=sys.stderr)
+        return EXIT_ERROR
+
+    load_plugins(args.plugin)
+    files, errors = collect_files(args.paths, args.file_ext, include=args.include, exclude=args.exclude)
+    for path, error in errors:
+        print(f"{path}: error: {error}", file=sys.stderr)
+
+    report = ScanReport()
+    # Each file is scanned by its own document type
+    for path, result, elapsed in scan_files(files, args.keyword_file, file_ext="auto", plugins=args.plugin,
+                                            workers=args.workers, verbose=args.verbose, cache_dir=args.cache_dir,
+                                            html_parser=args.html_parser, rules_cache_dir=args.rules_cache_dir,
+                                            mode=args.mode, page_cache_file=args.page_cache):
+        issue_counter, file_data = result if isinstance(result, tuple) else (-1, [])
+        report.add(path, issue_counter, file_data, elapsed=elapsed)
+        if issue_counter < 0:
+            errors.append((path, "Could not be scanned"))
+            print(f"{path}: error: Could not be scanned", file=sys.stderr)
+        elif args.format == "text" and not args.quiet:
+            for hit in file_data:
+                print(format_hit(hit))
+
+    summary = report.summary()
+    if args.format == "json" and not args.quiet:
+        hits = [dict(hit) for src_file in sorted(report.files) for hit in report.files[src_file]["hits"]]
+        output = {key: value for key, value in summary.items() if key != "per_file"}
+        output.update(errors=[{"file": path, "error": error} for path, error in errors], hits=hits)
+        print(json.dumps(output, indent=2))
+    if args.report_dir:
+        report.write(args.report_dir)
+
+    if errors:
+        return EXIT_ERROR
+    return EXIT_FOUND if summary["issues"] > 0 else EXIT_CLEAN
+
+
+def run_merge(args) -> int:
+    """Merge the partial reports and write the consolidated report; returns the exit code."""
+    from src.utilities.sharding import PARTIAL_REPORT_PATTERN, ScanTimings, merge_partial_reports
+
+    partial_files = []
+    for path in args.partials:
+        if os.path.isdir(path):
+            partial_files.extend(sorted(glob.glob(os.path.join(path, PARTIAL_REPORT_PATTERN))))
+        else:
+            partial_files.append(path)
+    if not partial_files:
+        print(f"No partial report found in {', '.join(args.partials)}", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        report, problems = merge_partial_reports(partial_files)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Unable to read the partial reports: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    for problem in problems:
+        print(f"error: {problem}", file=sys.stderr)
+
+    issues_path, summary_path = report.write(args.report_dir)
+    if args.timings:
+        timings = ScanTimings(args.timings)
+        timings.update(report)
+        timings.save()
+
+    summary = report.summary()
+    if not args.quiet:
+        print(f"Merged {len(partial_files)} partial report(s): {summary['files']} files, {summary['issues']} issues "
+              f"in {summary['files_with_issues']} files, {summary['files_with_errors']} errors")
+        print(f"Keyword search report written to {issues_path} (summary: {summary_path})")
+
+    if problems or summary["files_with_errors"]:
+        return EXIT_ERROR
+    return EXIT_FOUND if summary["issues"] > 0 else EXIT_CLEAN
+
+
+def main(argv: list = None) -> int:
+    """Run the command line; returns the exit code (see the module notes)."""
+    args = build_parser().parse_args(argv)
+    if args.command == "scan":
+        return run_scan(args)
+    if args.command == "merge":
+        return run_merge(args)
+    return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,4 @@
-PYTEST_REPORT_TITLE = "PytestAutomation4Doc"
\ No newline at end of file
+PYTEST_REPORT_TITLE = "PytestAutomation4Doc"
+
+# Number of the slowest documents listed in the pytest-html report summary
+SLOWEST_FILES_IN_REPORT = 10
@@ -0,0 +1,135 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Batch scan;
+    Scans many documents for keywords across a pool of worker processes.
+@note: Each worker loads the keywords and builds the matcher only once (at worker start),
+    and the results are streamed back in the same order as the given files.
+    When a cache directory is given, the workers share the on-disk result cache (see `ScanCache`),
+    and with a page cache file, the cache of the PDF page matches (see `PageCache`).
+    A serial scan can read the next files ahead while the current one is parsed (see `prefetch_files`).
+    The process pool and the prefetch pipeline (asyncio) are imported only when used, to keep the
+    startup of the short serial scans (e.g. the CLI in a pre-commit hook) fast.
+"""
+
+
+import time
+from src.core.extractors import load_plugins
+from src.core.find_keyword import FindKeyword
+from src.core.page_cache import PageCache
+from src.core.rules import compile_rules
+from src.core.scan_cache import ScanCache, cached_find
+from src.utilities.file_discovery import file_ext_for
+
+
+# Worker process state; set once by `_init_worker`
+_worker = {}
+
+
+def _init_worker(keywords_file: str, file_ext: str, matcher_engine: str, verbose: bool, cache_dir: str = None,
+                 html_parser: str = "bs4", rules_cache_dir: str = None, mode: str = "report",
+                 page_cache_file: str = None, plugins: list = None):
+    """
+    Load the keywords and build the matcher once per worker process (or load the compiled rules);
+    and register the document types of the extractor plugins (not inherited by the spawned workers).
+    """
+    load_plugins(plugins)
+    finder = FindKeyword(src_file=None, keywords_file=keywords_file, file_ext=file_ext, verbose=verbose,
+                         matcher_engine=matcher_engine, html_parser=html_parser, rules_cache_dir=rules_cache_dir,
+                         mode=mode)
+    finder.page_cache = PageCache(cache_file=page_cache_file, verbose=verbose) if page_cache_file else None
+    cache = ScanCache(cache_dir=cache_dir, verbose=verbose) if cache_dir else None
+    _worker.update(finder=finder, cache=cache)
+
+
+def _scan_file(src_file: str, src_data: bytes = None) -> tuple:
+    """
+    Scan a single file with the worker's matcher (from its prefetched content, if given);
+    returns `((issue_counter, file_data), elapsed seconds)`.
+    """
+    finder = _worker["finder"]
+    start = time.perf_counter()
+    try:
+        find_keyword = finder.for_file(src_file, src_data=src_data, file_ext=file_ext_for(src_file, finder.file_ext))
+        result = cached_find(find_keyword, _worker["cache"])
+        if not isinstance(result, tuple):
+            # Not a supported document type
+            result = -1, []
+
+    except Exception as e:
+        # Same convention as FindKeyword: -1 means the file could not be scanned
+        if finder.verbose:
+            print(f"Error scanning file {src_file}: {e}")
+        result = -1, []
+
+    return result, time.perf_counter() - start
+
+
+def scan_files(paths: list, keywords_file: str, file_ext: str = "html", workers: int = 1,
+               matcher_engine: str = "regex", verbose: bool = False, chunksize: int = 1, cache_dir: str = None,
+               html_parser: str = "bs4", rules_cache_dir: str = None, mode: str = "report",
+               prefetch: int = 0, prefetch_bytes: int = None, page_cache_file: str = None, plugins: list = None):
+    """
+    Scan the given files for keywords, in parallel when `workers` > 1.
+
+    Args:
+        paths (list): The files to scan.
+        keywords_file (str): The keyword file (one keyword per line).
+        file_ext (str): The file extension/type of the files (html, pdf, txt, or a registered type, see
+            `src/core/extractors.py`); when several are given (e.g. "html,pdf"), each file is scanned by its
+            own extension; "auto" finds the type of each file (extension, MIME type or content).
+        workers (int): The number of worker processes; 0/1 scans in the current process.
+        matcher_engine (str): The keyword matcher engine (see `src/core/matcher.py`).
+        verbose (bool): Print the errors/progress.
+        chunksize (int): The number of files sent to a worker at once.
+        cache_dir (str): The scan result cache directory; None to always scan.
+        html_parser (str): The HTML parser backend; "bs4" (BeautifulSoup) or "stream" (see `HTMLTextExtractor`).
+        rules_cache_dir (str): The directory of the compiled keyword rules; the rules are compiled once and
+            loaded by the workers (see `src/core/rules.py`); None to compile them in each worker.
+        mode (str): "report" (every match) or "gate" (stop each file at its first match).
+        prefetch (int): The number of files read ahead of the serial scan; 0 to read each file when it is scanned.
+        prefetch_bytes (int): The maximum bytes of the files read ahead (see `prefetch_files`); None for
+            the default budget (`DEFAULT_MAX_BUFFER_BYTES`).
+        page_cache_file (str): The PDF page cache database, shared by the workers; None to match every page.
+        plugins (list): The extractor plugin modules, imported by each worker (see `load_plugins`).
+    Yields:
+        tuple: `(path, (issue_counter, file_data), elapsed seconds)` for each file, in the given order.
+    Example:
+        >>> for path, (issue_counter, data), _ in scan_files(files, "./rules/keywords.txt", "pdf", workers=4):
+        >>>     print(path, issue_counter)
+    """
+    paths = list(paths)
+    initargs = (keywords_file, file_ext, matcher_engine, verbose, cache_dir, html_parser, rules_cache_dir, mode,
+                page_cache_file, plugins)
+
+    # Compile the rules before starting the workers, so that they all load the same artifact
+    if rules_cache_dir and workers > 1 and len(paths) > 1:
+        try:
+            compile_rules(keywords_file, engine=matcher_engine, artifact_dir=rules_cache_dir, verbose=verbose)
+        except FileNotFoundError:
+            # Reported by each worker (FindKeyword)
+            pass
+
+    # Serial scan; still builds the matcher only once
+    if workers <= 1 or len(paths) <= 1:
+        _init_worker(*initargs)
+        if prefetch > 0:
+            from src.core.prefetch import DEFAULT_MAX_BUFFER_BYTES, prefetch_files
+
+            if prefetch_bytes is None:
+                prefetch_bytes = DEFAULT_MAX_BUFFER_BYTES
+            # The file content is read ahead; a file which could not be read is read (and reported) by the scan
+            for path, data, _ in prefetch_files(paths, depth=prefetch, max_buffer_bytes=prefetch_bytes):
+                yield (path, *_scan_file(path, data))
+        else:
+            for path in paths:
+                yield (path, *_scan_file(path))
+        return
+
+    # Parallel scan; `map` gives the results back in the order of the given files
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        for path, (result, elapsed) in zip(paths, executor.map(_scan_file, paths, chunksize=chunksize)):
+            yield path, result, elapsed
@@ -0,0 +1,425 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Document extractors and their registry;
+    Maps a document to its type (by extension, by the MIME type of its name, or by sniffing its first bytes)
+    and gives the text extractor of that type, so that new formats (DOCX, Markdown, XML, ...) are scanned
+    by `FindKeyword` without changing it.
+@note: The HTML, PDF and TXT types are registered here too, but scanned by the dedicated `FindKeyword`
+    paths (BeautifulSoup/stream parser, PDF page cache, memory-mapped text scanner). Any other type is
+    scanned from the text blocks of its extractor (`iter_text`), split into sentences like the HTML text
+    (a sentence ends with '.' or '?'); the hit "line" is the sentence number.
+    An extractor class is instantiated per document (it may keep state, e.g. the title); the parser
+    modules are imported by `iter_text`, so registering a type costs nothing at startup.
+    A plugin module registers its types when imported (`load_plugins`), e.g.
+        @register_extractor
+        class RtfExtractor(DocumentExtractor):
+            name = "rtf"
+            extensions = ("rtf",)
+            def iter_text(self, src_file, data=None): ...
+"""
+
+
+import codecs
+import importlib
+import io
+import os
+import re
+
+
+# The bytes read from a document to sniff its type
+SNIFF_BYTES = 4096
+
+
+class DocumentExtractor:
+    """
+    Base class of the document extractors; a subclass describes a document type and extracts its text.
+
+    Attributes:
+        name (str): The document type name (e.g. "docx"); the `FindKeyword` file_ext of the type.
+        extensions (tuple): The file extensions of the type, lowercase without the dot.
+        mime_types (tuple): The MIME types of the type (as guessed from a file name by `mimetypes`).
+        version (int): Bump it when the extracted text changes; invalidates the cached scan results.
+        builtin (bool): Scanned by a dedicated `FindKeyword` path (HTML, PDF, TXT).
+        title (str): The document title, once known while extracting (optional; part of the hits).
+    """
+    name = None
+    extensions = ()
+    mime_types = ()
+    version = 1
+    builtin = False
+
+    def __init__(self):
+        self.title = None
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        """Check if the first bytes of a document (see `SNIFF_BYTES`) are of this type."""
+        return False
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        """Yield the text of the document, block by block (e.g. page, paragraph, parsed chunk)."""
+        raise NotImplementedError(f"{type(self).__name__} does not extract text")
+
+    @staticmethod
+    def open_binary(src_file: str, data: bytes = None):
+        """Open the document bytes; the given data (e.g. prefetched) or the file."""
+        return io.BytesIO(data) if data is not None else open(src_file, 'rb')
+
+
+class ExtractorRegistry:
+    """
+    The document types, by name, extension and MIME type.
+
+    Example:
+        >>> registry = ExtractorRegistry()
+        >>> registry.register(MarkdownExtractor)
+        >>> registry.file_type("notes.markdown")
+        'md'
+        >>> extractor = registry.create("md")
+    """
+
+    def __init__(self):
+        self.__types = {}         # name -> extractor class, in registration order
+        self.__extensions = {}    # extension -> name
+        self.__mime_types = {}    # MIME type -> name
+
+    def register(self, extractor_class: type) -> type:
+        """Register (or replace) a document type; returns the class, so it can be used as a decorator."""
+        if not extractor_class.name:
+            raise ValueError(f"{extractor_class.__name__} has no document type name")
+        self.unregister(extractor_class.name)
+        self.__types[extractor_class.name] = extractor_class
+        for extension in extractor_class.extensions:
+            self.__extensions[extension.lstrip(".").lower()] = extractor_class.name
+        for mime_type in extractor_class.mime_types:
+            self.__mime_types[mime_type] = extractor_class.name
+        return extractor_class
+
+    def unregister(self, name: str):
+        """Remove a document type (and its extensions/MIME types)."""
+        self.__types.pop(name, None)
+        self.__extensions = {key: value for key, value in self.__extensions.items() if value != name}
+        self.__mime_types = {key: value for key, value in self.__mime_types.items() if value != name}
+
+    def map_extension(self, extension: str, name: str):
+        """Scan the files of another extension as a registered type, e.g. `map_extension("log", "txt")`."""
+        if name not in self.__types:
+            raise ValueError(f"Unknown document type: {name}; registered: {', '.join(self.__types)}")
+        self.__extensions[extension.lstrip(".").lower()] = name
+
+    def get(self, name: str) -> type:
+        """The extractor class of a document type; None if not registered."""
+        return self.__types.get(name)
+
+    def create(self, name: str) -> DocumentExtractor:
+        """A new extractor for one document of the type."""
+        return self.__types[name]()
+
+    def names(self) -> list:
+        return list(self.__types)
+
+    def extensions(self) -> list:
+        return list(self.__extensions)
+
+    def expand_extensions(self, file_ext: str) -> str:
+        """The file extensions to search for; "auto" (or "all") means every registered extension."""
+        if str(file_ext).strip().lower() in ("auto", "all"):
+            return ",".join(self.__extensions)
+        return file_ext
+
+    def file_type(self, src_file: str = None, file_ext: str = None, data: bytes = None) -> str:
+        """
+        The document type of a file; None if it is not a registered type.
+        `file_ext` (an extension or a type name) is used when given (not "auto"); else the type is found by
+        the file extension, the MIME type guessed from the file name, then by sniffing the first bytes.
+        """
+        if file_ext and file_ext != "auto":
+            file_ext = file_ext.lstrip(".").lower()
+            return file_ext if file_ext in self.__types else self.__extensions.get(file_ext)
+        if not src_file:
+            return None
+
+        extension = os.path.splitext(src_file)[1].lstrip(".").lower()
+        if extension in self.__extensions:
+            return self.__extensions[extension]
+        import mimetypes
+
+        mime_type = mimetypes.guess_type(src_file)[0]
+        if mime_type in self.__mime_types:
+            return self.__mime_types[mime_type]
+        return self.sniff(src_file, data)
+
+    def sniff(self, src_file: str, data: bytes = None) -> str:
+        """
+        The document type found from the first bytes of the document; None if no type recognizes them.
+        The types are tried from the last registered one, so that a plugin type is tried before the builtin ones.
+        """
+        try:
+            if data is not None:
+                head = bytes(data[:SNIFF_BYTES])
+            else:
+                with open(src_file, 'rb') as file:
+                    head = file.read(SNIFF_BYTES)
+        except OSError:
+            return None
+
+        for name, extractor_class in reversed(list(self.__types.items())):
+            if extractor_class.sniff(head):
+                return name
+        return None
+
+
+# The registry used by `FindKeyword`, the pytest options and the command line
+EXTRACTORS = ExtractorRegistry()
+
+
+def register_extractor(extractor_class: type) -> type:
+    """Register a document type in the default registry (class decorator)."""
+    return EXTRACTORS.register(extractor_class)
+
+
+def load_plugins(modules: list) -> list:
+    """Import the plugin modules (e.g. "my_package.rtf_extractor"); they register their types when imported."""
+    return [importlib.import_module(module) for module in modules or []]
+
+
+def iter_decoded(stream, chunk_size: int = 64 * 1024, encoding: str = "utf-8-sig"):
+    """Yield the text of a binary stream, chunk by chunk (invalid bytes replaced)."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+@register_extractor
+class TextExtractor(DocumentExtractor):
+    """Plain text; scanned line by line by `FindKeyword` (see `src/core/text_scanner.py`)."""
+    name = "txt"
+    extensions = ("txt",)
+    mime_types = ("text/plain",)
+    builtin = True
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        # Any UTF-8 text without NUL bytes (the last char may be cut by the sniff size)
+        if not head or b"\x00" in head:
+            return False
+        try:
+            head.decode("utf-8")
+        except UnicodeDecodeError as e:
+            return e.start >= len(head) - 3
+        return True
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        with self.open_binary(src_file, data) as stream:
+            yield from iter_decoded(stream)
+
+
+@register_extractor
+class HtmlExtractor(DocumentExtractor):
+    """HTML; scanned by `FindKeyword` with BeautifulSoup or the streaming parser (see `HTMLTextExtractor`)."""
+    name = "html"
+    extensions = ("html", "htm")
+    mime_types = ("text/html",)
+    builtin = True
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        head = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+        return head.startswith(b"<!doctype html") or b"<html" in head
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        from src.core.html_extractor import HTMLTextExtractor
+
+        extractor = HTMLTextExtractor()
+        for text in extractor.iter_text(src_file, data=data):
+            self.title = extractor.title
+            yield text
+        self.title = extractor.title
+
+
+@register_extractor
+class PdfExtractor(DocumentExtractor):
+    """PDF; scanned by `FindKeyword` page by page with PyMuPDF (and the page cache)."""
+    name = "pdf"
+    extensions = ("pdf",)
+    mime_types = ("application/pdf",)
+    builtin = True
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        return head.startswith(b"%PDF-")
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        import fitz
+
+        with (fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(src_file)) as pdf_doc:
+            for page in pdf_doc:
+                yield page.get_text("text")
+
+
+@register_extractor
+class XmlExtractor(DocumentExtractor):
+    """
+    XML; the character data of the elements (not the tag/attribute names or the comments), in document order.
+    The text of two adjacent elements is separated by a line break, e.g. "<a>one</a><b>two</b>".
+    """
+    name = "xml"
+    extensions = ("xml",)
+    mime_types = ("application/xml", "text/xml")
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<?xml")
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        with self.open_binary(src_file, data) as stream:
+            yield from iter_xml_text(stream, separator="\n")
+
+
+def iter_xml_text(stream, separator: str = "", text_elements: set = None, breaks: dict = None,
+                  chunk_size: int = 64 * 1024):
+    """
+    Yield the character data of an XML stream, chunk by chunk as it is parsed (expat; no tree is built).
+
+    Args:
+        stream: The binary XML stream.
+        separator (str): Added at an element boundary when the text before it does not end with whitespace.
+        text_elements (set): Only the character data of these elements (expat names) is text; None for all.
+        breaks (dict): Text added at the end of these elements (expat names), e.g. a tab or a line break.
+        chunk_size (int): The bytes parsed at once.
+    """
+    from xml.parsers import expat
+
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parts = []
+    state = {"depth": 0, "last": " "}
+
+    def add(text: str):
+        if text:
+            parts.append(text)
+            state["last"] = text[-1]
+
+    def start_element(name, attrs):
+        if text_elements is not None and name in text_elements:
+            state["depth"] += 1
+        if separator and not state["last"].isspace():
+            add(separator)
+
+    def end_element(name):
+        if text_elements is not None and name in text_elements:
+            state["depth"] -= 1
+        if breaks and name in breaks:
+            add(breaks[name])
+        elif separator and not state["last"].isspace():
+            add(separator)
+
+    def character_data(text):
+        if text_elements is None or state["depth"] > 0:
+            add(text)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        parser.Parse(chunk, False)
+        if parts:
+            yield "".join(parts)
+            parts.clear()
+    parser.Parse(b"", True)
+    if parts:
+        yield "".join(parts)
+
+
+# The WordprocessingML elements (expat names, with the namespace)
+_WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_WORD_TEXT = f"{_WORD_NS} t"
+_WORD_BREAKS = {f"{_WORD_NS} p": "\n", f"{_WORD_NS} tab": "\t", f"{_WORD_NS} br": "\n", f"{_WORD_NS} cr": "\n"}
+
+
+@register_extractor
+class DocxExtractor(DocumentExtractor):
+    """
+    DOCX (Word); the text of the main document part (`word/document.xml`), paragraph by paragraph;
+    the title is the one of the document properties (`docProps/core.xml`), if any.
+    The headers, footers, footnotes and comments are not scanned.
+    """
+    name = "docx"
+    extensions = ("docx",)
+    mime_types = ("application/vnd.openxmlformats-officedocument.wordprocessingml.document",)
+
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
+        # A ZIP archive whose first entries are the Word parts
+        return head.startswith(b"PK\x03\x04") and b"word/" in head
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        import zipfile
+
+        with self.open_binary(src_file, data) as stream, zipfile.ZipFile(stream) as archive:
+            if "docProps/core.xml" in archive.namelist():
+                with archive.open("docProps/core.xml") as core:
+                    title = "".join(iter_xml_text(core, text_elements={"http://purl.org/dc/elements/1.1/ title"}))
+                self.title = title.strip() or None
+            with archive.open("word/document.xml") as document:
+                yield from iter_xml_text(document, text_elements={_WORD_TEXT}, breaks=_WORD_BREAKS)
+
+
+@register_extractor
+class MarkdownExtractor(DocumentExtractor):
+    """
+    Markdown; the text without the markup (heading/list/quote markers, emphasis, link targets, HTML tags),
+    line by line. The code spans and blocks are kept as text. The title is the first level 1 heading.
+    """
+    name = "md"
+    extensions = ("md", "markdown")
+    mime_types = ("text/markdown", "text/x-markdown")
+
+    # Inline markup; replaced in this order
+    INLINE_PATTERNS = (
+        (re.compile(r"!?\[([^\]]*)\]\([^)]*\)"), r"\1"),        # Images and links: the alt/link text
+        (re.compile(r"!?\[([^\]]*)\]\[[^\]]*\]"), r"\1"),       # Reference links
+        (re.compile(r"</?[A-Za-z][^>]*>"), ""),                 # HTML tags
+        (re.compile(r"(\*\*|__|\*|_|~~|`)(?=\S)(.+?)(?<=\S)\1"), r"\2"),  # Emphasis and code spans
+    )
+    # Block markup at the start of a line
+    BLOCK_PATTERN = re.compile(r"^\s{0,3}(?:>\s?)*(?:#{1,6}\s+|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+)?")
+    FENCE_PATTERN = re.compile(r"^\s{0,3}(```|~~~)")
+    REFERENCE_PATTERN = re.compile(r"^\s{0,3}\[[^\]]+\]:\s")
+
+    def strip_line(self, line: str) -> str:
+        """The text of a Markdown line (outside a code block)."""
+        if self.REFERENCE_PATTERN.match(line):
+            return "\n"
+        if self.title is None and line.lstrip().startswith("# "):
+            self.title = line.strip()[2:].strip("# ").strip() or None
+        line = self.BLOCK_PATTERN.sub("", line, count=1)
+        for pattern, replacement in self.INLINE_PATTERNS:
+            line = pattern.sub(replacement, line)
+        return line
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        in_code = False
+        with self.open_binary(src_file, data) as stream:
+            lines = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline=None)
+            block = []
+            for line in lines:
+                if self.FENCE_PATTERN.match(line):
+                    # The fence line itself is not text
+                    in_code = not in_code
+                    block.append("\n")
+                else:
+                    block.append(line if in_code else self.strip_line(line))
+                if len(block) >= 1000:
+                    yield "".join(block)
+                    block = []
+            if block:
+                yield "".join(block)
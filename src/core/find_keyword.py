@@ -1,41 +1,96 @@
 """
 @author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
 @created: 5 Jun 2025
-@last_modified: 06 Jun 2025
+@last_modified: 17 Oct 2026
 @desc: FindKeyword Class;
-    This class is used to find keywords in files with specific extensions (HTML, PDF, TXT).
+    This class is used to find keywords in files with specific extensions (HTML, PDF, TXT), and in the
+    document types registered in `src/core/extractors.py` (e.g. DOCX, Markdown, XML).
 @note: This class will return the count of issues found and the relevant data.
+    The keywords are compiled once into a matcher engine (see `src/core/matcher.py`) and matched
+    once over the whole text; the matches are mapped back to sentences (see `src/core/segmenter.py`).
+    The parser backends (BeautifulSoup, PyMuPDF) are imported on first use, by the file types needing
+    them; so a TXT only run (e.g. a pre-commit hook) does not pay for loading them.
+    The document type is found by the extractor registry (extension, MIME type or sniffed content); many
+    documents of mixed types are scanned with one matcher by `scan_many`.
 """
 
 
-import re
-from bs4 import BeautifulSoup
-import fitz
+from src.core.extractors import EXTRACTORS
+from src.core.hits import Hit, HitList
+from src.core.html_extractor import HTMLTextExtractor
+from src.core.matcher import KeywordMatcher, build_matcher
+from src.core.rules import compile_rules
+from src.core.page_cache import PageCache
+from src.core.scan_cache import ScanCache, cached_find
+from src.core.segmenter import SentenceBlocks, SentenceSpans, iter_sentence_matches
+from src.core.text_scanner import iter_text_matches
+from src.utilities.instrumentation import NULL_METRICS, ScanMetrics
+
+
+# Supported HTML parser backends
+HTML_PARSERS = ("bs4", "stream")
+
+# Scan modes; "report" collects every match, "gate" stops at the first one
+SCAN_MODES = ("report", "gate")
 
 
 class FindKeyword:
-    def __init__(self, src_file: str, keywords_file: str, file_ext: str = "html", verbose: bool = False):
+    # Bump this when the text extraction/sentence splitting changes; invalidates the cached results
+    EXTRACTOR_VERSION = 6
+
+    def __init__(self, src_file: str, keywords_file: str, file_ext: str = "html", verbose: bool = False,
+                 matcher_engine: str = "regex", matcher: KeywordMatcher = None, html_parser: str = "bs4",
+                 metrics: ScanMetrics = None, rules_cache_dir: str = None, mode: str = "report",
+                 src_data: bytes = None, page_cache: PageCache = None):
         self.src_file = src_file
+        # The content of the source file, if already read (e.g. prefetched); else the file is read
+        self.src_data = src_data
         self.file_ext = file_ext
+        self.html_parser = html_parser
         self.keywords_file = keywords_file
         self.keywords = []
+        self.matcher_engine = matcher_engine
+        self.matcher = matcher
+        self.rules_cache_dir = rules_cache_dir
+        self.mode = mode
         self.verbose = verbose
+        # Stage timers/counters (see `src/utilities/instrumentation.py`); disabled by default
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        # The page level cache of the PDF matches (see `src/core/page_cache.py`); None to match every page
+        self.page_cache = page_cache
         self.issues = []
         self.data = {}
+        # The document type (see `file_type`); found on first use
+        self.__file_type = None
 
-        # Load keywords from the specified file
-        self.load_keywords()
+        if self.html_parser not in HTML_PARSERS:
+            raise ValueError(f"Unsupported HTML parser: {self.html_parser}; supported: {', '.join(HTML_PARSERS)}")
+        if self.mode not in SCAN_MODES:
+            raise ValueError(f"Unsupported scan mode: {self.mode}; supported: {', '.join(SCAN_MODES)}")
+
+        # Load keywords from the specified file; unless an already built matcher is given (batch scans)
+        if self.matcher is None:
+            self.load_keywords()
+        else:
+            self.keywords = self.matcher.keywords
+            self.matcher_engine = self.matcher.name
 
         if self.verbose:
             print(f"Initialized FindKeyword with keyword file: {self.keywords}")
         
         
     def load_keywords(self):
-        """Load keywords from a file."""
+        """
+        Load the keywords (rules) from a file and build the keyword matcher.
+        The rules are compiled once per process, and loaded from `rules_cache_dir` when another process
+        already compiled them (see `src/core/rules.py`); blank lines and duplicates are skipped.
+        Raises:
+            ValueError: If a regex rule of the file is invalid.
+        """
         try:
-            # Read the keyword from the file, assuming one keyword per line
-            with open(self.keywords_file, 'r') as file:
-                self.keywords = [keyword.strip() for keyword in file.readlines()]
+            # Read and compile the keywords from the file, assuming one keyword (rule) per line
+            self.matcher = compile_rules(self.keywords_file, engine=self.matcher_engine,
+                                         artifact_dir=self.rules_cache_dir, verbose=self.verbose)
 
         except FileNotFoundError as e:
             if self.verbose:
@@ -43,55 +98,184 @@ class FindKeyword:
             else:
                 print(f"Keyword file '{self.keywords_file}' not found. Please check again.")
 
+            # No keyword to search for
+            self.matcher = build_matcher([], engine=self.matcher_engine)
+
+        self.keywords = self.matcher.keywords
+
+    @property
+    def file_type(self) -> str:
+        """
+        The document type of the source file (e.g. "html", "pdf", "docx"); None if it is not supported.
+        Given by `file_ext` (an extension or a type name); with `file_ext="auto"`, found from the file
+        extension, its MIME type or its content (see `ExtractorRegistry.file_type`).
+        """
+        if self.__file_type is None:
+            self.__file_type = EXTRACTORS.file_type(self.src_file, self.file_ext, data=self.src_data) or ""
+        return self.__file_type or None
+
+    def cache_options(self) -> dict:
+        """The options which change the scan results; part of the result cache key (see `ScanCache`)."""
+        extractor_class = EXTRACTORS.get(self.file_type)
+        return {
+            "extractor_version": self.EXTRACTOR_VERSION,
+            "file_ext": self.file_ext,
+            "file_type": f"{self.file_type}:{extractor_class.version}" if extractor_class else None,
+            "matcher_engine": self.matcher_engine,
+            "html_parser": self.html_parser,
+            "mode": self.mode,
+        }
+
     def find(self) -> any:
-        """Check if the keyword is present in the text."""
-        if self.file_ext == "html":
+        """
+        Check if the keyword is present in the text.
+        In "report" mode every match is returned; in "gate" mode the scan stops at the first match
+        (the remaining PDF pages/HTML text are not read) and only that match is returned.
+
+        Returns:
+            tuple: The count of issues found and the hits, a list of dicts (`Hit`, see `src/core/hits.py`);
+                False if the file type is not supported.
+        """
+        result = self.find_hits()
+        if not isinstance(result, tuple):
+            return result
+        issue_counter, file_data = result
+        return issue_counter, list(file_data)
+
+    def find_hits(self) -> any:
+        """
+        Same as `find`, with the hits stored compactly (`HitList`), e.g. to keep the hits of many files.
+
+        Example:
+            >>> issue_count, hits = FindKeyword(src_file='example.pdf', keywords_file='keywords.txt', file_ext='pdf').find_hits()
+            >>> hits.sentences, [hit.keyword_id for hit in hits]
+        """
+        file_type = self.file_type
+        if file_type is None:
+            if self.verbose:
+                print(f"Unsupported file extension: {self.file_ext}")
+            return False
+
+        if self.mode == "gate":
+            return self.__find_first_keyword()
+        elif file_type == "html" and self.html_parser == "stream":
+            return self.__find_keyword_in_html_stream()
+        elif file_type == "html":
             return self.__find_keyword_in_html()
-        elif self.file_ext == "pdf":
+        elif file_type == "pdf":
             return self.__find_keyword_in_pdf()
-        elif self.file_ext == "txt":
+        elif file_type == "txt":
             return self.__find_keyword_in_txt()
         else:
+            # A registered document type, scanned from the text of its extractor
+            return self.__find_keyword_in_blocks()
+
+    def stream(self, max_matches: int = None):
+        """
+        Yield the keyword matches one by one, instead of collecting them all (see `find`).
+        PDF files (page by page), TXT files and HTML files with the "stream" parser (chunk by chunk) are processed lazily,
+        so the memory does not grow with the number of matches and the first match is available before
+        the whole document is processed.
+
+        Args:
+            max_matches (int): Stop after this many matches (e.g. 1 to only check if any keyword exists).
+        Raises:
+            fitz.FileDataError: If the PDF file can not be read.
+        Example:
+            >>> find_keyword = FindKeyword(src_file='example.pdf', keywords_file='keywords.txt', file_ext='pdf')
+            >>> has_issues = any(find_keyword.stream(max_matches=1))
+        """
+        if max_matches is not None and max_matches <= 0:
+            return
+
+        file_type = self.file_type
+        if file_type == "pdf":
+            matches = self.__iter_keyword_in_pdf()
+        elif file_type == "html" and self.html_parser == "stream":
+            matches = self.__iter_keyword_in_html_stream()
+        elif file_type == "txt":
+            matches = self.__iter_keyword_in_txt()
+        elif file_type is not None and file_type != "html":
+            matches = self.__iter_keyword_in_blocks()
+        else:
+            # BeautifulSoup parses the whole page at once
+            result = self.find_hits()
+            matches = iter(result[1] if isinstance(result, tuple) else [])
+
+        # Closing the generator (early exit) also closes the PDF document
+        try:
+            for match_count, match in enumerate(matches, start=1):
+                yield match
+                if max_matches is not None and match_count >= max_matches:
+                    break
+        finally:
+            if hasattr(matches, "close"):
+                matches.close()
+
+    def __find_first_keyword(self) -> tuple:
+        """
+        Find the first keyword match only ("gate" mode); `(1, [match])` or `(0, [])`.
+        HTML files are parsed with the chosen parser, so that the gate sees the same text as the report:
+        BeautifulSoup parses the whole page (the DOM can not be built partially), the streaming parser
+        stops at the first match.
+        """
+        if self.file_type == "html" and self.html_parser == "bs4":
+            issue_counter, page_data = self.__find_keyword_in_html()
+            if issue_counter < 0:
+                return -1, []
+            file_data = HitList(self.src_file)
+            file_data.extend(page_data[:1])
+            return len(file_data), file_data
+
+        try:
+            file_data = HitList(self.src_file)
+            file_data.extend(self.stream(max_matches=1))
+
+        except Exception as e:
             if self.verbose:
-                print(f"Unsupported file extension: {self.file_ext}")
-            return False
-        
+                print(f"Error reading {self.file_type.upper()} file {self.src_file}: {e}")
+            return -1, []
+
+        # Return the first match (if any)
+        self.metrics.count("matches", len(file_data))
+        return len(file_data), file_data
 
     def __find_keyword_in_html(self) -> tuple:
         """Find keyword in HTML content."""
-        file_data = []
+        from bs4 import BeautifulSoup
+
+        file_data = HitList(self.src_file)
         issue_counter = 0
-        line_counter = 1
         page_soup = None
 
         try:
             # process the HTML file with beautifulsoup
-            with open(self.src_file, 'rb') as file:
-                page_soup = BeautifulSoup(file, 'html.parser')
+            with self.metrics.stage("parse"):
+                if self.src_data is not None:
+                    page_soup = BeautifulSoup(self.src_data, 'html.parser')
+                else:
+                    with open(self.src_file, 'rb') as file:
+                        page_soup = BeautifulSoup(file, 'html.parser')
                 
             # extract text from the HTML content
-            page_title = page_soup.title.text if page_soup.title else "No Title"
-            page_sentences = re.split(r'(?<!\W\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s', page_soup.text)
-
-            # Iterate through each sentence in the HTML content
-            for sentence in page_sentences:
-                sentence = " ".join(s.strip() for s in sentence.splitlines())
-
-                # Iterate through each keyword and check if it is present in the sentence
-                for keyword in self.keywords:
-
-                    # Check if the keyword is present in the sentence; Consider lower case always
-                    if keyword.lower() in sentence.lower():
-                        issue_counter += 1
-                        file_data.append({
-                            "file": self.src_file,
-                            "title": page_title.strip(),
-                            "line": line_counter,
-                            "sentence": sentence
-                        })
-
-                # Increment the line counter for each sentence processed
-                line_counter += 1
+            with self.metrics.stage("extraction"):
+                page_title = (page_soup.title.text if page_soup.title else "No Title").strip()
+                page_text = page_soup.text
+            with self.metrics.stage("segmentation"):
+                page_sentences = SentenceSpans(page_text)
+            self.metrics.count("sentences", len(page_sentences))
+
+            # Find all the keywords in the whole HTML content at once; Consider lower case always
+            # (the sentence string is only built for the sentences with a keyword)
+            with self.metrics.stage("matching"):
+                page_matches = page_sentences.match(self.matcher)
+            for index, keyword_ids in page_matches:
+                sentence = page_sentences.sentence(index)
+                for keyword_id in keyword_ids:
+                    issue_counter += 1
+                    file_data.add(keyword_id, self.matcher.keywords[keyword_id], sentence,
+                                  index + 1,  # Sentence number
+                                  title=page_title)
 
         except Exception as e:
             if self.verbose:
@@ -99,55 +283,55 @@ class FindKeyword:
             return -1, file_data
         
         # Return the Collected data
+        self.metrics.count("matches", issue_counter)
         return issue_counter, file_data
     
-    def __find_keyword_in_pdf(self) -> tuple:
-        """Find keyword in PDF content."""
-        file_data = []
-        issue_counter = 0
-        line_counter = 1
+    def __find_keyword_in_html_stream(self) -> tuple:
+        """Find keyword in HTML content, with the streaming HTML parser (no DOM)."""
+        file_data = HitList(self.src_file)
 
         try:
-            # Open the PDF file using PyMuPDF (fitz)
-            # Note: fitz is the PyMuPDF library, which allows for PDF manipulation
-            # Ensure that the file exists and is a valid PDF
-            pdf_doc = fitz.open(self.src_file)
+            # Collect all the matches streamed while parsing
+            for match in self.__iter_keyword_in_html_stream():
+                file_data.append(match)
 
-            # Iterate through each page in the PDF document
-            for page_num in range(len(pdf_doc)):
-
-                page = pdf_doc[page_num]
-                page_text = page.get_text("text")
+        except Exception as e:
+            if self.verbose:
+                print(f"Error reading HTML file {self.src_file}: {e}")
+            return -1, file_data
 
-                # Split the text into sentences
-                page_sentences = re.split(r'(?<!\W\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s', page_text)
+        # Return the Collected data
+        self.metrics.count("matches", len(file_data))
+        return len(file_data), file_data
 
-                # Iterate through each sentence in the PDF content
-                for sentence in page_sentences:
-                    sentence = " ".join(s.strip() for s in sentence.splitlines())
+    def __iter_keyword_in_html_stream(self):
+        """
+        Yield the keyword matches in HTML content while the file is parsed (see `HTMLTextExtractor`).
+        The title is the one parsed so far; it is always known for the pages having it in the <head>.
+        """
+        extractor = HTMLTextExtractor()
 
-                    # verbose mode: print the current page and sentence being processed
-                    if self.verbose:
-                        print(f"Processing Page {page_num + 1}, Line {line_counter}: {sentence}")
+        # Parse the HTML content chunk by chunk (timed as the extraction)
+        text_blocks = self.metrics.timed(extractor.iter_text(self.src_file, data=self.src_data), "extraction", counter="blocks")
 
-                    # Iterate through each keyword and check if it is present in the sentence
-                    for keyword in self.keywords:
+        # Find all the keywords in the HTML content, chunk by chunk as it is parsed
+        sentence_matches = iter_sentence_matches(text_blocks, self.matcher, metrics=self.metrics)
+        for sentence_id, (line_counter, _, keyword_ids, sentence) in enumerate(sentence_matches):
+            page_title = (extractor.title if extractor.title is not None else "No Title").strip()
+            for keyword_id in keyword_ids:
+                yield Hit(self.src_file, keyword_id, self.matcher.keywords[keyword_id], sentence_id, sentence,
+                          line_counter, title=page_title)
 
-                        # Check if the keyword is present in the sentence; Consider lower case always
-                        if keyword.lower() in sentence.lower():
-                            issue_counter += 1
-                            file_data.append({
-                                "file": self.src_file,
-                                "page": page_num + 1,  # Page numbers are 1-indexed
-                                "line": line_counter,
-                                "sentence": sentence
-                            })
+    def __find_keyword_in_pdf(self) -> tuple:
+        """Find keyword in PDF content."""
+        import fitz
 
-                    # Increment the line counter for each sentence processed
-                    line_counter += 1
+        file_data = HitList(self.src_file)
 
-            # Close the PDF document
-            pdf_doc.close()
+        try:
+            # Collect all the matches streamed page by page
+            for match in self.__iter_keyword_in_pdf():
+                file_data.append(match)
 
         except fitz.FileDataError as e:
             if self.verbose:
@@ -155,66 +339,208 @@ class FindKeyword:
             return -1, file_data
 
         # Return the Collected data
-        return issue_counter, file_data
-    
+        self.metrics.count("matches", len(file_data))
+        return len(file_data), file_data
+
+    def __iter_keyword_in_pdf(self):
+        """
+        Yield the keyword matches in PDF content, page by page.
+        Only one page of text is held in memory at a time; the last (unfinished) sentence of a page
+        is carried over to the next page, so sentences crossing a page boundary are matched as a whole
+        and reported on the page they start on.
+        """
+        # Open the PDF file using PyMuPDF (fitz)
+        # Note: fitz is the PyMuPDF library, which allows for PDF manipulation
+        import fitz
+
+        # The document is closed when the generator finishes, fails or is closed early (max_matches)
+        with self.metrics.stage("open"):
+            if self.src_data is not None:
+                pdf_doc = fitz.open(stream=self.src_data, filetype="pdf")
+            else:
+                pdf_doc = fitz.open(self.src_file)
+
+        # The page cache is not used in verbose mode (all the sentences are printed)
+        page_cache = self.page_cache if not self.verbose else None
+        page_cache_scope = f"{ScanCache.keywords_hash(self.keywords)}:{self.EXTRACTOR_VERSION}" if page_cache else None
+        # The fonts and forms shared by the pages are hashed once per document
+        object_hashes = {}
+
+        with pdf_doc:
+            # Find all the keywords in the PDF content, page by page; Consider lower case always
+            sentences = SentenceBlocks(self.matcher, all_sentences=self.verbose, metrics=self.metrics)
+            sentence_id = 0
+            try:
+                for page_index in range(len(pdf_doc)):
+                    page_result, page_text, page_key = None, None, None
+
+                    # The matches of an unchanged page (with the same text carried over) are reused
+                    if page_cache is not None:
+                        with self.metrics.stage("page_cache"):
+                            if page_cache.page_key == "text":
+                                page_text = self.__extract_pdf_page(pdf_doc, page_index)
+                            page_hash = page_cache.page_hash(pdf_doc, page_index, text=page_text,
+                                                             object_hashes=object_hashes)
+                            page_key = page_cache.key(page_hash, sentences.state, page_cache_scope)
+                            page_result = page_cache.get(page_key)
+                        self.metrics.count("page_cache_hits" if page_result is not None else "page_cache_misses")
+
+                    # Extract the text of the page and match it, only when it is needed
+                    if page_result is None:
+                        if page_text is None:
+                            page_text = self.__extract_pdf_page(pdf_doc, page_index)
+                        page_result = sentences.match_block(page_text)
+                        if page_cache is not None:
+                            page_cache.put(page_key, page_result)
+
+                    for match in sentences.advance(page_result):
+                        yield from self.__pdf_hits(match, sentence_id)
+                        sentence_id += 1 if match[2] else 0
+
+                for match in sentences.finish():
+                    yield from self.__pdf_hits(match, sentence_id)
+
+            finally:
+                # The new page results are written once per document
+                if page_cache is not None:
+                    page_cache.flush()
+
+    def __extract_pdf_page(self, pdf_doc, page_index: int) -> str:
+        """Extract the text of a PDF page (timed as the extraction)."""
+        with self.metrics.stage("extraction"):
+            page_text = pdf_doc[page_index].get_text("text")
+        self.metrics.count("pages")
+        return page_text
+
+    def __pdf_hits(self, match: tuple, sentence_id: int) -> list:
+        """The hits of a matched PDF sentence; `match` is `(sentence number, page index, keyword ids, sentence)`."""
+        line_counter, page_index, keyword_ids, sentence = match
+
+        # verbose mode: print the current page and sentence being processed
+        if self.verbose:
+            print(f"Processing Page {page_index + 1}, Line {line_counter}: {sentence}")
+
+        return [Hit(self.src_file, keyword_id, self.matcher.keywords[keyword_id], sentence_id, sentence, line_counter,
+                    page=page_index + 1)  # Page numbers are 1-indexed
+                for keyword_id in keyword_ids]
+
     def __find_keyword_in_txt(self) -> tuple:
-        # TODO: Does not work fully yet, need to enhance it further
         """
         Find keyword in text content.
-        This method reads a text file, checks each line for the presence of keywords,
+        This method scans a text file (memory-mapped, chunk by chunk), checks each line for the presence of keywords,
         and returns the count of issues found along with the relevant data.
         Returns:
-            tuple: A tuple containing the count of issues found and a list of dictionaries
-                   with file name, line number, and sentence where the keyword was found.
-        If an error occurs while reading the file, it returns -1 and an empty list.
+            tuple: A tuple containing the count of issues found and the hits (`HitList`, read as a list of dicts)
+                   with file name, line number, byte offset, sentence (line) and the keyword found.
+        If an error occurs while reading the file, it returns -1 and the data collected so far.
         Example:
-            >>> find_keyword = FindKeyword(src_file='example.txt', keywords_file='keywords.txt')
-            >>> issue_count, data = find_keyword.__find_keyword_in_txt()
+            >>> find_keyword = FindKeyword(src_file='example.txt', keywords_file='keywords.txt', file_ext='txt')
+            >>> issue_count, data = find_keyword.find()
             >>> print(issue_count)  # Number of issues found
-            >>> print(data)  # List of dictionaries with file, line, and sentence information
+            >>> print(data)  # List of hits with file, line, offset, sentence and keyword information
         Note:
             - The method assumes that the text file is encoded in UTF-8.
             - It skips empty lines and only processes non-empty lines.
-            - The line number is set to 1 for the entire text file since it is treated as a single block of text.
-        
+            - The memory does not grow with the file size (see `src/core/text_scanner.py`).
         """
-        issue_counter = 0
-        line_counter = 1
-        file_data = []
-        contents = None
+        file_data = HitList(self.src_file)
 
         try:
-            with open(self.src_file, 'r', encoding='utf-8') as file:
-                contents = file.readlines()
-                
-            for content in contents:
-                content = content.strip()
-                
-                # Skip empty lines
-                if not content:
-                    continue
-
-                # Iterate through each keyword and check if it is present in the content
-                for keyword in self.keywords:
-                    
-                    if keyword.lower() in content.lower():
-                        issue_counter += 1
-                        file_data.append({
-                            "file": self.src_file,
-                            "line": 1,  # For text files, we can assume line 1 since it's a single block of text
-                            "sentence": content.strip()
-                        })
-                # Increment the line counter for each line processed
-                line_counter += 1
+            # Collect all the matches streamed line by line
+            for match in self.__iter_keyword_in_txt():
+                file_data.append(match)
 
         except Exception as e:
             if self.verbose:
                 print(f"Error reading text file {self.src_file}: {e}")
             return -1, file_data
-        
+
         # Return the Collected data
-        return issue_counter, file_data 
-    
+        self.metrics.count("matches", len(file_data))
+        return len(file_data), file_data
+
+    def __iter_keyword_in_txt(self):
+        """
+        Yield the keyword matches in text content, line by line; one per keyword found in a line.
+        The file is read and matched chunk by chunk, so both are timed together as the matching.
+        """
+        text_matches = self.metrics.timed(iter_text_matches(self.src_file, self.matcher, data=self.src_data), "matching")
+        sentence_id, last_line = -1, None
+        for line_number, byte_offset, keyword_id, sentence in text_matches:
+            if line_number != last_line:
+                sentence_id, last_line = sentence_id + 1, line_number
+            yield Hit(self.src_file, keyword_id, self.matcher.keywords[keyword_id], sentence_id, sentence, line_number,
+                      offset=byte_offset)  # Byte offset of the keyword in the file
+
+    def __find_keyword_in_blocks(self) -> tuple:
+        """Find keyword in the content of a registered document type (see `src/core/extractors.py`)."""
+        file_data = HitList(self.src_file)
+
+        try:
+            # Collect all the matches streamed while the text is extracted
+            for match in self.__iter_keyword_in_blocks():
+                file_data.append(match)
+
+        except Exception as e:
+            if self.verbose:
+                print(f"Error reading {self.file_type.upper()} file {self.src_file}: {e}")
+            return -1, file_data
+
+        # Return the Collected data
+        self.metrics.count("matches", len(file_data))
+        return len(file_data), file_data
+
+    def __iter_keyword_in_blocks(self):
+        """
+        Yield the keyword matches in the text blocks of the document type's extractor, as they are extracted;
+        the sentences crossing blocks are matched as a whole (like the streamed HTML text).
+        """
+        extractor = EXTRACTORS.create(self.file_type)
+
+        # Extract the text block by block (timed as the extraction)
+        text_blocks = self.metrics.timed(extractor.iter_text(self.src_file, data=self.src_data), "extraction", counter="blocks")
+
+        sentence_matches = iter_sentence_matches(text_blocks, self.matcher, metrics=self.metrics)
+        for sentence_id, (line_counter, _, keyword_ids, sentence) in enumerate(sentence_matches):
+            for keyword_id in keyword_ids:
+                yield Hit(self.src_file, keyword_id, self.matcher.keywords[keyword_id], sentence_id, sentence,
+                          line_counter, title=extractor.title)
+
+    def for_file(self, src_file: str, src_data: bytes = None, file_ext: str = None) -> "FindKeyword":
+        """
+        A FindKeyword for another file, sharing this one's matcher (the keywords are not loaded again),
+        options, metrics and page cache.
+
+        Args:
+            src_file (str): The file to scan.
+            src_data (bytes): The content of the file, if already read (e.g. prefetched).
+            file_ext (str): The file extension/type; None for the one of this finder, "auto" to find it
+                from the file (see `file_type`).
+        """
+        return FindKeyword(src_file=src_file, keywords_file=self.keywords_file,
+                           file_ext=file_ext if file_ext is not None else self.file_ext, verbose=self.verbose,
+                           matcher=self.matcher, html_parser=self.html_parser, metrics=self.metrics,
+                           mode=self.mode, src_data=src_data, page_cache=self.page_cache)
+
+    def scan_many(self, paths, file_ext: str = "auto", cache: ScanCache = None):
+        """
+        Scan many documents, of mixed types, with the matcher compiled once for this finder.
+        Each document is scanned by its own type (see `file_type`); an unsupported one gives `(-1, [])`.
+
+        Args:
+            paths (iterable): The files to scan.
+            file_ext (str): The file extension/type of all the files; "auto" to find the type of each file.
+            cache (ScanCache): The scan result cache; None to always scan.
+        Yields:
+            tuple: `(path, (issue_counter, file_data))` for each file, in the given order.
+        Example:
+            >>> finder = FindKeyword(src_file=None, keywords_file="./rules/keywords.txt")
+            >>> for path, (issue_counter, data) in finder.scan_many(["a.docx", "b.md", "c.pdf"]):
+            >>>     print(path, issue_counter)
+        """
+        for path in paths:
+            result = cached_find(self.for_file(path, file_ext=file_ext), cache)
+            yield path, result if isinstance(result, tuple) else (-1, [])
 
 
 if __name__ == "__main__":
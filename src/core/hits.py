@@ -0,0 +1,209 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Keyword hits;
+    Compact records of the keyword matches of a file scan: which keyword (id), in which sentence (id),
+    and where (page, line, byte offset), with the file, sentence and title strings stored once.
+@note: `FindKeyword.find()` returns the hits as a plain list of `Hit`s; a `Hit` is a dict (with its
+    keyword/sentence ids as attributes), so the output reads, sorts, changes and serializes (json.dumps)
+    as the former list of dicts. The sentences of the hits are interned (a sentence is stored once).
+    `HitList` stores the hits column-wise in typed arrays (a few bytes per hit) with interned
+    sentence/title tables, instead of one dict per hit repeating the file, title and sentence; it keeps
+    the hits of many files (`FindKeyword.find_hits()`, `ScanReport`). Its `Hit`s are built when read, so
+    a change to a read hit is not kept; `json.dumps` needs `hits.to_dicts()` or `default=json_default`.
+    The keys of a hit are the ones of its document type, plus "keyword" (the matched keyword):
+        HTML: file, title, line, sentence, keyword
+        PDF:  file, page, line, sentence, keyword
+        TXT:  file, line, offset, sentence, keyword
+    A hit's sentence id is the number of the (distinct, consecutive) matched sentence in the scan, so the
+    hits of one sentence share it. The missing values (e.g. the page of an HTML hit) are stored as -1.
+"""
+
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+
+def json_default(value):
+    """The `default` of `json.dump`/`json.dumps` for the hits: `json.dumps(data, default=json_default)`."""
+    if isinstance(value, HitList):
+        return value.to_dicts()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _field(key: str) -> property:
+    """A read-only attribute for a key of the hit (None if the hit does not have it)."""
+    return property(lambda self: self.get(key), doc=f"The {key} of the hit (None if not set).")
+
+
+class Hit(dict):
+    """
+    A keyword hit; a dict with the keys of its document type (see the module notes), in the report
+    column order, and the keyword/sentence ids as attributes.
+
+    Args:
+        file (str): The scanned file.
+        keyword_id (int): The id of the matched keyword (index in the matcher keywords).
+        keyword (str): The matched keyword (rule) as written in the keyword file.
+        sentence_id (int): The id of the sentence in the scan (see the module notes).
+        sentence (str): The sentence (or TXT line) containing the keyword.
+        line (int): The sentence number (HTML/PDF) or the line number (TXT).
+        page (int): The page number (PDF); None otherwise.
+        offset (int): The byte offset of the keyword in the file (TXT); None otherwise.
+        title (str): The page title (HTML); None otherwise.
+    """
+    __slots__ = ("keyword_id", "sentence_id")
+
+    def __init__(self, file: str, keyword_id: int, keyword: str, sentence_id: int, sentence: str, line: int,
+                 page: int = None, offset: int = None, title: str = None):
+        # The missing values (e.g. the page of an HTML hit) are not keys of the hit
+        super().__init__(file=file)
+        if title is not None:
+            self["title"] = title
+        if page is not None:
+            self["page"] = page
+        self["line"] = line
+        if offset is not None:
+            self["offset"] = offset
+        self["sentence"] = sentence
+        self["keyword"] = keyword
+        self.keyword_id = keyword_id
+        self.sentence_id = sentence_id
+
+    file = _field("file")
+    title = _field("title")
+    page = _field("page")
+    line = _field("line")
+    offset = _field("offset")
+    sentence = _field("sentence")
+    keyword = _field("keyword")
+
+    @property
+    def fields(self) -> tuple:
+        """The keys of the hit, in the report column order."""
+        return tuple(self)
+
+    def __reduce__(self):
+        return Hit, (self.file, self.keyword_id, self.keyword, self.sentence_id, self.sentence, self.line, self.page,
+                     self.offset, self.title)
+
+
+class HitList(Sequence):
+    """
+    The keyword hits of a file scan (`FindKeyword.find_hits()` data), stored compactly.
+
+    Args:
+        file (str): The scanned file (set on all the hits).
+    Example:
+        >>> hits = HitList("doc.pdf")
+        >>> hits.add(3, "banned keyword", "A banned keyword here.", line=12, page=2)
+        >>> hits[0]["page"], hits[0].keyword_id, dict(hits[0])
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        self.keywords = {}          # keyword id -> keyword; only the matched keywords
+        self.__unknown_ids = {}     # keyword -> negative id; the keywords of dict hits without a known id
+        self.sentences = []         # sentence id -> sentence
+        self.titles = []            # title id -> title
+        self.__strings = {}         # Interned sentences/titles; a repeated sentence (e.g. a page footer) is stored once
+        self.__title_ids = {}
+        self.__last_sentence = None  # (page, line) of the last sentence
+        self.keyword_ids = array('i')
+        self.sentence_ids = array('i')
+        self.title_ids = array('i')
+        self.pages = array('i')
+        self.lines = array('q')
+        self.offsets = array('q')
+
+    def add(self, keyword_id: int, keyword: str, sentence: str, line: int, page: int = None, offset: int = None,
+            title: str = None):
+        """Add a hit; the hits of a sentence must be added one after the other."""
+        if (page, line) != self.__last_sentence or (sentence is not self.sentences[-1] and sentence != self.sentences[-1]):
+            self.sentences.append(self.__strings.setdefault(sentence, sentence))
+            self.__last_sentence = (page, line)
+        if title is not None and title not in self.__title_ids:
+            self.__title_ids[title] = len(self.titles)
+            self.titles.append(self.__strings.setdefault(title, title))
+
+        self.keywords.setdefault(keyword_id, keyword)
+        self.keyword_ids.append(keyword_id)
+        self.sentence_ids.append(len(self.sentences) - 1)
+        self.title_ids.append(self.__title_ids[title] if title is not None else -1)
+        self.pages.append(page if page is not None else -1)
+        self.lines.append(line)
+        self.offsets.append(offset if offset is not None else -1)
+
+    def append(self, hit: Mapping, keyword_id: int = None):
+        """
+        Add a hit given as a `Hit` or a dict (e.g. loaded from JSON); a dict hit without a (known)
+        keyword id gets a negative id, unique per keyword in this list.
+        """
+        keyword = hit.get("keyword")
+        if isinstance(hit, Hit):
+            keyword_id = hit.keyword_id
+        elif keyword_id is None:
+            keyword_id = self.__unknown_ids.setdefault(keyword, -1 - len(self.__unknown_ids))
+        self.add(keyword_id, keyword, hit["sentence"], hit["line"], page=hit.get("page"),
+                 offset=hit.get("offset"), title=hit.get("title"))
+
+    def extend(self, hits):
+        for hit in hits:
+            self.append(hit)
+
+    @classmethod
+    def from_dicts(cls, file: str, hits: list, keywords: list = None) -> "HitList":
+        """
+        Build the hit list from dict hits (e.g. a cached or saved scan result); the keyword ids are
+        the positions of the hit keywords in `keywords` (the matcher keywords), when given.
+        """
+        hit_list = cls(file)
+        keyword_ids = {}
+        for hit in hits:
+            keyword = hit.get("keyword")
+            if keyword not in keyword_ids:
+                keyword_ids[keyword] = keywords.index(keyword) if keywords and keyword in keywords else None
+            hit_list.append(hit, keyword_id=keyword_ids[keyword])
+        return hit_list
+
+    def to_dicts(self) -> list:
+        """The hits as plain dicts (e.g. to save them as JSON)."""
+        return [dict(hit) for hit in self]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("hit index out of range")
+
+        keyword_id, title_id, page, offset = (self.keyword_ids[index], self.title_ids[index], self.pages[index],
+                                              self.offsets[index])
+        sentence_id = self.sentence_ids[index]
+        return Hit(self.file, keyword_id, self.keywords.get(keyword_id), sentence_id, self.sentences[sentence_id],
+                   self.lines[index], page=page if page >= 0 else None, offset=offset if offset >= 0 else None,
+                   title=self.titles[title_id] if title_id >= 0 else None)
+
+    def __len__(self) -> int:
+        return len(self.keyword_ids)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(hit == other_hit for hit, other_hit in zip(self, other))
+
+    def __add__(self, other):
+        """`hits + [...]` gives a plain list of the hits, as for a list."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dicts())
@@ -0,0 +1,169 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: HTMLTextExtractor Class;
+    Streaming (SAX-style) extraction of the visible text and the title of an HTML file,
+    built on the stdlib `html.parser.HTMLParser`; no DOM/tree is built.
+@note: The extracted text is the same as `BeautifulSoup(file, 'html.parser').text`:
+    <script>, <style> and <template> contents, comments, doctype and processing instructions are skipped.
+    The file is read and parsed in chunks, so the text is available before the whole file is parsed.
+    The encoding is found from the first `ENCODING_SNIFF_SIZE` bytes, in the same order as BeautifulSoup
+    (UnicodeDammit): the byte order mark, the declared charset (<?xml encoding>, <meta charset> or
+    http-equiv), else UTF-8; or windows-1252 when these bytes are not valid UTF-8 (BeautifulSoup checks
+    the whole document).
+"""
+
+
+import codecs
+import itertools
+import re
+from html.parser import HTMLParser
+
+
+# The number of bytes read to find the encoding (at least one chunk)
+ENCODING_SNIFF_SIZE = 64 * 1024
+
+# The byte order marks, longest first (a UTF-32 BOM starts with the UTF-16 one)
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+)
+
+# The encoding declarations; the same as BeautifulSoup's (`bs4.dammit.encoding_res`)
+XML_ENCODING_PATTERN = re.compile(rb'^\s*<\?.*encoding=[\'"](.*?)[\'"].*\?>', re.IGNORECASE)
+HTML_CHARSET_PATTERN = re.compile(rb'<\s*meta[^>]+charset\s*=\s*["\']?([^>]*?)[ /;\'">]', re.IGNORECASE)
+
+
+def sniff_encoding(head: bytes) -> tuple:
+    """
+    Find the encoding of an HTML document from its first bytes (see the module notes).
+    Returns:
+        tuple: `(encoding, length of the byte order mark to skip)`.
+    """
+    for byte_order_mark, encoding in BYTE_ORDER_MARKS:
+        if head.startswith(byte_order_mark):
+            return encoding, len(byte_order_mark)
+
+    # The declared charset, if Python knows it
+    match = XML_ENCODING_PATTERN.search(head, 0, 1024) or HTML_CHARSET_PATTERN.search(head)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii", "replace").strip()).name, 0
+        except LookupError:
+            pass
+
+    # UTF-8, unless the first bytes are not valid UTF-8 (the last char may be cut by the chunk size)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return "windows-1252", 0
+    return "utf-8", 0
+
+
+class HTMLTextExtractor(HTMLParser):
+    # The contents of these tags are not visible text
+    SKIP_TAGS = ("script", "style", "template")
+
+    def __init__(self, chunk_size: int = 64 * 1024, encoding: str = None):
+        super().__init__(convert_charrefs=True)
+        self.chunk_size = chunk_size
+        # The encoding of the file; None to find it from the first chunk (see `sniff_encoding`)
+        self.encoding = encoding
+        # The encoding the file was decoded with
+        self.detected_encoding = None
+        self.title = None
+        self.__title_parts = None
+        self.__skip_depth = 0
+        self.__text_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.__skip_depth += 1
+        elif tag == "title" and self.title is None and self.__title_parts is None:
+            # Only the first <title> is the page title
+            self.__title_parts = []
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.__skip_depth = max(self.__skip_depth - 1, 0)
+        elif tag == "title" and self.__title_parts is not None:
+            self.title = "".join(self.__title_parts)
+            self.__title_parts = None
+
+    def handle_data(self, data):
+        if self.__skip_depth:
+            return
+        if self.__title_parts is not None:
+            self.__title_parts.append(data)
+        self.__text_parts.append(data)
+
+    def unknown_decl(self, data):
+        # <![CDATA[...]]> content is text (as in BeautifulSoup)
+        if data.upper().startswith("CDATA["):
+            self.handle_data(data[len("CDATA["):])
+
+    def __pop_text(self) -> str:
+        """Return the text collected so far and forget it."""
+        text = "".join(self.__text_parts)
+        self.__text_parts = []
+        return text
+
+    def __iter_chunks(self, src_file: str, data: bytes = None):
+        """Yield the bytes of the file (or of the given data), chunk by chunk."""
+        if data is not None:
+            view = memoryview(data)
+            for start in range(0, len(view), self.chunk_size):
+                yield view[start:start + self.chunk_size]
+            return
+
+        with open(src_file, 'rb') as file:
+            yield from iter(lambda: file.read(self.chunk_size), b"")
+
+    def iter_text(self, src_file: str, data: bytes = None):
+        """
+        Yield the visible text of the HTML file, chunk by chunk, as it is parsed.
+        `self.title` is set as soon as the <title> is parsed.
+
+        Args:
+            src_file (str): The HTML file path.
+            data (bytes): The content of the file, if already read (e.g. prefetched); else the file is read.
+        Example:
+            >>> extractor = HTMLTextExtractor()
+            >>> text = "".join(extractor.iter_text("example.html"))
+            >>> print(extractor.title)
+        """
+        chunks = self.__iter_chunks(src_file, data)
+
+        # The encoding is found from the first bytes (the byte order mark is skipped)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= ENCODING_SNIFF_SIZE:
+                break
+        encoding, skip = (self.encoding, 0) if self.encoding else sniff_encoding(head)
+        self.detected_encoding = encoding
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+        for chunk in itertools.chain([head[skip:]], chunks):
+            self.feed(decoder.decode(chunk))
+            text = self.__pop_text()
+            if text:
+                yield text
+
+        # Flush the remaining (buffered) data
+        self.feed(decoder.decode(b"", final=True))
+        self.close()
+        text = self.__pop_text()
+        if text:
+            yield text
+
+
+def extract_html_text(src_file: str) -> tuple:
+    """Return the `(title, text)` of the HTML file; title is None if the page has no <title>."""
+    extractor = HTMLTextExtractor()
+    text = "".join(extractor.iter_text(src_file))
+    return extractor.title, text
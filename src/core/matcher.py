@@ -0,0 +1,249 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Keyword Matcher engines;
+    Finds all the keywords present in a block of text in a single pass over the text,
+    instead of checking every keyword against every sentence one by one.
+@note: All the engines are case-insensitive (same as `keyword.lower() in sentence.lower()`)
+    and return the same results; they only differ in how the keywords are searched.
+    Compiled rules (see `src/core/rules.py`) add whole-word and case-sensitive checks on top of the
+    engine matches, and regex rules which are searched separately, within each sentence/line.
+"""
+
+
+import re
+from collections import deque
+
+
+def lowered_offsets(text: str) -> list:
+    """
+    Map each position of `text.lower()` to the position of its char in `text`.
+    Only needed when lowering changes the length of the text: a few chars lower to more than one
+    (e.g. 'İ' to 'i̇'), which shifts all the positions after them.
+    """
+    offsets = []
+    for position, char in enumerate(text):
+        offsets.extend([position] * len(char.lower()))
+    return offsets
+
+
+class KeywordMatcher:
+    """
+    Base class for the keyword matcher engines.
+    The keywords are compiled once (at init) and can then be searched in any number of text blocks.
+
+    Args:
+        keywords (list): The keywords to search for; the keyword id is the index in this list.
+        rules (list): The compiled rules of the keywords (`Rule`, same order), with the whole-word,
+            case-sensitive and regex modifiers; None for plain keywords.
+    """
+    name = None
+
+    def __init__(self, keywords: list, rules: list = None):
+        self.keywords = list(keywords)
+        self.rules = list(rules) if rules is not None else None
+        self.patterns = [keyword.lower() for keyword in self.keywords]
+
+        # The checks of the whole-word/case-sensitive rules (keyword_id -> rule) and the regex rules,
+        # which are not searched by the engine
+        self.checks = {}
+        self.regex_patterns = []
+        if self.rules is not None:
+            self.patterns = [rule.pattern for rule in self.rules]
+            for keyword_id, rule in enumerate(self.rules):
+                if rule.regex:
+                    self.regex_patterns.append((rule.compile(), keyword_id))
+                elif rule.word or rule.case:
+                    self.checks[keyword_id] = rule
+
+        # An empty keyword is present in every text block (same as `"" in sentence`)
+        self.always = [keyword_id for keyword_id, pattern in enumerate(self.patterns) if pattern == ""]
+
+        # Map each (non-empty) pattern to the keyword ids using it; duplicates are reported separately
+        self.pattern_ids = {}
+        for keyword_id, pattern in enumerate(self.patterns):
+            if pattern:
+                self.pattern_ids.setdefault(pattern, []).append(keyword_id)
+
+        self.build()
+
+    def build(self):
+        """Compile the keywords into the engine specific data structure."""
+        raise NotImplementedError
+
+    def iter_pattern_matches(self, lowered_text: str):
+        """Yield every pattern occurrence in the (lower case) text as `(start, end, keyword_id)`."""
+        raise NotImplementedError
+
+    def iter_matches(self, text: str):
+        """
+        Yield every keyword occurrence in the given text as `(start, end, keyword_id)`.
+        The offsets are relative to `text` (the patterns are searched in `text.lower()`, see `lowered_offsets`).
+        The regex rules are not included (see `iter_regex_matches`).
+        """
+        lowered_text = text.lower()
+        offsets = lowered_offsets(text) if len(lowered_text) != len(text) else None
+        if not self.checks and offsets is None:
+            yield from self.iter_pattern_matches(lowered_text)
+            return
+
+        for start, end, keyword_id in self.iter_pattern_matches(lowered_text):
+            if offsets is not None:
+                start, end = offsets[start], offsets[end - 1] + 1
+
+            # The whole-word/case-sensitive checks are done on the original text
+            rule = self.checks.get(keyword_id)
+            if rule is None or rule.accepts(text, start, end):
+                yield start, end, keyword_id
+
+    def iter_regex_matches(self, text: str, pos: int = 0, endpos: int = None):
+        """
+        Yield the first occurrence of each regex rule in `text[pos:endpos]` as `(start, end, keyword_id)`.
+        The regex rules are searched within one sentence/line at a time, so that a match never spans two.
+        """
+        endpos = len(text) if endpos is None else endpos
+        for pattern, keyword_id in self.regex_patterns:
+            match = pattern.search(text, pos, endpos)
+            if match is not None:
+                yield match.start(), match.end(), keyword_id
+
+    def find(self, text: str) -> list:
+        """Return the (sorted) ids of the keywords present in the given text."""
+        found = set(self.always)
+        if self.pattern_ids:
+            for _, _, keyword_id in self.iter_matches(text):
+                found.add(keyword_id)
+        for _, _, keyword_id in self.iter_regex_matches(text):
+            found.add(keyword_id)
+        return sorted(found)
+
+    def find_keywords(self, text: str) -> list:
+        """Return the keywords present in the given text (in keyword file order)."""
+        return [self.keywords[keyword_id] for keyword_id in self.find(text)]
+
+
+class RegexMatcher(KeywordMatcher):
+    """
+    Compiled regex engine;
+        All the keywords are compiled into a single trie-shaped regex (`abc(?:d|e)`) and
+        searched with a zero-width lookahead, so that overlapping keywords are still found.
+    """
+    name = "regex"
+
+    def build(self):
+        # Build a character trie of all the patterns; '' marks the end of a pattern
+        trie = {}
+        for pattern in self.pattern_ids:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        # The regex gives the longest pattern at each position, the shorter ones are its prefixes
+        self._prefixes = {}
+        for pattern in self.pattern_ids:
+            self._prefixes[pattern] = [
+                pattern[:size] for size in range(len(pattern) - 1, 0, -1) if pattern[:size] in self.pattern_ids
+            ]
+
+        self._regex = re.compile(f"(?=({self.__trie_to_regex(trie)}))", re.DOTALL) if trie else None
+
+    def __trie_to_regex(self, node: dict) -> str:
+        """Convert a (sub) trie to a regex; greedy so that the longest pattern wins."""
+        branches = [re.escape(char) + self.__trie_to_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+
+        regex = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # A pattern ends here, the longer ones are optional
+            regex = f"(?:{regex})?"
+        return regex
+
+    def iter_pattern_matches(self, lowered_text: str):
+        if self._regex is None:
+            return
+
+        for match in self._regex.finditer(lowered_text):
+            start = match.start()
+            pattern = match.group(1)
+            for found in [pattern] + self._prefixes[pattern]:
+                for keyword_id in self.pattern_ids[found]:
+                    yield start, start + len(found), keyword_id
+
+
+class AhoCorasickMatcher(KeywordMatcher):
+    """
+    Aho-Corasick automaton engine;
+        All the keywords are compiled into a single automaton and the text is walked
+        character by character only once, regardless of the number of keywords.
+    """
+    name = "aho-corasick"
+
+    def build(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        # Build the trie (goto function)
+        for pattern in self.pattern_ids:
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(pattern)
+
+        # Build the failure links (breadth first), merging the outputs of the failure node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_node] = self._goto[fail].get(char, 0)
+                self._output[next_node] = self._output[next_node] + self._output[self._fail[next_node]]
+
+    def iter_pattern_matches(self, lowered_text: str):
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+
+        for index, char in enumerate(lowered_text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for pattern in output[node]:
+                for keyword_id in self.pattern_ids[pattern]:
+                    yield index + 1 - len(pattern), index + 1, keyword_id
+
+
+# Available matcher engines (name -> class)
+MATCHER_ENGINES = {
+    RegexMatcher.name: RegexMatcher,
+    AhoCorasickMatcher.name: AhoCorasickMatcher,
+}
+
+
+def build_matcher(keywords: list, engine: str = "regex", rules: list = None) -> KeywordMatcher:
+    """
+    Build a keyword matcher with the given engine.
+
+    Args:
+        keywords (list): The keywords to search for.
+        engine (str): The matcher engine name, one of `MATCHER_ENGINES` (default: regex).
+        rules (list): The compiled rules of the keywords (see `src/core/rules.py`); None for plain keywords.
+    Raises:
+        ValueError: If the engine is not supported.
+    """
+    if engine not in MATCHER_ENGINES:
+        raise ValueError(f"Unsupported matcher engine: {engine}; supported: {', '.join(MATCHER_ENGINES)}")
+    return MATCHER_ENGINES[engine](keywords, rules=rules)
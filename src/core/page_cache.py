@@ -0,0 +1,266 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: PageCache Class;
+    Persistent cache of the keyword matches of each PDF page, so that the unchanged pages of a regenerated
+    document are not extracted and matched again (only the changed pages are).
+@note: The key of a page is the hash of its content (the page content stream, its form XObjects and fonts;
+    or its extracted text with `page_key="text"`), the text carried over from the previous page (a
+    sentence crossing the page boundary, see `SentenceBlocks`) and the scope (keyword rules and extractor
+    version, see `FindKeyword`). The value is the page result of `SentenceBlocks.match_block`.
+    The entries are kept in one SQLite database (many small entries), shared by the processes; the new
+    entries are written and the least recently used ones evicted once per document (`flush`).
+    With the "content" key, the fonts and forms are hashed with every object they reference (e.g. the
+    /Encoding /Differences, /ToUnicode CMap, descendant fonts and embedded font programs, the nested
+    forms), since all of them change the extracted text; only the image streams and the font subset
+    prefixes are left out. Each object is hashed once per document (see `object_hash`).
+"""
+
+
+import hashlib
+import json
+import os
+import re
+import time
+
+
+# Supported page keys
+PAGE_KEYS = ("content", "text")
+
+# An indirect object reference ("12 0 R")
+REFERENCE_PATTERN = re.compile(r"\b(\d+) \d+ R\b")
+
+# The subset prefix of a font name ("/ABCDEF+Arial"); changes each time a document is generated
+SUBSET_PREFIX_PATTERN = re.compile(r"/[A-Z]{6}\+")
+
+# An image XObject; its stream does not change the text
+IMAGE_PATTERN = re.compile(r"/Subtype\s*/Image\b")
+
+
+class PageCache:
+    """
+    Args:
+        cache_file (str): The SQLite database file.
+        max_size_mb (float): The maximum size of the cached page results; the least recently used are evicted.
+        page_key (str): "content" (hash of the page content stream; the page text is not extracted on a hit)
+            or "text" (hash of the extracted text; only the segmentation and matching are saved).
+        verbose (bool): Print the cache errors.
+    Example:
+        >>> page_cache = PageCache("./out/page_cache.sqlite")
+        >>> FindKeyword(src_file="manual.pdf", keywords_file="keywords.txt", file_ext="pdf", page_cache=page_cache).find()
+        >>> print(page_cache.format_stats())
+    """
+
+    def __init__(self, cache_file: str = "./out/page_cache.sqlite", max_size_mb: float = 512,
+                 page_key: str = "content", verbose: bool = False):
+        if page_key not in PAGE_KEYS:
+            raise ValueError(f"Unsupported page key: {page_key}; supported: {', '.join(PAGE_KEYS)}")
+        self.cache_file = cache_file
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.page_key = page_key
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__connection = None
+        self.__pending = {}         # key -> page result; written by `flush`
+        self.__used = set()         # The keys read since the last `flush`
+        self.__size_stats = (0, 0)  # (entries, bytes) when the database was closed
+
+    @property
+    def connection(self):
+        """The database connection; opened (and the database created) on first use. None if unavailable."""
+        if self.__connection is None and self.cache_file:
+            # Imported on first use; a scan without the page cache does not load SQLite
+            import sqlite3
+
+            try:
+                os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+                connection = sqlite3.connect(self.cache_file, timeout=30)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+                                   "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used)")
+                connection.commit()
+                self.__connection = connection
+            except (OSError, sqlite3.Error) as e:
+                # The cache is only an optimization; scan without it
+                if self.verbose:
+                    print(f"Unable to open the page cache {self.cache_file}: {e}")
+                self.cache_file = None
+        return self.__connection
+
+    @staticmethod
+    def object_hash(pdf_doc, xref: int, object_hashes: dict) -> str:
+        """
+        The hash of a PDF object: its dictionary, its stream and the objects it references (recursively,
+        the references replaced by the hash of their object, so that renumbered objects hash the same).
+
+        Args:
+            pdf_doc (fitz.Document): The PDF document.
+            xref (int): The object number.
+            object_hashes (dict): The hashes of the objects of the document already hashed (updated).
+        """
+        if xref in object_hashes:
+            return object_hashes[xref]
+        if not 0 < xref < pdf_doc.xref_length():
+            return "null"
+
+        # A reference cycle is hashed once
+        object_hashes[xref] = "cycle"
+        source = SUBSET_PREFIX_PATTERN.sub("/", pdf_doc.xref_object(xref, compressed=True))
+        source = REFERENCE_PATTERN.sub(lambda match: PageCache.object_hash(pdf_doc, int(match.group(1)), object_hashes),
+                                       source)
+        digest = hashlib.sha256(source.encode("utf-8", errors="surrogatepass"))
+        if pdf_doc.xref_is_stream(xref) and not IMAGE_PATTERN.search(source):
+            digest.update(pdf_doc.xref_stream_raw(xref) or b"")
+
+        object_hashes[xref] = digest.hexdigest()
+        return object_hashes[xref]
+
+    @staticmethod
+    def page_hash(pdf_doc, page_index: int, text: str = None, object_hashes: dict = None) -> str:
+        """
+        The hash of the page content (content stream, form XObjects and fonts, with the objects they
+        reference); of the extracted text if given.
+
+        Args:
+            object_hashes (dict): The hashes of the objects already hashed, shared by the pages of a document
+                (a font or form used by many pages is hashed once); None to hash them for this page only.
+        """
+        if text is not None:
+            return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+        object_hashes = object_hashes if object_hashes is not None else {}
+        page = pdf_doc[page_index]
+        digest = hashlib.sha256(page.read_contents())
+        digest.update(f"|{page.rect}|{page.rotation}".encode("utf-8"))
+        for xref, *_ in pdf_doc.get_page_xobjects(page_index):
+            # Only the forms may draw text (the image streams are not hashed)
+            digest.update(f"|{PageCache.object_hash(pdf_doc, xref, object_hashes)}".encode("utf-8"))
+        for xref, *_ in pdf_doc.get_page_fonts(page_index):
+            # The encoding, ToUnicode CMap, descendant fonts and font program map the glyph codes to text
+            digest.update(f"|{PageCache.object_hash(pdf_doc, xref, object_hashes)}".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(page_hash: str, state: tuple, scope: str) -> str:
+        """Build the cache key of a page: its content hash, the text carried over to it and the scope."""
+        return hashlib.sha256(json.dumps([page_hash, list(state), scope]).encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached page result for the key, or None."""
+        result = self.__pending.get(key)
+        if result is None and self.connection is not None:
+            import sqlite3
+
+            try:
+                row = self.connection.execute("SELECT result FROM pages WHERE key = ?", (key,)).fetchone()
+                result = json.loads(row[0]) if row else None
+            except (sqlite3.Error, ValueError) as e:
+                if self.verbose:
+                    print(f"Unable to read the page cache entry {key}: {e}")
+                result = None
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.__used.add(key)
+        return result
+
+    def put(self, key: str, result: tuple):
+        """Store the page result for the key (written by `flush`)."""
+        self.__pending[key] = result
+
+    def flush(self):
+        """Write the new entries, mark the used entries as recently used (LRU) and evict the oldest ones."""
+        if not self.__pending and not self.__used:
+            return
+        if self.connection is None:
+            self.__pending, self.__used = {}, set()
+            return
+
+        import sqlite3
+
+        now = time.time()
+        rows = []
+        for key, result in self.__pending.items():
+            value = json.dumps(result)
+            rows.append((key, value, len(value), now))
+        try:
+            with self.connection:
+                self.connection.executemany("INSERT OR REPLACE INTO pages (key, result, size, last_used) "
+                                            "VALUES (?, ?, ?, ?)", rows)
+                self.connection.executemany("UPDATE pages SET last_used = ? WHERE key = ?",
+                                            [(now, key) for key in self.__used])
+            self.evict()
+        except sqlite3.Error as e:
+            if self.verbose:
+                print(f"Unable to write the page cache {self.cache_file}: {e}")
+        finally:
+            self.__pending = {}
+            self.__used = set()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in `max_size_mb`."""
+        total_size = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total_size <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in self.connection.execute("SELECT key, size FROM pages ORDER BY last_used"):
+            if total_size <= self.max_size:
+                break
+            evicted.append((key,))
+            total_size -= size
+        with self.connection:
+            self.connection.executemany("DELETE FROM pages WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self):
+        """Remove all the cache entries."""
+        self.__pending = {}
+        self.__used = set()
+        if self.connection is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM pages")
+
+    def stats(self) -> dict:
+        """The hit/miss counts and rate of this process, the evictions and the cache entries/size."""
+        entries, size = self.__size_stats
+        if self.__connection is not None:
+            import sqlite3
+
+            try:
+                entries, size = self.__connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+            except sqlite3.Error:
+                pass
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_mb": round(size / (1024 * 1024), 3),
+        }
+
+    def format_stats(self) -> str:
+        """A one line summary of the stats."""
+        stats = self.stats()
+        rate = f"{stats['hit_rate'] * 100:.1f}%" if stats["hit_rate"] is not None else "-"
+        return (f"Page cache: {stats['hits']} hits, {stats['misses']} misses ({rate} hit rate), "
+                f"{stats['evictions']} evicted, {stats['entries']} entries ({stats['size_mb']} MB)")
+
+    def close(self):
+        """Write the pending entries and close the database (the stats are kept)."""
+        self.flush()
+        if self.__connection is not None:
+            stats = self.stats()
+            self.__size_stats = (stats["entries"], int(stats["size_mb"] * 1024 * 1024))
+            self.__connection.close()
+            self.__connection = None
@@ -0,0 +1,195 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: File prefetch;
+    Reads the next documents (bytes) ahead of the parsing, with an asyncio pipeline, so that the
+    latency of a slow (e.g. network mounted) storage overlaps with the CPU work on the current document.
+@note: Up to `depth` files are read concurrently (the blocking reads run in a thread pool) and the
+    buffers are handed over in the given order. The buffers held (read but not yet released by the
+    consumer) never exceed `max_buffer_bytes`, except for a single file larger than that; the reads
+    wait for the consumer when the budget is used (backpressure). A buffer is released when the
+    consumer asks for the next one.
+"""
+
+
+import asyncio
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Default prefetch depth (files read ahead) and buffer budget (bytes)
+DEFAULT_PREFETCH_DEPTH = 4
+DEFAULT_MAX_BUFFER_BYTES = 256 * 1024 * 1024
+
+
+class _ByteBudget:
+    """
+    The bytes of the buffers held; acquired in the order of the files (tickets), so that the next file
+    the consumer waits for is never blocked by later files. A file is always admitted when nothing is held.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.next_ticket = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self, ticket: int, size: int):
+        async with self.condition:
+            await self.condition.wait_for(
+                lambda: ticket == self.next_ticket and (self.used == 0 or self.used + size <= self.max_bytes))
+            self.used += size
+            self.next_ticket += 1
+            self.condition.notify_all()
+
+    async def release(self, size: int):
+        async with self.condition:
+            self.used -= size
+            self.condition.notify_all()
+
+
+def _file_size(src_file: str) -> int:
+    try:
+        return os.path.getsize(src_file)
+    except OSError:
+        # Reported by the read
+        return 0
+
+
+def _read_file(src_file: str) -> bytes:
+    with open(src_file, 'rb') as file:
+        return file.read()
+
+
+async def aiter_prefetched(paths, depth: int = DEFAULT_PREFETCH_DEPTH, max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES):
+    """
+    Read the files ahead, concurrently (async generator).
+
+    Args:
+        paths (iterable): The files to read.
+        depth (int): The number of files read ahead (concurrently).
+        max_buffer_bytes (int): The maximum bytes of the buffers held.
+    Yields:
+        tuple: `(path, data, error)` in the given order; `data` is None and `error` the OSError if the
+               file could not be read.
+    """
+    depth = max(depth, 1)
+    budget = _ByteBudget(max_buffer_bytes)
+    paths = iter(paths)
+    pending = deque()
+    tickets = itertools.count()
+
+    async def read(ticket: int, src_file: str) -> tuple:
+        size = await asyncio.to_thread(_file_size, src_file)
+        await budget.acquire(ticket, size)
+        try:
+            return src_file, await asyncio.to_thread(_read_file, src_file), None, size
+        except OSError as e:
+            await budget.release(size)
+            return src_file, None, e, 0
+
+    def fill():
+        # Keep `depth` reads in flight
+        while len(pending) < depth:
+            src_file = next(paths, None)
+            if src_file is None:
+                return
+            pending.append(asyncio.create_task(read(next(tickets), src_file)))
+
+    fill()
+    try:
+        while pending:
+            src_file, data, error, size = await pending.popleft()
+            fill()
+            try:
+                yield src_file, data, error
+            finally:
+                # The consumer is done with the buffer
+                await budget.release(size)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def prefetch_files(paths, depth: int = DEFAULT_PREFETCH_DEPTH, max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES):
+    """
+    Read the files ahead, concurrently, from synchronous code; the asyncio pipeline runs in a background thread.
+
+    Args:
+        paths (iterable): The files to read.
+        depth (int): The number of files read ahead (concurrently).
+        max_buffer_bytes (int): The maximum bytes of the buffers held.
+    Yields:
+        tuple: `(path, data, error)` in the given order (see `aiter_prefetched`).
+    Example:
+        >>> for path, data, error in prefetch_files(files, depth=8):
+        >>>     FindKeyword(src_file=path, keywords_file="keywords.txt", file_ext="pdf", src_data=data).find()
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max(depth, 1), thread_name_prefix="prefetch"))
+    thread = threading.Thread(target=loop.run_forever, name="prefetch-loop", daemon=True)
+    thread.start()
+
+    files = aiter_prefetched(paths, depth=depth, max_buffer_bytes=max_buffer_bytes)
+    try:
+        while True:
+            try:
+                item = asyncio.run_coroutine_threadsafe(files.__anext__(), loop).result()
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        # Stop the reads ahead (e.g. the consumer stopped early) and the loop
+        asyncio.run_coroutine_threadsafe(files.aclose(), loop).result()
+        asyncio.run_coroutine_threadsafe(loop.shutdown_default_executor(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class FilePrefetcher:
+    """
+    Prefetches the files in the order they will be scanned, and hands the buffer of a file on request
+    (e.g. one pytest test per file). A file requested out of order is not prefetched (None).
+
+    Args:
+        paths (list): The files, in the order they will be requested.
+        depth (int): The number of files read ahead (concurrently).
+        max_buffer_bytes (int): The maximum bytes of the buffers held.
+    Example:
+        >>> prefetcher = FilePrefetcher(files, depth=8)
+        >>> data = prefetcher.get(files[0])    # bytes, or None (read the file directly)
+        >>> prefetcher.close()
+    """
+
+    def __init__(self, paths: list, depth: int = DEFAULT_PREFETCH_DEPTH, max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES):
+        self.paths = list(paths)
+        self.remaining = set(self.paths)
+        self.depth = depth
+        self.max_buffer_bytes = max_buffer_bytes
+        self._files = None
+
+    def get(self, src_file: str):
+        """Return the prefetched bytes of the file; None if it was not prefetched or could not be read."""
+        if src_file not in self.remaining:
+            return None
+
+        if self._files is None:
+            self._files = prefetch_files(self.paths, depth=self.depth, max_buffer_bytes=self.max_buffer_bytes)
+
+        # Skip the files which were not requested (e.g. deselected tests)
+        for path, data, _ in self._files:
+            self.remaining.discard(path)
+            if path == src_file:
+                return data
+        return None
+
+    def close(self):
+        """Stop prefetching."""
+        if self._files is not None:
+            self._files.close()
+            self._files = None
@@ -0,0 +1,275 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Keyword rules compiler;
+    Parses the keyword (rules) file into normalized, deduplicated rules with optional modifiers,
+    builds the keyword matcher once, and keeps the built matcher as an artifact on disk.
+@note: One rule per line; blank lines are skipped and the whitespace is normalized (stripped, runs
+    of whitespace become one space). A rule may start with modifiers, joined with '+' and ended by ':':
+        re:<regex>          a regular expression (searched within each sentence/line)
+        word:<keyword>      whole word only (not preceded/followed by a letter, digit or '_')
+        case:<keyword>      case-sensitive
+        word+case:<keyword> both (any combination of re, word and case)
+    Any other line is a plain (case-insensitive substring) keyword, e.g. "re: subject" with a space.
+    Duplicate rules (same modifiers and same keyword, ignoring the case unless case-sensitive) are kept once.
+
+    The built matcher is memoized per process and pickled to `<artifact_dir>/<hash>.pkl`, where the hash
+    covers the rules file content, the engine, the artifact version and the Python version; so another
+    process (pytest run, batch worker) loads it instead of building it again.
+    Loading a pickle runs code, so the artifact directory must be private to the user: it is created
+    with mode 0o700 and an artifact is only loaded (or written) when the directory and the file are owned
+    by the user and not writable by the group/others (see `_is_private`). Do not share the directory
+    between users or machines (e.g. CI nodes); each one builds its own artifact.
+"""
+
+
+import gc
+import hashlib
+import os
+import pickle
+import platform
+import re
+import tempfile
+from contextlib import contextmanager
+
+from src.core.matcher import KeywordMatcher, build_matcher
+
+
+# Bump this when the rule parsing or the matcher data structures change; invalidates the artifacts
+ARTIFACT_VERSION = 1
+
+# The supported rule modifiers
+RULE_MODIFIERS = ("re", "word", "case")
+RULE_MODIFIERS_PATTERN = re.compile(r"^((?:re|word|case)(?:\+(?:re|word|case))*):(?=\S)")
+
+# The rules compiled in this process; (rules file, mtime, size, engine) -> matcher
+_compiled = {}
+
+
+class Rule:
+    """
+    A keyword rule.
+
+    Args:
+        text (str): The keyword (or regex), normalized.
+        regex (bool): The text is a regular expression.
+        word (bool): Whole word matches only.
+        case (bool): Case-sensitive.
+    """
+    __slots__ = ("text", "regex", "word", "case")
+
+    def __init__(self, text: str, regex: bool = False, word: bool = False, case: bool = False):
+        self.text = text
+        self.regex = regex
+        self.word = word
+        self.case = case
+
+    def __repr__(self) -> str:
+        return f"Rule({self.source!r})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Rule) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    @property
+    def modifiers(self) -> list:
+        return [modifier for modifier, enabled in zip(RULE_MODIFIERS, (self.regex, self.word, self.case)) if enabled]
+
+    @property
+    def source(self) -> str:
+        """The rule as written in the rules file (normalized); the keyword name in the reports."""
+        return f"{'+'.join(self.modifiers)}:{self.text}" if self.modifiers else self.text
+
+    @property
+    def key(self) -> tuple:
+        """The identity of the rule, to find the duplicates."""
+        return self.text if self.case or self.regex else self.text.lower(), self.regex, self.word, self.case
+
+    @property
+    def pattern(self):
+        """The (lower case) pattern searched by the matcher engine; None for a regex rule."""
+        return None if self.regex else self.text.lower()
+
+    def compile(self):
+        """Compile a regex rule."""
+        regex = f"(?<!\\w)(?:{self.text})(?!\\w)" if self.word else self.text
+        return re.compile(regex, 0 if self.case else re.IGNORECASE)
+
+    def accepts(self, text: str, start: int, end: int) -> bool:
+        """Check the whole-word/case-sensitive modifiers of a (case-insensitive) match of the rule."""
+        if self.case and text[start:end] != self.text:
+            return False
+        if self.word and ((start > 0 and _is_word_char(text[start - 1])) or (end < len(text) and _is_word_char(text[end]))):
+            return False
+        return True
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def parse_rule(line: str):
+    """Parse a rule line; returns None for a blank line. Raises ValueError for an invalid regex."""
+    text = " ".join(line.split())
+    if not text:
+        return None
+
+    modifiers = []
+    match = RULE_MODIFIERS_PATTERN.match(text)
+    if match:
+        modifiers = match.group(1).split("+")
+        text = text[match.end():]
+
+    rule = Rule(text, regex="re" in modifiers, word="word" in modifiers, case="case" in modifiers)
+    if rule.regex:
+        try:
+            rule.compile()
+        except re.error as e:
+            raise ValueError(f"Invalid regex rule '{line.strip()}': {e}") from e
+    return rule
+
+
+def parse_rules(lines) -> list:
+    """
+    Parse the rule lines; skips the blank lines and the duplicate rules (the first one is kept).
+    Raises:
+        ValueError: If a regex rule is invalid (with its line number).
+    """
+    rules = []
+    seen = set()
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            rule = parse_rule(line)
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: {e}") from e
+        if rule is None or rule.key in seen:
+            continue
+        seen.add(rule.key)
+        rules.append(rule)
+    return rules
+
+
+def build_rules_matcher(rules: list, engine: str = "regex") -> KeywordMatcher:
+    """Build the keyword matcher of the (parsed) rules."""
+    with _gc_paused():
+        return build_matcher([rule.source for rule in rules], engine=engine, rules=rules)
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the garbage collector; building/loading a matcher creates many small containers
+    (e.g. the automaton nodes) which trigger many useless collections.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def rules_hash(rules_file: str, engine: str = "regex") -> str:
+    """The hash identifying the compiled artifact of a rules file."""
+    digest = hashlib.sha256()
+    with open(rules_file, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(f"|{engine}|{ARTIFACT_VERSION}|{platform.python_version()}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compile_rules(rules_file: str, engine: str = "regex", artifact_dir: str = None, verbose: bool = False) -> KeywordMatcher:
+    """
+    Compile the rules file into a keyword matcher; built once per process, and loaded from the
+    artifact directory (when given) if another process already built it.
+
+    Args:
+        rules_file (str): The keyword (rules) file.
+        engine (str): The matcher engine name (see `src/core/matcher.py`).
+        artifact_dir (str): The directory of the compiled artifacts; None to not use/write artifacts.
+        verbose (bool): Print the artifact errors.
+    Raises:
+        FileNotFoundError: If the rules file does not exist.
+        ValueError: If the engine is not supported or a regex rule is invalid.
+    Example:
+        >>> matcher = compile_rules("./rules/keywords.txt", artifact_dir="./out/rules_cache")
+        >>> matcher.find_keywords("A banned keyword here")
+    """
+    stat = os.stat(rules_file)
+    memo_key = (os.path.abspath(rules_file), stat.st_mtime_ns, stat.st_size, engine)
+    matcher = _compiled.get(memo_key)
+    if matcher is not None:
+        return matcher
+
+    artifact_path = os.path.join(artifact_dir, f"{rules_hash(rules_file, engine)}.pkl") if artifact_dir else None
+    if artifact_path:
+        matcher = _load_artifact(artifact_path, verbose)
+
+    if matcher is None:
+        with open(rules_file, 'r', encoding='utf-8') as file:
+            matcher = build_rules_matcher(parse_rules(file), engine=engine)
+        if artifact_path:
+            _save_artifact(artifact_path, matcher, verbose)
+
+    _compiled[memo_key] = matcher
+    return matcher
+
+
+def _is_private(path: str) -> bool:
+    """Check if a file/directory is owned by the user and not writable by the group/others (POSIX)."""
+    stat = os.stat(path)
+    if not hasattr(os, "getuid"):
+        # No owner/mode bits (Windows); the directory ACLs apply
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _load_artifact(artifact_path: str, verbose: bool = False):
+    """Load a compiled artifact; None if missing, unreadable or not private to the user."""
+    try:
+        if not _is_private(os.path.dirname(artifact_path)) or not _is_private(artifact_path):
+            if verbose:
+                print(f"Not loading the rules artifact {artifact_path}: it must be private to the user")
+            return None
+        with open(artifact_path, 'rb') as file, _gc_paused():
+            matcher = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Corrupted/incompatible artifact; build it again
+        if verbose:
+            print(f"Could not load the rules artifact {artifact_path}: {e}")
+        return None
+    return matcher if isinstance(matcher, KeywordMatcher) else None
+
+
+def _save_artifact(artifact_path: str, matcher: KeywordMatcher, verbose: bool = False):
+    """
+    Write a compiled artifact (atomically, so parallel workers can share the directory); only in a
+    directory private to the user (the file is created with mode 0o600).
+    """
+    folder = os.path.dirname(artifact_path)
+    try:
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        if not _is_private(folder):
+            if verbose:
+                print(f"Not writing the rules artifact {artifact_path}: {folder} must be private to the user")
+            return
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                pickle.dump(matcher, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, artifact_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except OSError as e:
+        # The artifact is only an optimization
+        if verbose:
+            print(f"Could not write the rules artifact {artifact_path}: {e}")
@@ -0,0 +1,189 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: ScanCache Class;
+    Persistent on-disk cache of the `FindKeyword.find()` results, so that unchanged documents
+    are not scanned again between runs.
+@note: The cache key is the hash of the file content, the keywords, the extractor version and the
+    scan options (see `FindKeyword.cache_options`); so any change to one of them is a cache miss.
+    Entries are written atomically (temp file + rename), so parallel workers can share the cache.
+    The least recently used entries are evicted when the cache grows over `max_size_mb`, down to
+    `LOW_WATER` of it; the total size is kept up to date by each put, so the cache directory is only
+    listed when it has to be evicted (not on every put). With several processes sharing the cache,
+    each one counts its own writes since it last listed the directory, so the limit is approximate.
+"""
+
+
+import hashlib
+import json
+import os
+import tempfile
+
+from src.core.hits import HitList
+
+
+# The eviction removes the least recently used entries down to this fraction of the maximum size,
+# so that the next puts do not evict again at once
+LOW_WATER = 0.9
+
+
+class ScanCache:
+    def __init__(self, cache_dir: str = "./out/scan_cache", max_size_mb: float = 256, verbose: bool = False):
+        self.cache_dir = cache_dir
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+        # The total size (bytes) of the entries; listed on the first put, then updated by each put
+        self.size = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """Return the sha256 of the file content."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def keywords_hash(keywords: list) -> str:
+        """Return the sha256 of the keyword set."""
+        return hashlib.sha256("\n".join(keywords).encode("utf-8")).hexdigest()
+
+    def key(self, src_file: str, keywords: list, options: dict, data: bytes = None) -> str:
+        """Build the cache key of a file scan; hashes the given content (e.g. prefetched) instead of reading the file."""
+        parts = {
+            "file": hashlib.sha256(data).hexdigest() if data is not None else self.file_hash(src_file),
+            "keywords": self.keywords_hash(keywords),
+            "options": options,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def __entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str):
+        """Return the cached `(issue_counter, file_data)` for the key, or None."""
+        entry_path = self.__entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as file:
+                issue_counter, file_data = json.load(file)
+
+            # Mark the entry as recently used (LRU)
+            os.utime(entry_path)
+
+        except (OSError, ValueError):
+            # Missing, evicted by another worker or corrupted entry; scan again
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return issue_counter, file_data
+
+    def put(self, key: str, result: tuple):
+        """Store the `(issue_counter, file_data)` for the key."""
+        entry_path = self.__entry_path(key)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                issue_counter, file_data = result
+                json.dump([issue_counter, [dict(hit) for hit in file_data]], file)
+
+            # The size added to the cache (an existing entry of the key is replaced)
+            added = os.path.getsize(tmp_path)
+            try:
+                added -= os.path.getsize(entry_path)
+            except OSError:
+                pass
+
+            # Atomic; readers see either the old or the new entry, never a partial one
+            os.replace(tmp_path, entry_path)
+
+        except OSError as e:
+            if self.verbose:
+                print(f"Unable to write the scan cache entry {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        if self.size is None or self.size + added > self.max_size:
+            self.evict()
+        else:
+            self.size += added
+
+    def evict(self):
+        """
+        List the entries and, if the cache is over `max_size_mb`, remove the least recently used ones
+        until it fits in `LOW_WATER` of it; the total size is updated from the listing.
+        """
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        if total_size > self.max_size:
+            for _, size, entry_path in sorted(entries):
+                if total_size <= self.max_size * LOW_WATER:
+                    break
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    # Already removed by another worker
+                    pass
+                total_size -= size
+
+        self.size = total_size
+
+    def clear(self):
+        """Remove all the cache entries."""
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith((".json", ".tmp")):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+        self.size = 0
+
+
+def cached_find(find_keyword, cache: ScanCache = None) -> tuple:
+    """
+    Return `find_keyword.find()`, from the cache when the file was already scanned with the same
+    keywords and options. Only successful scans (issue_counter >= 0) are cached.
+
+    Args:
+        find_keyword (FindKeyword): The keyword finder for the file.
+        cache (ScanCache): The cache; None to always scan.
+    """
+    if cache is None:
+        return find_keyword.find()
+
+    try:
+        key = cache.key(find_keyword.src_file, find_keyword.keywords, find_keyword.cache_options(),
+                        data=find_keyword.src_data)
+    except OSError:
+        # Unreadable file; let the finder report it
+        return find_keyword.find()
+
+    result = cache.get(key)
+    if result is not None:
+        # The key is content based; the same content may have been scanned under another path
+        issue_counter, file_data = result
+        file_data = list(HitList.from_dicts(find_keyword.src_file, file_data, keywords=find_keyword.keywords))
+        find_keyword.metrics.count("cache_hits")
+        return issue_counter, file_data
+
+    result = find_keyword.find()
+    if isinstance(result, tuple) and result[0] >= 0:
+        cache.put(key, result)
+    return result
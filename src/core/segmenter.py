@@ -0,0 +1,269 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Sentence segmenter;
+    Splits a text into sentences as `(start, end)` spans over the text, instead of a list of strings.
+@note: The keywords are matched once over the whole (normalized) text and the matches are mapped back
+    to their sentence with bisect; a sentence string is only built for the sentences having a match.
+    The results are the same as splitting with `re.split(SENTENCE_SPLIT_REGEX, text)` and matching each
+    sentence normalized with `" ".join(s.strip() for s in sentence.splitlines())`.
+"""
+
+
+import re
+from bisect import bisect_right
+
+from src.utilities.instrumentation import NULL_METRICS
+
+
+# Split a text into sentences (on whitespace after '.' or '?', but not after abbreviations like 'e.g.' or 'Mr.')
+SENTENCE_SPLIT_REGEX = r'(?<!\W\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s'
+
+# The same split, matching the '.' or '?' before the whitespace (the regex then starts with a char set, which
+# is searched much faster than lookbehinds at every position); the split position is the end of the match - 1
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.?](?<!\W\.\w.)(?<![A-Z][a-z]\.)\s')
+
+# The longest lookbehind of the sentence split regex
+SENTENCE_SPLIT_CONTEXT = 4
+
+# The longest text (chars) carried over to the next block; a longer unfinished sentence (e.g. a table
+# or a code listing without any '.'/'?') is closed at the end of the block, so that the memory and the
+# work per block stay bounded
+MAX_CARRY_OVER = 16 * 1024
+
+# The line boundaries of `str.splitlines`
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+LINE_BREAK_PATTERN = re.compile(f"\r\n|[{_LINE_BREAKS}]")
+
+# A whitespace run of 2 chars or more (a single line boundary char is only translated to a space)
+WHITESPACE_RUN_PATTERN = re.compile(r"\s\s+")
+LINE_BREAK_TRANSLATION = str.maketrans(_LINE_BREAKS, " " * len(_LINE_BREAKS))
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Join the lines of a sentence with a space (each line stripped)."""
+    return " ".join(s.strip() for s in sentence.splitlines())
+
+
+class SentenceSpans:
+    """
+    The sentences of `text[start:]` as spans over the text and over the normalized text.
+    Within a sentence, the normalized text is the same as the normalized sentence (apart from leading and
+    trailing whitespace): each whitespace run with n line breaks is replaced by n spaces.
+
+    Args:
+        text (str): The text to split.
+        start (int): Split from this position; the text before it is only used as the split regex lookbehind.
+    Example:
+        >>> spans = SentenceSpans(page_text)
+        >>> for index, keyword_ids in spans.match(matcher):
+        >>>     print(index + 1, spans.sentence(index), keyword_ids)
+    """
+    __slots__ = ("text", "normalized", "starts", "ends", "normalized_starts", "normalized_ends")
+
+    def __init__(self, text: str, start: int = 0):
+        self.text = text
+
+        # The sentence spans over the text; the separator (one whitespace) is not part of any sentence
+        # (the split pattern also matches the char before the separator, which may be just before `start`)
+        separators = [match.end() - 1 for match in SENTENCE_SPLIT_PATTERN.finditer(text, max(start - 1, 0))]
+        self.starts = [start] + [separator + 1 for separator in separators]
+        self.ends = separators + [len(text)]
+
+        # The normalized text, and the same spans over it
+        # (a single line boundary char becomes a space in place, only the other runs change the positions)
+        runs = []
+        pieces = []
+        position = start
+        for match in WHITESPACE_RUN_PATTERN.finditer(text, start):
+            run = match.group()
+            line_breaks = len(LINE_BREAK_PATTERN.findall(run))
+            if not line_breaks or line_breaks == len(run):
+                # No line boundary (kept as is), or only single line boundary chars (translated)
+                continue
+            run_start, run_end = match.span()
+            runs.append((run_start, run_end, line_breaks))
+            pieces.append(text[position:run_start])
+            pieces.append(" " * line_breaks)
+            position = run_end
+        pieces.append(text[position:])
+
+        self.normalized = "".join(pieces).translate(LINE_BREAK_TRANSLATION)
+        self.normalized_starts = self.__map_positions(self.starts, runs, start)
+        self.normalized_ends = self.__map_positions(self.ends, runs, start)
+
+    @staticmethod
+    def __map_positions(positions: list, runs: list, start: int) -> list:
+        """Map the (sorted) text positions to normalized text positions."""
+        mapped = []
+        run_index = 0
+        shift = -start    # normalized position - text position, before the current run
+        for position in positions:
+            # Skip the runs ending before the position
+            while run_index < len(runs) and runs[run_index][1] <= position:
+                run_start, run_end, line_breaks = runs[run_index]
+                shift += line_breaks - (run_end - run_start)
+                run_index += 1
+
+            if run_index < len(runs) and runs[run_index][0] <= position:
+                # Inside a run; clamp to the spaces replacing it
+                run_start, _, line_breaks = runs[run_index]
+                mapped.append(run_start + min(position - run_start, line_breaks) + shift)
+            else:
+                mapped.append(position + shift)
+        return mapped
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def sentence(self, index: int) -> str:
+        """Return the (normalized) sentence string."""
+        return normalize_sentence(self.text[self.starts[index]:self.ends[index]])
+
+    def match(self, matcher, stop: int = None) -> list:
+        """
+        Match the keywords once over the whole text.
+
+        Args:
+            matcher (KeywordMatcher): The keyword matcher.
+            stop (int): Only the sentences before this index (default: all).
+        Returns:
+            list: `(sentence index, sorted keyword ids)` for each sentence having a match, in sentence order.
+        """
+        stop = len(self) if stop is None else stop
+        found = {}
+        if matcher.always:
+            # An empty keyword is in every sentence
+            found = {index: set(matcher.always) for index in range(stop)}
+
+        # The match offsets are over the normalized text itself (also when lowering changes its length)
+        for match_start, match_end, keyword_id in matcher.iter_matches(self.normalized):
+            index = bisect_right(self.normalized_starts, match_start) - 1
+            # A match crossing the end of a sentence is not in the sentence
+            if 0 <= index < stop and match_end <= self.normalized_ends[index]:
+                found.setdefault(index, set()).add(keyword_id)
+
+        # The regex rules are searched within each sentence
+        if matcher.regex_patterns:
+            for index in range(stop):
+                for _, _, keyword_id in matcher.iter_regex_matches(self.normalized, self.normalized_starts[index],
+                                                                   self.normalized_ends[index]):
+                    found.setdefault(index, set()).add(keyword_id)
+
+        return [(index, sorted(found[index])) for index in sorted(found)]
+
+
+class SentenceBlocks:
+    """
+    Finds the keywords in a text given block by block (see `iter_sentence_matches`), one step per block.
+    The matching of a block (`match_block`) only depends on the block text and on the `state` (the text
+    carried over from the previous blocks), and is separated from the numbering of its sentences (`advance`);
+    so the result of a block can be cached and reused (e.g. the unchanged pages of a PDF).
+    The text carried over is at most `max_carry_over` chars: a longer unfinished sentence is closed at the
+    end of its block (a keyword crossing that cut is not found), instead of being segmented and matched
+    again with every following block.
+
+    Args:
+        matcher (KeywordMatcher): The keyword matcher.
+        all_sentences (bool): Also return the sentences without a match (e.g. verbose mode).
+        metrics (ScanMetrics): Times the segmentation and matching, counts the sentences (optional).
+        max_carry_over (int): The longest unfinished sentence (chars) carried over to the next block.
+    Example:
+        >>> sentences = SentenceBlocks(matcher)
+        >>> for page_text in page_texts:
+        >>>     matches = sentences.feed(page_text)
+        >>> matches = sentences.finish()
+    """
+
+    def __init__(self, matcher, all_sentences: bool = False, metrics=None, max_carry_over: int = MAX_CARRY_OVER):
+        self.matcher = matcher
+        self.all_sentences = all_sentences
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.max_carry_over = max_carry_over
+        self.block_index = 0
+        self.sentence_number = 1
+        self.carry_over, self.carry_over_block = "", 0
+        self.context = ""        # The text before the carried over sentence (split regex lookbehind)
+
+    @property
+    def state(self) -> tuple:
+        """The `(context, carried over sentence)` input of the next block, besides its text."""
+        return self.context, self.carry_over
+
+    def match_block(self, block: str) -> tuple:
+        """
+        Match the next block, with the text carried over; the state is not changed (see `advance`).
+        Returns:
+            tuple: `(complete sentences, [(index, keyword ids, sentence)], carry over, context)`; the index
+                   is the one of the sentence among the complete sentences of the block.
+        """
+        buffer = self.context + self.carry_over + block
+        with self.metrics.stage("segmentation"):
+            spans = SentenceSpans(buffer, start=len(self.context))
+
+        # All the sentences but the last one are complete; the last one too when it is too long to carry over
+        complete = len(spans) - 1
+        if len(buffer) - spans.starts[-1] > self.max_carry_over:
+            complete = len(spans)
+        with self.metrics.stage("matching"):
+            found = dict(spans.match(self.matcher, stop=complete))
+        self.metrics.count("sentences", complete)
+        matches = [(index, list(found.get(index, [])), spans.sentence(index))
+                   for index in range(complete) if index in found or self.all_sentences]
+
+        last_start = spans.starts[-1] if complete < len(spans) else len(buffer)
+        return complete, matches, buffer[last_start:], buffer[max(last_start - SENTENCE_SPLIT_CONTEXT, 0):last_start]
+
+    def advance(self, result: tuple) -> list:
+        """
+        Number the matches of the next block (a `match_block` result) and move to the following block.
+        Returns:
+            list: `(sentence number, block index the sentence starts in, sorted keyword ids, sentence)` tuples.
+        """
+        complete, matches, carry_over, context = result
+        first_block = self.carry_over_block if self.carry_over else self.block_index
+        numbered = [(self.sentence_number + index, first_block if index == 0 else self.block_index, keyword_ids, sentence)
+                    for index, keyword_ids, sentence in matches]
+
+        self.sentence_number += complete
+        self.carry_over_block = first_block if not complete else self.block_index
+        self.carry_over, self.context = carry_over, context
+        self.block_index += 1
+        return numbered
+
+    def feed(self, block: str) -> list:
+        """Match the next block; returns its numbered matches (see `advance`)."""
+        return self.advance(self.match_block(block))
+
+    def finish(self) -> list:
+        """Match the last sentence (carried over); returns its numbered match, if any."""
+        with self.metrics.stage("segmentation"):
+            spans = SentenceSpans(self.context + self.carry_over, start=len(self.context))
+        with self.metrics.stage("matching"):
+            found = dict(spans.match(self.matcher))
+        self.metrics.count("sentences")
+        if 0 in found or self.all_sentences:
+            return [(self.sentence_number, self.carry_over_block, found.get(0, []), spans.sentence(0))]
+        return []
+
+
+def iter_sentence_matches(blocks, matcher, all_sentences: bool = False, metrics=None):
+    """
+    Find the keywords in a text given in blocks (e.g. PDF pages, parsed HTML chunks), block by block.
+    The last (unfinished) sentence of a block is carried over to the next block, so sentences crossing
+    blocks are matched as a whole. The result is the same as for `SentenceSpans("".join(blocks))`,
+    as long as no sentence is longer than `MAX_CARRY_OVER` (see `SentenceBlocks`).
+
+    Args:
+        blocks (iterable): The text blocks.
+        matcher (KeywordMatcher): The keyword matcher.
+        all_sentences (bool): Also yield the sentences without a match (e.g. verbose mode).
+        metrics (ScanMetrics): Times the segmentation and matching, counts the sentences (optional).
+    Yields:
+        tuple: `(sentence number, block index the sentence starts in, sorted keyword ids, sentence)`.
+    """
+    sentences = SentenceBlocks(matcher, all_sentences=all_sentences, metrics=metrics)
+    for block in blocks:
+        yield from sentences.feed(block)
+    yield from sentences.finish()
@@ -0,0 +1,177 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Text scanner;
+    Memory-mapped, chunked keyword scan of (very large) plain-text files.
+@note: The file is never read as a whole; it is scanned chunk by chunk (cut at line ends when possible)
+    and the scanned pages are released, so the memory stays flat regardless of the file size.
+    A line longer than a chunk is scanned in overlapping chunks, so keywords crossing a chunk boundary
+    are still found. Each chunk has its own newline index (text and byte positions), used to map
+    the matches back to their line number and byte offset.
+"""
+
+
+import mmap
+import os
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+# Default chunk size (bytes)
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _newline_index(data) -> list:
+    """Return the positions of all the newlines in the text/bytes."""
+    newline = "\n" if isinstance(data, str) else b"\n"
+    positions = []
+    position = data.find(newline)
+    while position != -1:
+        positions.append(position)
+        position = data.find(newline, position + 1)
+    return positions
+
+
+def _char_boundary(file_map, position: int, lowest: int) -> int:
+    """Move the byte position back to the start of a UTF-8 character (at most 3 bytes, not below lowest)."""
+    for _ in range(3):
+        if position <= lowest or file_map[position] & 0xC0 != 0x80:
+            break
+        position -= 1
+    return position
+
+
+def _release_pages(file_map, released: int, position: int) -> int:
+    """Release the (page aligned) mapped memory from `released` up to `position`; returns the new released offset."""
+    position -= position % mmap.PAGESIZE
+    if position > released and isinstance(file_map, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED"):
+        file_map.madvise(mmap.MADV_DONTNEED, released, position - released)
+        return position
+    return released
+
+
+@contextmanager
+def _open_buffer(src_file: str, data: bytes = None):
+    """The bytes to scan: the given (prefetched) data, else the memory-mapped file; None if empty."""
+    if data is not None:
+        yield data or None
+        return
+
+    with open(src_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield None
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+            yield file_map
+
+
+def iter_text_matches(src_file: str, matcher, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8",
+                      data: bytes = None):
+    """
+    Yield the keywords found in each line of the text file, line by line.
+
+    Args:
+        src_file (str): The text file path.
+        matcher (KeywordMatcher): The keyword matcher.
+        chunk_size (int): The number of bytes scanned at once.
+        encoding (str): The file encoding; undecodable bytes are replaced.
+        data (bytes): The content of the file, if already read (e.g. prefetched); else the file is memory-mapped.
+    Yields:
+        tuple: `(line_number, byte_offset, keyword_id, sentence)` once per keyword found in a line;
+               the byte offset is the first occurrence of the keyword in the line and the sentence
+               is the (stripped) line. Empty lines are skipped.
+    """
+    # A keyword crossing a chunk boundary is fully inside the overlap of the next chunk
+    overlap = max((len(pattern.encode(encoding)) for pattern in matcher.pattern_ids), default=1) - 1
+    chunk_size = max(chunk_size, overlap + 8)
+
+    with _open_buffer(src_file, data) as file_map:
+        if file_map is None:
+            return
+
+        size = len(file_map)
+        start = 0
+        line_number = 1
+        line_start = 0          # Byte offset of the current line (may have started in an earlier chunk)
+        line_hits = {}          # keyword_id -> byte offset; found in the current line in earlier chunks
+        released = 0            # The pages before this byte offset were released
+
+        while start < size:
+            end = min(start + chunk_size, size)
+            line_ended = True
+            if end < size:
+                newline = file_map.rfind(b"\n", start, end)
+                if newline != -1:
+                    end = newline + 1
+                else:
+                    # The whole chunk is inside one (long) line; cut it on a character boundary
+                    line_ended = False
+                    end = _char_boundary(file_map, end, start + 1)
+
+            chunk = file_map[start:end]
+            text = chunk.decode(encoding, errors="replace")
+            text_newlines, byte_newlines = _newline_index(text), _newline_index(chunk)
+
+            # Find all the keywords in the chunk at once; keep the first occurrence per line segment
+            segment_hits = {}
+            for match_start, _, keyword_id in matcher.iter_matches(text):
+                hits = segment_hits.setdefault(bisect_left(text_newlines, match_start), {})
+                if match_start < hits.get(keyword_id, match_start + 1):
+                    hits[keyword_id] = match_start
+
+            # The line segments of the chunk; the last one is unfinished unless the line ended
+            segment_count = len(text_newlines) + 1
+
+            # The regex rules are searched within each line segment
+            if matcher.regex_patterns:
+                for segment in range(segment_count):
+                    text_start = text_newlines[segment - 1] + 1 if segment else 0
+                    text_end = text_newlines[segment] if segment < segment_count - 1 else len(text)
+                    for match_start, _, keyword_id in matcher.iter_regex_matches(text, text_start, text_end):
+                        hits = segment_hits.setdefault(segment, {})
+                        if match_start < hits.get(keyword_id, match_start + 1):
+                            hits[keyword_id] = match_start
+
+            for segment in range(segment_count):
+                text_start = text_newlines[segment - 1] + 1 if segment else 0
+                byte_start = start + (byte_newlines[segment - 1] + 1 if segment else 0)
+                last_segment = segment == segment_count - 1
+
+                hits = line_hits if segment == 0 else {}
+                for keyword_id, match_start in segment_hits.get(segment, {}).items():
+                    byte_offset = byte_start + len(text[text_start:match_start].encode(encoding))
+                    hits[keyword_id] = min(hits.get(keyword_id, byte_offset), byte_offset)
+
+                if last_segment and not (line_ended and end == size):
+                    # Continues in the next chunk (or is the empty start of the next line)
+                    line_hits = hits
+                    break
+
+                text_end = text_newlines[segment] if not last_segment else len(text)
+                if segment == 0 and line_start < start:
+                    sentence = file_map[line_start:start + byte_newlines[0] if byte_newlines else end]
+                    sentence = sentence.decode(encoding, errors="replace").strip()
+                else:
+                    sentence = text[text_start:text_end].strip()
+
+                # Skip empty lines
+                if sentence:
+                    for keyword_id in matcher.always:
+                        hits.setdefault(keyword_id, line_start if segment == 0 else byte_start)
+                    for keyword_id in sorted(hits):
+                        yield line_number, hits[keyword_id], keyword_id, sentence
+
+                line_number += 1
+                line_start = start + byte_newlines[segment] + 1 if not last_segment else end
+                line_hits = {}
+
+            # Next chunk; a long line is continued with an overlap (on a character boundary)
+            if line_ended or end == size:
+                start = end
+            else:
+                start = _char_boundary(file_map, max(end - overlap, start + 1), start + 1)
+
+            # Drop the scanned pages from the process memory (they are read again from the file if needed)
+            released = _release_pages(file_map, released, start)
@@ -0,0 +1,200 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: File discovery;
+    Walks the target directory once (with `os.scandir`) for one or more file extensions,
+    with include/exclude glob patterns, and keeps a manifest of the files' mtime/size.
+@note: The manifest lets a later run list only the files that are new or changed since they were
+    last scanned clean (`FileManifest.changed`); the directory is still walked, but the unchanged files
+    are not scanned again. The manifest is ignored when its fingerprint (e.g. the keywords) changes.
+"""
+
+
+import fnmatch
+import json
+import os
+
+from src.utilities.utilities import atomic_write_json
+
+
+def parse_extensions(file_ext) -> list:
+    """
+    Parse the file extensions given as "html,pdf,txt" (or a list); lowercase, without the leading dot.
+    Example:
+        >>> parse_extensions("html, .PDF")
+        ['html', 'pdf']
+    """
+    if isinstance(file_ext, str):
+        file_ext = file_ext.split(",")
+
+    extensions = []
+    for extension in file_ext:
+        extension = extension.strip().lstrip(".").lower()
+        if extension and extension not in extensions:
+            extensions.append(extension)
+    return extensions
+
+
+def file_ext_for(src_file: str, file_ext: str) -> str:
+    """Return the file type to scan a file as; its own extension when several extensions are given."""
+    extensions = parse_extensions(file_ext)
+    if len(extensions) == 1:
+        return extensions[0]
+    return os.path.splitext(src_file)[1].lstrip(".").lower()
+
+
+class FileDiscovery:
+    """
+    Lists the files of a directory tree having one of the given extensions.
+
+    Args:
+        root (str): The directory to search in.
+        file_ext (str|list): The file extension(s), e.g. "html" or "html,pdf,txt" (case-insensitive).
+        include (list): Glob patterns; only the files matching one of them are listed (default: all).
+        exclude (list): Glob patterns; the files and directories matching one of them are skipped.
+        recursive (bool): Also search the sub directories (default: True).
+    @note: A pattern is matched against the path relative to `root` (with '/' separators) and against
+        the file/directory name, e.g. "drafts", "*/archive/*" or "*_old.html".
+        Symbolic links to directories are not followed (no loops).
+        The hidden files and directories (name starting with '.', e.g. .git, .venv) are skipped, as by
+        `glob`; unless an include pattern names them, e.g. ".github/*" or ".*.html" (not "*.html").
+    Example:
+        >>> discovery = FileDiscovery("./docs", "html,pdf", exclude=["drafts"])
+        >>> files = discovery.files()
+    """
+
+    def __init__(self, root: str, file_ext="html", include: list = None, exclude: list = None, recursive: bool = True):
+        self.root = root
+        self.extensions = tuple(f".{extension}" for extension in parse_extensions(file_ext))
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.recursive = recursive
+        self._stats = None
+
+    def __matches(self, patterns: list, relative_path: str, name: str) -> bool:
+        """Check if a path matches one of the glob patterns."""
+        return any(fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+    def __hidden_included(self, relative_path: str, is_dir: bool) -> bool:
+        """Check if a hidden file/directory is named by an include pattern (a pattern with a '.' name)."""
+        for pattern in self.include:
+            if not any(part.startswith(".") for part in pattern.split("/")):
+                continue
+            if self.__matches([pattern], relative_path, relative_path.rsplit("/", 1)[-1]):
+                return True
+            # A directory containing the included files
+            if is_dir and pattern.startswith(f"{relative_path}/"):
+                return True
+        return False
+
+    def walk(self):
+        """
+        Walk the directory tree once (sorted, the files of a directory before its sub directories).
+        Yields:
+            tuple: `(path, (mtime_ns, size))` for each file found.
+        """
+        if not os.path.isdir(self.root):
+            print(f"\nFolder '{self.root}' does not exist.")
+            return
+
+        stack = [(self.root, "")]
+        while stack:
+            folder, relative_folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError as e:
+                print(f"\nCould not list folder '{folder}': {e}")
+                continue
+
+            sub_folders = []
+            for entry in entries:
+                relative_path = f"{relative_folder}{entry.name}"
+                if self.__matches(self.exclude, relative_path, entry.name):
+                    continue
+
+                try:
+                    if entry.name.startswith(".") and \
+                            not self.__hidden_included(relative_path, entry.is_dir(follow_symlinks=False)):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            sub_folders.append((entry.path, f"{relative_path}/"))
+                        continue
+
+                    if not entry.name.lower().endswith(self.extensions) or not entry.is_file():
+                        continue
+                    if self.include and not self.__matches(self.include, relative_path, entry.name):
+                        continue
+
+                    stat = entry.stat()
+                except OSError as e:
+                    print(f"\nCould not read '{entry.path}': {e}")
+                    continue
+
+                yield entry.path, (stat.st_mtime_ns, stat.st_size)
+
+            # Depth first, in name order
+            stack.extend(reversed(sub_folders))
+
+    def stats(self) -> dict:
+        """The `{path: (mtime_ns, size)}` of the files found; the tree is only walked once."""
+        if self._stats is None:
+            self._stats = dict(self.walk())
+        return self._stats
+
+    def files(self) -> list:
+        """The files found (in walk order)."""
+        return list(self.stats())
+
+
+class FileManifest:
+    """
+    The persisted mtime/size of the files scanned clean in a previous run.
+
+    Args:
+        manifest_file (str): The manifest JSON file.
+        fingerprint (str): Identifies the scan settings (e.g. the keywords hash); a manifest saved with
+            another fingerprint is ignored, so that every file is listed again.
+    Example:
+        >>> manifest = FileManifest("./out/file_manifest.json", fingerprint=keywords_hash)
+        >>> files = manifest.changed(discovery.stats())
+        >>> manifest.update(src_file, discovery.stats()[src_file])
+        >>> manifest.save()
+    """
+
+    def __init__(self, manifest_file: str, fingerprint: str = ""):
+        self.manifest_file = manifest_file
+        self.fingerprint = fingerprint
+        self.files = self.load()
+
+    def load(self) -> dict:
+        """Load the manifest; empty if missing, unreadable or saved with another fingerprint."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            return {}
+        return {path: tuple(stat) for path, stat in data.get("files", {}).items()}
+
+    def changed(self, stats: dict) -> list:
+        """The files that are new or changed (mtime/size) since they were added to the manifest."""
+        return [path for path, stat in stats.items() if self.files.get(path) != tuple(stat)]
+
+    def update(self, path: str, stat: tuple):
+        """Add (or update) a file scanned clean."""
+        self.files[path] = tuple(stat)
+
+    def remove(self, path: str):
+        """Remove a file, so that it is listed again by the next run."""
+        self.files.pop(path, None)
+
+    def save(self):
+        """Write the manifest (see `atomic_write_json`)."""
+        data = {"fingerprint": self.fingerprint, "files": {path: list(stat) for path, stat in self.files.items()}}
+        atomic_write_json(self.manifest_file, data)
@@ -0,0 +1,175 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Scan instrumentation;
+    Timers and counters around each stage of a document scan (open, parse/extraction, segmentation,
+    matching), with an optional cProfile or tracemalloc capture of the whole scan.
+@note: `FindKeyword` uses `NULL_METRICS` by default, whose methods do nothing, so the instrumentation
+    costs (almost) nothing when it is not enabled. Only whole stages are timed (per file, page or
+    text block), never single sentences. The timer can be replaced (`clock`), or `record` overridden
+    to send the timings elsewhere.
+"""
+
+
+import time
+from contextlib import contextmanager
+
+# Supported profile capture modes
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+
+class ScanMetrics:
+    """
+    Collects the time spent in each stage of a scan and the counters (pages, blocks, sentences, matches).
+
+    Args:
+        profile (str): Also capture a profile of the scan; "cprofile" (top functions) or "tracemalloc"
+            (peak Python memory and top allocations); None to only time the stages.
+        clock (callable): The timer function (default: `time.perf_counter`).
+        profile_limit (int): The number of lines/allocations kept in the profile report.
+    Example:
+        >>> metrics = ScanMetrics(profile="cprofile")
+        >>> with metrics.capture():
+        >>>     FindKeyword(src_file="doc.pdf", keywords_file="keywords.txt", file_ext="pdf", metrics=metrics).find()
+        >>> print(metrics.as_dict(), metrics.profile_report)
+    """
+    enabled = True
+
+    def __init__(self, profile: str = None, clock=time.perf_counter, profile_limit: int = 20):
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode: {profile}; supported: {', '.join(PROFILE_MODES)}")
+        self.profile = profile
+        self.clock = clock
+        self.profile_limit = profile_limit
+        self.timings = {}
+        self.counters = {}
+        self.profile_report = None
+
+    def record(self, stage: str, seconds: float):
+        """Add the time spent in a stage."""
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    def count(self, counter: str, value: int = 1):
+        """Increment a counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    @contextmanager
+    def stage(self, stage: str):
+        """Time the block as the given stage (do not `yield` values of a generator inside it)."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self.clock() - start)
+
+    def timed(self, iterable, stage: str, counter: str = None):
+        """
+        Iterate the (lazy) iterable, timing the production of each item as the given stage;
+        the time spent by the consumer between the items is not counted.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = self.clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.record(stage, self.clock() - start)
+                return
+            self.record(stage, self.clock() - start)
+            if counter:
+                self.count(counter)
+            yield item
+
+    @contextmanager
+    def capture(self):
+        """Time the whole block as "total", and capture the profile of it (if enabled)."""
+        if self.profile == "cprofile":
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+        elif self.profile == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start()
+
+        try:
+            with self.stage("total"):
+                yield self
+        finally:
+            if self.profile == "cprofile":
+                profiler.disable()
+                self.profile_report = self.__cprofile_report(profiler)
+            elif self.profile == "tracemalloc":
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.counters["tracemalloc_peak_bytes"] = peak
+                self.profile_report = self.__tracemalloc_report(snapshot, peak)
+
+    def __cprofile_report(self, profiler) -> str:
+        import io
+        import pstats
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(self.profile_limit)
+        return output.getvalue()
+
+    def __tracemalloc_report(self, snapshot, peak: int) -> str:
+        lines = [f"Peak traced memory: {peak / (1024 * 1024):.2f} MB", "Top allocations (still allocated):"]
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:self.profile_limit])
+        return "\n".join(lines)
+
+    def merge(self, other: "ScanMetrics") -> "ScanMetrics":
+        """Add the timings and counters of another scan; returns self."""
+        for stage, seconds in other.timings.items():
+            self.record(stage, seconds)
+        for counter, value in other.counters.items():
+            self.count(counter, value)
+        return self
+
+    def as_dict(self) -> dict:
+        """The stage timings (seconds) and counters, e.g. for the report properties."""
+        return {
+            "timings": {stage: round(seconds, 6) for stage, seconds in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+    def properties(self, prefix: str = "scan_") -> list:
+        """The `(name, value)` pairs of the timings (`<prefix><stage>_s`) and counters, e.g. JUnit XML properties."""
+        pairs = [(f"{prefix}{stage}_s", round(seconds, 6)) for stage, seconds in self.timings.items()]
+        pairs.extend((f"{prefix}{counter}", value) for counter, value in self.counters.items())
+        return pairs
+
+    def format(self) -> str:
+        """A one line per stage/counter text summary."""
+        lines = [f"{stage:<14} {seconds * 1000:>10.2f} ms" for stage, seconds in self.timings.items()]
+        lines.extend(f"{counter:<14} {value:>10}" for counter, value in self.counters.items())
+        return "\n".join(lines)
+
+
+class NullMetrics(ScanMetrics):
+    """Disabled instrumentation; nothing is timed or counted."""
+    enabled = False
+
+    def __init__(self):
+        super().__init__()
+
+    def record(self, stage: str, seconds: float):
+        pass
+
+    def count(self, counter: str, value: int = 1):
+        pass
+
+    @contextmanager
+    def stage(self, stage: str):
+        yield
+
+    def timed(self, iterable, stage: str, counter: str = None):
+        return iterable
+
+    @contextmanager
+    def capture(self):
+        yield self
+
+
+# The shared disabled instrumentation (default of `FindKeyword`)
+NULL_METRICS = NullMetrics()
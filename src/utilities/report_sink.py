@@ -0,0 +1,168 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Report sinks;
+    Buffered, batched writers for the keyword search reports (CSV, JSON Lines, optionally gzip-compressed).
+@note: The report file is opened once; the rows are buffered and written in batches.
+    Each batch is written with a single write under an exclusive file lock, so many files/workers
+    can append to the same report without interleaving their rows.
+    Gzip reports are written as one gzip member per batch (concatenated members are a valid gzip file).
+"""
+
+
+import csv
+import gzip
+import io
+import json
+import os
+from collections.abc import Mapping
+
+try:
+    import fcntl
+except ImportError:
+    # Windows; no advisory file locks
+    fcntl = None
+
+
+class ReportSink:
+    """
+    Base class for the report sinks.
+
+    Args:
+        file_path (str): The report file path; a '.gz' suffix compresses the report.
+        fields (list): The report columns (default: the keys of the first row).
+        mode (str): 'w' to overwrite the report, 'a' to append to it.
+        batch_size (int): The number of rows buffered before they are written.
+    Example:
+        >>> with open_report_sink("./out/find_keyword_issues.csv", mode="w") as sink:
+        >>>     sink.write_rows(data)
+    """
+    format = None
+
+    def __init__(self, file_path: str, fields: list = None, mode: str = 'w', batch_size: int = 1000):
+        if mode not in ('w', 'a'):
+            raise ValueError(f"Unsupported report mode: {mode}; supported: w, a")
+
+        self.file_path = file_path
+        self.fields = list(fields) if fields else None
+        self.batch_size = batch_size
+        self.compress = file_path.endswith(".gz")
+        self.rows_written = 0
+        self.__rows = []
+
+        # Create the report folder if needed; the report file is opened once
+        folder_path = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(folder_path, exist_ok=True)
+        self.__file = open(file_path, 'wb' if mode == 'w' else 'ab')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_row(self, row: dict):
+        """Buffer a row; the buffer is written once it has `batch_size` rows."""
+        if not isinstance(row, Mapping):
+            raise TypeError(f"Expected a dict row, but got {type(row)}.")
+
+        if self.fields is None:
+            self.fields = list(row.keys())
+
+        self.__rows.append(row)
+        if len(self.__rows) >= self.batch_size:
+            self.flush()
+
+    def write_rows(self, rows: list):
+        """Buffer many rows."""
+        for row in rows:
+            self.write_row(row)
+
+    def flush(self):
+        """Write the buffered rows as one batch."""
+        if not self.__rows or self.__file.closed:
+            return
+
+        # Lock, then check if the report is still empty (a header may be needed)
+        self.__lock()
+        try:
+            self.__file.seek(0, os.SEEK_END)
+            data = self.render(self.__rows, header=self.__file.tell() == 0).encode("utf-8")
+            if self.compress:
+                data = gzip.compress(data)
+
+            self.__file.write(data)
+            self.__file.flush()
+        finally:
+            self.__unlock()
+
+        self.rows_written += len(self.__rows)
+        self.__rows = []
+
+    def close(self):
+        """Write the remaining rows and close the report file."""
+        if self.__file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.__file.close()
+
+    def render(self, rows: list, header: bool) -> str:
+        """Render a batch of rows to text."""
+        raise NotImplementedError
+
+    def __lock(self):
+        if fcntl is not None:
+            fcntl.flock(self.__file.fileno(), fcntl.LOCK_EX)
+
+    def __unlock(self):
+        if fcntl is not None:
+            fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+
+
+class CsvReportSink(ReportSink):
+    """CSV report (properly quoted); the header is written once, when the report is empty."""
+    format = "csv"
+
+    def render(self, rows: list, header: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.fields, restval="", extrasaction="ignore", lineterminator="\n")
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+
+class JsonLinesReportSink(ReportSink):
+    """JSON Lines report; one JSON object per row."""
+    format = "jsonl"
+
+    def render(self, rows: list, header: bool) -> str:
+        return "".join(json.dumps(dict(row), ensure_ascii=False) + "\n" for row in rows)
+
+
+# Available report sinks (format -> class)
+REPORT_SINKS = {
+    CsvReportSink.format: CsvReportSink,
+    JsonLinesReportSink.format: JsonLinesReportSink,
+}
+
+
+def open_report_sink(file_path: str, fields: list = None, mode: str = 'w', batch_size: int = 1000,
+                     report_format: str = None) -> ReportSink:
+    """
+    Open a report sink; the format is taken from the file extension (.csv, .jsonl, .csv.gz, .jsonl.gz)
+    unless `report_format` is given.
+
+    Raises:
+        ValueError: If the report format is not supported.
+    """
+    if report_format is None:
+        name = file_path[:-len(".gz")] if file_path.endswith(".gz") else file_path
+        report_format = os.path.splitext(name)[1].lstrip(".").lower()
+
+    if report_format not in REPORT_SINKS:
+        raise ValueError(f"Unsupported report format: {report_format}; supported: {', '.join(REPORT_SINKS)}")
+    return REPORT_SINKS[report_format](file_path, fields=fields, mode=mode, batch_size=batch_size)
@@ -0,0 +1,147 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: ScanReport Class;
+    Collects the keyword search results of a whole run (per file: hits, scan time, keyword frequencies)
+    in memory, and writes one consolidated report at the end of the run.
+@note: Partial reports (e.g. from other processes/machines) are combined with `merge`, they can be
+    saved/loaded as JSON with `save`/`load`; no report file is written by more than one process.
+"""
+
+
+import json
+import os
+from collections import Counter
+
+from src.core.hits import Hit, HitList, json_default
+from src.utilities.report_sink import open_report_sink
+
+
+class ScanReport:
+    """
+    Args:
+        matcher (KeywordMatcher): The keyword matcher, to count which keywords were found (optional).
+    Example:
+        >>> report = ScanReport(matcher=find_keyword.matcher)
+        >>> report.add(src_file, issue_counter, data, elapsed=0.12)
+        >>> report.write("./out")
+    """
+
+    def __init__(self, matcher=None):
+        self.matcher = matcher
+        self.files = {}
+        # Saved with a partial report, e.g. its shard (see `src/utilities/sharding.py`)
+        self.meta = {}
+
+    def add(self, src_file: str, issue_counter: int, file_data: list, elapsed: float = 0.0):
+        """Add the result of a file scan (`FindKeyword.find()`)."""
+        self.files[src_file] = {
+            "issue_counter": issue_counter,
+            "elapsed": round(elapsed, 6),
+            "keyword_counts": dict(self.__count_keywords(file_data)),
+            "hits": self.__compact_hits(src_file, file_data),
+        }
+
+    @staticmethod
+    def __compact_hits(src_file: str, file_data: list) -> list:
+        """The hits of a file scan; the `Hit`s are kept compactly (see `HitList`), the other dicts as they are."""
+        if isinstance(file_data, HitList):
+            return file_data
+        hits = list(file_data)
+        if not hits or not all(isinstance(hit, Hit) and hit.file == src_file for hit in hits):
+            return hits
+        compact_hits = HitList(src_file)
+        compact_hits.extend(hits)
+        return compact_hits
+
+    def __count_keywords(self, file_data: list) -> Counter:
+        """
+        Count the keywords found in the file; a sentence is listed once per keyword found in it.
+        The hits with their keyword (see `HitList`) are counted directly; the others need the matcher.
+        """
+        keyword_counts = Counter(hit["keyword"] for hit in file_data if hit.get("keyword") is not None)
+        if self.matcher is None:
+            return keyword_counts
+
+        seen = set()
+        for hit in file_data:
+            if hit.get("keyword") is not None:
+                continue
+            sentence_key = (hit.get("page"), hit.get("line"), hit.get("sentence"))
+            if sentence_key in seen:
+                continue
+            seen.add(sentence_key)
+            keyword_counts.update(self.matcher.find_keywords(hit.get("sentence", "")))
+        return keyword_counts
+
+    def merge(self, other: "ScanReport") -> "ScanReport":
+        """Add the files of another (partial) report; returns self."""
+        self.files.update(other.files)
+        return self
+
+    def summary(self) -> dict:
+        """Run level summary: totals, per file timing/hit counts and keyword frequencies."""
+        keyword_counts = Counter()
+        for file_result in self.files.values():
+            keyword_counts.update(file_result["keyword_counts"])
+
+        return {
+            "files": len(self.files),
+            "files_with_issues": sum(1 for result in self.files.values() if result["issue_counter"] > 0),
+            "files_with_errors": sum(1 for result in self.files.values() if result["issue_counter"] < 0),
+            "issues": sum(max(result["issue_counter"], 0) for result in self.files.values()),
+            "elapsed": round(sum(result["elapsed"] for result in self.files.values()), 6),
+            "keyword_counts": dict(keyword_counts.most_common()),
+            "per_file": {
+                src_file: {
+                    "issue_counter": result["issue_counter"],
+                    "elapsed": result["elapsed"],
+                    "keyword_counts": result["keyword_counts"],
+                }
+                for src_file, result in sorted(self.files.items())
+            },
+        }
+
+    def write(self, report_dir: str = "./out", issues_file: str = "find_keyword_issues.csv",
+              summary_file: str = "find_keyword_summary.json") -> tuple:
+        """
+        Write the consolidated issues report (all the hits of all the files) and the run summary.
+        Returns the `(issues report path, summary path)`.
+        """
+        os.makedirs(report_dir, exist_ok=True)
+        issues_path = os.path.join(report_dir, issues_file)
+        summary_path = os.path.join(report_dir, summary_file)
+
+        # The columns differ by document type (e.g. 'title' for HTML, 'page' for PDF)
+        fields = []
+        for file_result in self.files.values():
+            for hit in file_result["hits"]:
+                fields.extend(key for key in hit if key not in fields)
+
+        with open_report_sink(issues_path, fields=fields or None, mode='w') as sink:
+            for src_file in sorted(self.files):
+                sink.write_rows(self.files[src_file]["hits"])
+
+        with open(summary_path, 'w', encoding='utf-8') as file:
+            json.dump(self.summary(), file, indent=2)
+
+        return issues_path, summary_path
+
+    def save(self, partial_file: str):
+        """Save the (partial) report as JSON, with its metadata, to be merged later."""
+        os.makedirs(os.path.dirname(partial_file) or ".", exist_ok=True)
+        with open(partial_file, 'w', encoding='utf-8') as file:
+            # The compact hits (see `HitList`) are saved as a list of dicts
+            json.dump({"meta": self.meta, "files": self.files}, file, default=json_default)
+
+    @classmethod
+    def load(cls, partial_file: str, matcher=None) -> "ScanReport":
+        """Load a (partial) report saved with `save`."""
+        with open(partial_file, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+
+        report = cls(matcher=matcher)
+        report.files = data["files"]
+        report.meta = data.get("meta", {})
+        return report
@@ -0,0 +1,169 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Sharding;
+    Splits the files of a run into `shard_count` shards (e.g. one per CI node), balanced by the file size or
+    by the scan time of the previous runs (`ScanTimings`), and merges the partial reports of the shards.
+@note: The split is deterministic: every node computes the same shards from the same file list and
+    weights (the largest files first, each one to the least loaded shard; ties to the lowest shard index),
+    so the nodes do not need to talk to each other. The files must be listed with the same paths on all
+    the nodes (e.g. the same relative `--target_dir`).
+    With timings, a file without a recorded time (new file) is weighted by its size, converted to a time
+    with the average scan speed (bytes/s) of the recorded files.
+    Each shard saves a partial report (`ScanReport.save`, with the shard in its metadata); `merge_partial_reports`
+    combines them and checks that every shard of the run is there, once.
+"""
+
+
+import json
+
+from src.utilities.scan_report import ScanReport
+from src.utilities.utilities import atomic_write_json
+
+
+# Shard balancing strategies
+SHARD_BY = ("size", "timings")
+
+# The partial report files of the shards (see `partial_report_name`)
+PARTIAL_REPORT_PATTERN = "find_keyword_partial_*.json"
+
+
+def partial_report_name(shard_index: int, shard_count: int) -> str:
+    """The file name of the partial report of a shard (unique per shard, in a shared report directory)."""
+    return f"find_keyword_partial_{shard_index + 1}of{shard_count}.json"
+
+
+class ScanTimings:
+    """
+    The scan time (seconds) of each file in the previous runs, to balance the shards.
+
+    Args:
+        timings_file (str): The timings JSON file.
+    Example:
+        >>> timings = ScanTimings("./out/scan_timings.json")
+        >>> timings.update(scan_report)
+        >>> timings.save()
+    """
+
+    def __init__(self, timings_file: str):
+        self.timings_file = timings_file
+        self.files = self.load()
+
+    def load(self) -> dict:
+        """Load the timings; empty if missing or unreadable."""
+        try:
+            with open(self.timings_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        files = data.get("files", {}) if isinstance(data, dict) else {}
+        return {path: float(elapsed) for path, elapsed in files.items() if isinstance(elapsed, (int, float))}
+
+    def update(self, scan_report: ScanReport):
+        """Record the scan time of the files of a (merged) report; the files which failed are not recorded."""
+        for src_file, result in scan_report.files.items():
+            if result["issue_counter"] >= 0:
+                self.files[src_file] = result["elapsed"]
+
+    def save(self):
+        """Write the timings (see `atomic_write_json`)."""
+        atomic_write_json(self.timings_file, {"files": self.files})
+
+
+def file_weights(stats: dict, shard_by: str = "size", timings: dict = None) -> dict:
+    """
+    The weight of each file, to balance the shards.
+
+    Args:
+        stats (dict): `{path: (mtime_ns, size)}` of the files (see `FileDiscovery.stats`).
+        shard_by (str): "size" (bytes) or "timings" (seconds of the previous runs; estimated from the size
+            for the files without a recorded time).
+        timings (dict): `{path: seconds}` (see `ScanTimings`).
+    """
+    if shard_by not in SHARD_BY:
+        raise ValueError(f"Unsupported shard balancing: {shard_by}; supported: {', '.join(SHARD_BY)}")
+
+    # A file has a weight of at least 1 byte (empty files still cost a test)
+    sizes = {path: max(stat[1], 1) for path, stat in stats.items()}
+    timings = {path: elapsed for path, elapsed in (timings or {}).items() if path in sizes} if shard_by == "timings" else {}
+    if not timings:
+        return sizes
+
+    # The average scan time per byte of the files with a recorded time
+    seconds_per_byte = sum(timings.values()) / sum(sizes[path] for path in timings)
+    return {path: timings[path] if path in timings else size * seconds_per_byte for path, size in sizes.items()}
+
+
+def shard_files(files: list, shard_index: int, shard_count: int, weights: dict = None) -> list:
+    """
+    The files of one shard, in the given order.
+
+    Args:
+        files (list): All the files of the run (the same list on every node).
+        shard_index (int): The shard to return, from 0 to `shard_count - 1`.
+        shard_count (int): The number of shards.
+        weights (dict): `{path: weight}` (see `file_weights`); the files without a weight count as 1.
+    Example:
+        >>> shard_files(files, 0, 3, weights=file_weights(discovery.stats()))
+    """
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise ValueError(f"Invalid shard {shard_index} of {shard_count}; the index must be from 0 to {shard_count - 1}")
+    if shard_count == 1:
+        return list(files)
+
+    weights = weights or {}
+    loads = [0.0] * shard_count
+    assigned = set()
+    # The largest files first, each one to the least loaded shard (ties: the path, then the lowest shard)
+    for path in sorted(set(files), key=lambda path: (-weights.get(path, 1), path)):
+        shard = min(range(shard_count), key=lambda index: (loads[index], index))
+        loads[shard] += weights.get(path, 1)
+        if shard == shard_index:
+            assigned.add(path)
+
+    return [path for path in files if path in assigned]
+
+
+def merge_partial_reports(partial_files: list, matcher=None) -> tuple:
+    """
+    Merge the partial reports of the shards of a run.
+
+    Returns:
+        tuple: `(report, problems)`; the problems are the missing/duplicated shards, the shards of other
+            runs (another shard count or other keywords) and the files scanned by more than one shard.
+    Example:
+        >>> report, problems = merge_partial_reports(glob.glob("./out/find_keyword_partial_*.json"))
+        >>> report.write("./out")
+    """
+    report = ScanReport(matcher=matcher)
+    problems = []
+    shard_counts, keywords, seen_shards = set(), set(), {}
+
+    for partial_file in partial_files:
+        partial = ScanReport.load(partial_file, matcher=matcher)
+        shard = partial.meta.get("shard") or {}
+        if shard:
+            shard_counts.add(shard.get("count"))
+            if shard.get("index") in seen_shards:
+                problems.append(f"Shard {shard.get('index')} is in both {seen_shards[shard.get('index')]} and {partial_file}")
+            seen_shards[shard.get("index")] = partial_file
+        if partial.meta.get("keywords"):
+            keywords.add(partial.meta["keywords"])
+
+        duplicates = sorted(set(partial.files) & set(report.files))
+        if duplicates:
+            problems.append(f"{len(duplicates)} file(s) of {partial_file} are already in another partial report, "
+                            f"e.g. {duplicates[0]}")
+        report.merge(partial)
+
+    if len(shard_counts) > 1:
+        problems.append(f"The partial reports are of runs with different shard counts: {sorted(shard_counts, key=str)}")
+    elif shard_counts:
+        missing = sorted(set(range(next(iter(shard_counts)))) - set(seen_shards))
+        if missing:
+            problems.append(f"Missing the partial report of shard(s) {', '.join(str(index) for index in missing)}")
+    if len(keywords) > 1:
+        problems.append("The partial reports were scanned with different keywords")
+
+    return report, problems
@@ -1,7 +1,7 @@
 """
 @author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
 @created: 5 Jun 2025
-@last_modified: 06 Jun 2025
+@last_modified: 17 Oct 2026
 @desc: Utilities Class;
     Contains all the utilities for this automation framework.
 """
@@ -12,6 +12,29 @@ import platform
 import re
 
 
+def atomic_write_json(path: str, data):
+    """
+    Write the data as a JSON file atomically (to a temporary file, then renamed); an interrupted
+    write leaves the previous file, and the readers never see a partial one.
+    """
+    import json
+    import os
+    import tempfile
+
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 # Class: Utilities
 class Utilities:
     def __init__(self):
@@ -93,23 +116,8 @@ class Utilities:
             writer.writerows(data)
         
     def get_all_files_in_folder(self, folder_path, file_ext: str = "html", resursive=False) -> list:
-        import os
-        import glob
-        files: list = []
+        from src.utilities.file_discovery import FileDiscovery
 
-        # Check if the folder exists
-        if os.path.exists(folder_path):
-            if resursive:
-                # Get all files in the folder and subfolders recursively
-                files = glob.glob(os.path.join(folder_path, '**', f'*.{file_ext}'), recursive=True)
-            else:
-                # Get all files in the folder
-                files = glob.glob(os.path.join(folder_path, f'*.{file_ext}'))
-        
-        # The provided folder does not exist
-        else:
-            print(f"\nFolder '{folder_path}' does not exist.")
-
-        # Return the files in the folder
-        return files
-    
+        # Walk the folder once (with os.scandir) for the given extension(s), e.g. "html" or "html,pdf,txt"
+        # (prints a message and returns no files if the folder does not exist)
+        return FileDiscovery(folder_path, file_ext=file_ext, recursive=resursive).files()
@@ -1,6 +1,8 @@
 
 
-from src.utilities.utilities import Utilities
+from collections.abc import Mapping
+
+from src.utilities.report_sink import open_report_sink
 
 
 def write_csv_logs_for_keyword_search(csv_log_file, data: list, mode: str='w'):
@@ -8,22 +10,19 @@ def write_csv_logs_for_keyword_search(csv_log_file, data: list, mode: str='w'):
     Write logs to a specified csv log file.
 
     Args:
-        csv_log_file (str): The path to the log file.
-        data (str): The data to write to the log file.
+        csv_log_file (str): The path to the log file (.csv, .jsonl; optionally .gz compressed).
+        data (list): The data (list of dicts, e.g. the `FindKeyword.find()` hits) to write to the log file.
+        mode (str): 'w' to overwrite the log file, 'a' to append to it (the header is written once).
     """
 
-    # Write the header first
-    headers = data[0].keys() if data and isinstance(data[0], dict) else []
-    # print(f">>> Writing headers: {headers} to {csv_log_file} in mode: {mode}")
-    Utilities().write_text_file(csv_log_file, ", ".join(list(headers)), mode=mode)
-
-    # Write the data rows
-    for item in data:
-        if not isinstance(item, dict):
-            raise TypeError(f"Expected a list of data, but got {type(item)}. Please provide a list of lists.")
-        
-        row = [col[:80] if isinstance(col, str) and len(col) > 80 else str(col) for col in item.values()]
-        # print(f">>> Writing row: {row}")
-        Utilities().write_text_file(csv_log_file, ", ".join(list(row)), mode="a")
+    # The log file is opened once and the rows are written in batches (see report_sink.py)
+    with open_report_sink(csv_log_file, mode=mode) as sink:
+        for item in data:
+            if not isinstance(item, Mapping):
+                raise TypeError(f"Expected a list of data, but got {type(item)}. Please provide a list of lists.")
+
+            # Keep the log readable; long columns (sentences) are truncated
+            row = {key: col[:80] if isinstance(col, str) and len(col) > 80 else col for key, col in item.items()}
+            sink.write_row(row)
     
     print(f"Log written to {csv_log_file}")
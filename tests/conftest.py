@@ -0,0 +1,47 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: Shared fixtures of the unit tests (tests/); the keyword files and the document factories.
+@note: The pytest options and the fixtures of the keyword search suite are in the root conftest.py.
+"""
+
+
+import pytest
+
+
+# The keyword rules of the unit tests
+KEYWORDS = ("BANNED KEYWORD", "SAMPLE KEYWORD")
+
+
+def write_pdf(pdf_file: str, pages: list):
+    """Write a PDF file with one page per text (PyMuPDF is imported only by the tests needing it)."""
+    import fitz
+
+    pdf_doc = fitz.open()
+    for text in pages:
+        pdf_doc.new_page().insert_text((72, 72), text)
+    pdf_doc.save(pdf_file)
+    pdf_doc.close()
+
+
+@pytest.fixture
+def make_keywords_file(tmp_path):
+    """Fixture to write a keyword file with the given rules (one per line); returns its path."""
+    def make(*rules: str, name: str = "keywords.txt") -> str:
+        keywords_file = tmp_path / name
+        keywords_file.write_text("".join(f"{rule}\n" for rule in rules))
+        return str(keywords_file)
+    return make
+
+
+@pytest.fixture
+def keywords_file(make_keywords_file):
+    """Fixture to provide a keyword file with the `KEYWORDS` rules."""
+    return make_keywords_file(*KEYWORDS)
+
+
+@pytest.fixture
+def make_pdf():
+    """Fixture to provide the PDF factory: `make_pdf(pdf_file, pages)`, one page per text."""
+    return write_pdf
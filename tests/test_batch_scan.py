@@ -0,0 +1,30 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the batch (multi-process) scan.
+"""
+
+
+from src.core.batch_scan import scan_files
+from src.core.find_keyword import FindKeyword
+
+
+def test_scan_files_parallel_same_as_serial(tmp_path):
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text("BANNED KEYWORD\nbuild 1.2\n")
+
+    files = []
+    for index in range(6):
+        src_file = tmp_path / f"doc_{index}.txt"
+        src_file.write_text("clean line\n" + ("uses banned keyword and build 1.2\n" * index))
+        files.append(str(src_file))
+
+    serial = [scan[:2] for scan in scan_files(files, keywords_file=str(keywords_file), file_ext="txt", workers=1)]
+    parallel = [scan[:2] for scan in scan_files(files, keywords_file=str(keywords_file), file_ext="txt", workers=3)]
+
+    # Same results, in the order of the given files
+    assert [path for path, _ in parallel] == files
+    assert parallel == serial
+    assert serial[2][1] == FindKeyword(src_file=files[2], keywords_file=str(keywords_file), file_ext="txt").find()
+    assert [result[0] for _, result in serial] == [index * 2 for index in range(6)]
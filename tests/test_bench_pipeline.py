@@ -0,0 +1,28 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest smoke tests for the synthetic corpus generator and the pipeline benchmark.
+"""
+
+
+from benchmarks.bench_pipeline import STAGES, run_case
+from benchmarks.corpus import generate_corpus
+
+
+def test_corpus_and_pipeline_case(tmp_path):
+    corpus = generate_corpus(str(tmp_path), file_types=("html", "txt"), files=2, pages=2, density=0.5, keywords=5,
+                             base_keywords=["BANNED KEYWORD"])
+    assert open(corpus["keywords_file"]).read().splitlines()[0] == "BANNED KEYWORD"
+    assert len(corpus["files"]["html"]) == len(corpus["files"]["txt"]) == 2
+
+    # Reproducible
+    again = generate_corpus(str(tmp_path / "again"), file_types=("html", "txt"), files=2, pages=2, density=0.5,
+                            keywords=5, base_keywords=["BANNED KEYWORD"])
+    assert open(again["files"]["txt"][1]).read() == open(corpus["files"]["txt"][1]).read()
+
+    for file_type in ("html", "txt"):
+        result = run_case({"paths": corpus["files"][file_type], "file_type": file_type, "html_parser": "stream",
+                           "keywords_file": corpus["keywords_file"], "matcher_engine": "regex", "repeat": 1})
+        assert result["files"] == 2 and result["matches"] > 0
+        assert set(result["stages"]) == set(STAGES)
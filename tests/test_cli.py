@@ -0,0 +1,72 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the command line (`python -m src scan`): exit codes, output formats and the
+    lazy import of the parser backends.
+"""
+
+
+import json
+import pytest
+from benchmarks.bench_startup import build_cases, loaded_modules
+from src.cli import EXIT_CLEAN, EXIT_ERROR, EXIT_FOUND, main
+
+
+@pytest.fixture
+def docs(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    (docs / "clean.txt").write_text("Nothing to report.\n")
+    (docs / "sub" / "page.html").write_text("<html><title> T </title><body><p>A sample keyword.</p></body></html>")
+    (docs / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00 a banned keyword, not scanned (not a supported type)")
+    return docs
+
+
+def scan(capsys, *args) -> tuple:
+    exit_code = main(["scan", *args, "--rules-cache-dir", ""])
+    captured = capsys.readouterr()
+    return exit_code, captured.out, captured.err
+
+
+def test_exit_codes(capsys, keywords_file, docs):
+    assert scan(capsys, str(docs / "clean.txt"), "--keyword_file", keywords_file)[0] == EXIT_CLEAN
+
+    exit_code, out, _ = scan(capsys, str(docs), "--keyword_file", keywords_file)
+    assert exit_code == EXIT_FOUND
+    assert out.splitlines() == [f"{docs / 'sub' / 'page.html'}:1: SAMPLE KEYWORD: T A sample keyword."]
+
+    # Errors take precedence over the keywords found
+    exit_code, out, err = scan(capsys, str(docs), str(docs / "missing.txt"), str(docs / "image.png"),
+                               "--keyword_file", keywords_file)
+    assert exit_code == EXIT_ERROR and "SAMPLE KEYWORD" in out
+    assert "missing.txt: error" in err and "image.png: error: Unsupported file type" in err
+
+    # No keyword file: an error, not a clean scan
+    assert scan(capsys, str(docs), "--keyword_file", str(docs / "none.txt"))[0] == EXIT_ERROR
+    with pytest.raises(SystemExit) as e:
+        main(["scan", str(docs), "--mode", "unknown"])
+    assert e.value.code == EXIT_ERROR
+
+
+def test_json_output_and_report(capsys, tmp_path, keywords_file, docs):
+    exit_code, out, _ = scan(capsys, str(docs), "--keyword_file", keywords_file, "--format", "json",
+                             "--mode", "gate", "--report_dir", str(tmp_path / "report"))
+    output = json.loads(out)
+
+    assert exit_code == EXIT_FOUND
+    assert (output["files"], output["issues"], output["errors"]) == (2, 1, [])
+    assert output["hits"] == [{"file": str(docs / "sub" / "page.html"), "title": "T", "line": 1,
+                               "sentence": "T A sample keyword.", "keyword": "SAMPLE KEYWORD"}]
+    assert (tmp_path / "report" / "find_keyword_summary.json").exists()
+
+    assert scan(capsys, str(docs), "--keyword_file", keywords_file, "--quiet")[1:] == ("", "")
+
+
+def test_txt_scan_does_not_import_the_parser_backends(tmp_path, keywords_file, docs):
+    paths = {"keywords_file": keywords_file, "txt": str(docs / "clean.txt"), "html": str(docs / "sub" / "page.html")}
+    cases = build_cases(paths, str(tmp_path), ["txt", "html"], with_pytest=False)
+
+    assert not {"fitz", "bs4", "asyncio", "sqlite3"} & set(loaded_modules(cases["cli_txt"]))
+    assert not {"fitz", "bs4", "sqlite3"} & set(loaded_modules(cases["import_engine"]))
+    assert loaded_modules(cases["cli_html"])[:1] == ["bs4"]
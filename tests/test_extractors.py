@@ -0,0 +1,114 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the document extractor registry (type by extension, MIME type or content),
+    the DOCX/Markdown/XML extractors, the plugin types and the mixed type scans (`scan_many`).
+"""
+
+
+import zipfile
+import pytest
+from src.core.batch_scan import scan_files
+from src.core.extractors import EXTRACTORS, DocumentExtractor, ExtractorRegistry, MarkdownExtractor, XmlExtractor
+from src.core.find_keyword import FindKeyword
+
+
+def make_docx(docx_file: str, paragraphs: list, title: str = None):
+    """A minimal Word document (the parts read by `DocxExtractor`)."""
+    body = "".join(f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>' for text in paragraphs)
+    with zipfile.ZipFile(docx_file, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        if title:
+            archive.writestr("docProps/core.xml", '<cp:coreProperties xmlns:cp="urn:cp" '
+                             f'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>{title}</dc:title></cp:coreProperties>')
+        archive.writestr("word/document.xml", '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+                         f'wordprocessingml/2006/main"><w:body>{body}</w:body></w:document>')
+
+
+@pytest.fixture
+def mixed_docs(tmp_path, make_pdf):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    make_docx(str(docs / "guide.docx"), ["Introduction", "A banned ", "keyword here. Clean end."], title="Guide")
+    (docs / "notes.md").write_text("# Notes\n\nSome **banned** keyword [text](http://example.com/sample-keyword).\n\n"
+                                   "```\ncode with a sample keyword\n```\n")
+    (docs / "data.xml").write_text('<?xml version="1.0"?><root><a>Clean</a><b>one sample keyword.</b></root>')
+    (docs / "page.txt").write_text("clean\n")
+    make_pdf(str(docs / "no_extension"), ["A banned keyword."])
+    return docs
+
+
+def test_file_type_resolution(mixed_docs):
+    assert [EXTRACTORS.file_type(name) for name in ("a.HTM", "b.markdown", "c.docx", "d.xml", "e.rtf")] == \
+        ["html", "md", "docx", "xml", None]
+    # A given extension/type name wins; else the MIME type of the name, then the content
+    assert EXTRACTORS.file_type("a.txt", file_ext="pdf") == "pdf"
+    assert EXTRACTORS.file_type(str(mixed_docs / "no_extension")) == "pdf"
+    assert EXTRACTORS.file_type("x.bin", data=b'<?xml version="1.0"?><a/>') == "xml"
+    assert EXTRACTORS.file_type("x.bin", data=b"<!DOCTYPE html><html></html>") == "html"
+    assert EXTRACTORS.file_type("x.bin", data=b"plain text") == "txt"
+    assert EXTRACTORS.file_type("x.bin", data=b"\x00\x01binary") is None
+    assert set(EXTRACTORS.expand_extensions("auto").split(",")) >= {"html", "htm", "pdf", "txt", "docx", "md", "xml"}
+
+
+def test_extracted_text(mixed_docs):
+    docx = EXTRACTORS.create("docx")
+    assert "".join(docx.iter_text(str(mixed_docs / "guide.docx"))) == "Introduction\nA banned \nkeyword here. Clean end.\n"
+    assert docx.title == "Guide"
+
+    markdown = MarkdownExtractor()
+    assert "".join(markdown.iter_text(None, data=b"# Title\n> quoted *text* and `code`\n- [x] done ![alt](a.png)\n")) == \
+        "Title\nquoted text and code\ndone alt\n"
+    assert markdown.title == "Title"
+
+    assert "".join(XmlExtractor().iter_text(None, data=b"<r><a>one</a><b>two <i>three</i></b><!-- no --></r>")) == \
+        "one\ntwo three\n"
+
+
+def test_scan_many_mixed_types(keywords_file, mixed_docs):
+    finder = FindKeyword(src_file=None, keywords_file=keywords_file)
+    paths = sorted(str(path) for path in mixed_docs.iterdir()) + [str(mixed_docs / "image.png")]
+    results = dict(finder.scan_many(paths))
+
+    assert {path.rsplit("/", 1)[-1]: result[0] for path, result in results.items()} == {
+        "data.xml": 1, "guide.docx": 1, "no_extension": 1, "notes.md": 2, "page.txt": 0, "image.png": -1}
+    assert dict(results[str(mixed_docs / "guide.docx")][1][0]) == {
+        "file": str(mixed_docs / "guide.docx"), "title": "Guide", "line": 1,
+        "sentence": "Introduction A banned keyword here.", "keyword": "BANNED KEYWORD"}
+    assert [hit["sentence"].strip() for hit in results[str(mixed_docs / "notes.md")][1]] == \
+        ["Notes Some banned keyword text.", "code with a sample keyword"]
+
+    # The same results from the worker processes, with the type of each file found by the workers
+    scans = {path: result for path, result, _ in scan_files(paths, keywords_file, file_ext="auto", workers=2)}
+    assert scans == results
+
+    # The gate mode stops at the first match of any type
+    assert FindKeyword(src_file=str(mixed_docs / "notes.md"), keywords_file=keywords_file, file_ext="auto",
+                       mode="gate").find()[0] == 1
+
+
+def test_plugin_type(tmp_path, keywords_file):
+    class UpperExtractor(DocumentExtractor):
+        name = "upper"
+        extensions = ("up",)
+
+        def iter_text(self, src_file, data=None):
+            with self.open_binary(src_file, data) as stream:
+                yield stream.read().decode().lower()
+
+    (tmp_path / "doc.up").write_text("A BANNED KEYWORD.")
+    EXTRACTORS.register(UpperExtractor)
+    try:
+        EXTRACTORS.map_extension("log", "upper")
+        assert EXTRACTORS.file_type("server.log") == "upper"
+        assert FindKeyword(src_file=str(tmp_path / "doc.up"), keywords_file=keywords_file, file_ext="auto").find()[0] == 1
+    finally:
+        EXTRACTORS.unregister("upper")
+    assert EXTRACTORS.file_type("doc.up") is None and EXTRACTORS.file_type("server.log") is None
+
+    registry = ExtractorRegistry()
+    with pytest.raises(ValueError):
+        registry.register(DocumentExtractor)
+    with pytest.raises(ValueError):
+        registry.map_extension("log", "txt")
@@ -0,0 +1,97 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the file discovery and the file manifest.
+"""
+
+
+import json
+import os
+import pytest
+from src.utilities.file_discovery import FileDiscovery, FileManifest, file_ext_for, parse_extensions
+from src.utilities.utilities import Utilities, atomic_write_json
+
+
+def make_tree(tmp_path):
+    for relative_path in ["a.html", "b.PDF", "c.txt", "d.md", "sub/e.html", "sub/drafts/f.pdf", "sub/g_old.txt"]:
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative_path)
+
+
+def relative(tmp_path, files: list) -> list:
+    return [os.path.relpath(path, tmp_path).replace(os.sep, "/") for path in files]
+
+
+def test_parse_extensions():
+    assert parse_extensions("html, .PDF,,txt,html") == ["html", "pdf", "txt"]
+    assert file_ext_for("./docs/b.PDF", "html,pdf") == "pdf"
+    assert file_ext_for("./docs/b.htm", "html") == "html"
+
+
+def test_discovery_multi_extension_and_globs(tmp_path):
+    make_tree(tmp_path)
+
+    files = FileDiscovery(str(tmp_path), "html,pdf,txt").files()
+    assert relative(tmp_path, files) == ["a.html", "b.PDF", "c.txt", "sub/e.html", "sub/g_old.txt", "sub/drafts/f.pdf"]
+
+    files = FileDiscovery(str(tmp_path), "html,pdf,txt", exclude=["drafts", "*_old.*"]).files()
+    assert relative(tmp_path, files) == ["a.html", "b.PDF", "c.txt", "sub/e.html"]
+
+    files = FileDiscovery(str(tmp_path), "html,pdf,txt", include=["sub/*"]).files()
+    assert relative(tmp_path, files) == ["sub/e.html", "sub/g_old.txt", "sub/drafts/f.pdf"]
+
+    assert relative(tmp_path, FileDiscovery(str(tmp_path), "html", recursive=False).files()) == ["a.html"]
+    assert FileDiscovery(str(tmp_path / "missing"), "html").files() == []
+
+
+def test_hidden_files_are_skipped(tmp_path):
+    make_tree(tmp_path)
+    for relative_path in [".hidden/x.html", ".y.html", ".git/objects/z.html", "sub/.cache/w.html"]:
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative_path)
+
+    # As the former glob listing
+    files = Utilities().get_all_files_in_folder(str(tmp_path), "html", resursive=True)
+    assert relative(tmp_path, files) == ["a.html", "sub/e.html"]
+
+    # Unless an include pattern names them
+    files = FileDiscovery(str(tmp_path), "html", include=[".hidden/*", ".*.html"]).files()
+    assert relative(tmp_path, files) == [".y.html", ".hidden/x.html"]
+    assert relative(tmp_path, FileDiscovery(str(tmp_path), "html", include=["*.html"]).files()) == ["a.html", "sub/e.html"]
+
+
+def test_manifest_lists_new_and_changed_files(tmp_path):
+    make_tree(tmp_path)
+    manifest_file = str(tmp_path / "out" / "manifest.json")
+    stats = FileDiscovery(str(tmp_path), "html").stats()
+
+    manifest = FileManifest(manifest_file, fingerprint="keywords-1")
+    assert manifest.changed(stats) == list(stats)
+    for path, stat in stats.items():
+        manifest.update(path, stat)
+    manifest.save()
+
+    # Change one file, add another one
+    (tmp_path / "a.html").write_text("changed content")
+    (tmp_path / "new.html").write_text("new")
+    stats = FileDiscovery(str(tmp_path), "html").stats()
+    assert relative(tmp_path, FileManifest(manifest_file, fingerprint="keywords-1").changed(stats)) == ["a.html", "new.html"]
+
+    # Another fingerprint (e.g. the keywords changed); every file is listed again
+    assert FileManifest(manifest_file, fingerprint="keywords-2").changed(stats) == list(stats)
+
+
+def test_atomic_write_json(tmp_path):
+    path = str(tmp_path / "out" / "data.json")
+    atomic_write_json(path, {"files": {"a.html": 1}})
+
+    # An interrupted write (here, not serializable) leaves the previous file, and no temporary file
+    with pytest.raises(TypeError):
+        atomic_write_json(path, {"files": {"a.html": object()}})
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file) == {"files": {"a.html": 1}}
+    assert os.listdir(tmp_path / "out") == ["data.json"]
+
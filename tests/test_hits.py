@@ -0,0 +1,135 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the compact keyword hits (dict compatible records, interned sentences).
+"""
+
+
+import json
+import pickle
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.core.hits import Hit, HitList, json_default
+from src.core.scan_cache import ScanCache, cached_find
+from src.utilities.scan_report import ScanReport
+from src.utilities.write_logs import write_csv_logs_for_keyword_search
+
+
+def test_hit_reads_like_a_dict():
+    hit = Hit("doc.pdf", 3, "banned keyword", 0, "A banned keyword.", 7, page=2)
+
+    assert dict(hit) == {"file": "doc.pdf", "page": 2, "line": 7, "sentence": "A banned keyword.",
+                         "keyword": "banned keyword"}
+    assert hit["page"] == 2 and hit.get("title") is None and "offset" not in hit
+    assert hit == dict(hit)
+    with pytest.raises(KeyError):
+        hit["title"]
+    with pytest.raises(AttributeError):
+        hit.extra = 1
+
+
+def test_hit_list_interns_the_sentences():
+    hits = HitList("doc.pdf")
+    footer = "Confidential footer."
+    for page in (1, 2):
+        sentence = f"Page {page} has a banned keyword and a sample keyword."
+        hits.add(0, "banned keyword", sentence, 1, page=page)
+        hits.add(1, "sample keyword", sentence, 1, page=page)
+        # The same footer text on every page; a new sentence (id), stored once
+        hits.add(0, "banned keyword", "".join(footer), 9, page=page)
+
+    assert len(hits) == 6
+    assert list(hits.sentence_ids) == [0, 0, 1, 2, 2, 3]
+    assert hits.sentences[1] is hits.sentences[3]
+    assert [hit.keyword_id for hit in hits] == [0, 1, 0, 0, 1, 0]
+    assert hits[-1] == {"file": "doc.pdf", "page": 2, "line": 9, "sentence": footer, "keyword": "banned keyword"}
+    assert hits[1:3] == [hits[1], hits[2]]
+    with pytest.raises(IndexError):
+        hits[6]
+
+
+def test_hit_list_round_trip():
+    hits = HitList("doc.txt")
+    hits.add(4, "keyword", "a keyword line", 3, offset=120)
+    hits.add(2, "other", "another line", 5, offset=400)
+
+    dicts = json.loads(json.dumps(hits.to_dicts()))
+    assert hits == dicts and dicts == hits
+
+    # The keyword ids are found again from the matcher keywords; else unique negative ids
+    loaded = HitList.from_dicts("copy.txt", dicts, keywords=["a", "b", "other", "c", "keyword"])
+    assert [(hit.file, hit.keyword_id, hit["offset"]) for hit in loaded] == [("copy.txt", 4, 120), ("copy.txt", 2, 400)]
+    assert [hit.keyword_id for hit in HitList.from_dicts("copy.txt", dicts)] == [-1, -2]
+
+    assert pickle.loads(pickle.dumps(hits)) == hits
+
+
+def test_find_keyword_hits_have_their_keyword(tmp_path, keywords_file, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, ["A banned keyword and a sample keyword."])
+    html_file = tmp_path / "doc.html"
+    html_file.write_text("<html><title> T </title><body><p>A sample keyword.</p></body></html>")
+
+    issue_counter, hits = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf").find_hits()
+    assert issue_counter == 2 and isinstance(hits, HitList)
+    assert [(hit["keyword"], hit.keyword_id, hit.sentence_id, hit["page"]) for hit in hits] == \
+        [("BANNED KEYWORD", 0, 0, 1), ("SAMPLE KEYWORD", 1, 0, 1)]
+    assert len(hits.sentences) == 1
+
+    for html_parser in ("bs4", "stream"):
+        _, hits = FindKeyword(src_file=str(html_file), keywords_file=keywords_file, html_parser=html_parser).find()
+        assert hits == [{"file": str(html_file), "title": "T", "line": 1, "sentence": "T A sample keyword.",
+                         "keyword": "SAMPLE KEYWORD"}]
+
+
+def test_cached_hits(tmp_path, keywords_file):
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("clean\nsample keyword and banned keyword\n")
+    cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+
+    first = cached_find(FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt"), cache)
+    second = cached_find(FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt"), cache)
+
+    assert cache.hits == 1
+    assert second == first
+    assert [hit.keyword_id for hit in second[1]] == [0, 1]
+
+
+def test_find_output_for_dict_and_list_readers(tmp_path, keywords_file):
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("clean\nsample keyword and banned keyword\n")
+    issue_counter, data = FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt").find()
+
+    # The CSV log of the scan hits (as the former list of dicts)
+    write_csv_logs_for_keyword_search(str(tmp_path / "log.csv"), data)
+    assert (tmp_path / "log.csv").read_text().splitlines()[1:] == [
+        f"{txt_file},2,25,sample keyword and banned keyword,BANNED KEYWORD",
+        f"{txt_file},2,6,sample keyword and banned keyword,SAMPLE KEYWORD"]
+
+    expected = [{"file": str(txt_file), "line": 2, "offset": offset, "sentence": "sample keyword and banned keyword",
+                 "keyword": keyword} for offset, keyword in ((25, "BANNED KEYWORD"), (6, "SAMPLE KEYWORD"))]
+    assert issue_counter == 2 and isinstance(data, list) and all(isinstance(hit, dict) for hit in data)
+    assert json.loads(json.dumps(data)) == expected
+    assert data + [] == [] + data == expected
+
+    # A list, as the former output: sorted and changed in place
+    data.sort(key=lambda hit: hit["offset"])
+    data[0]["line"] = 99
+    assert [(hit["offset"], hit["line"]) for hit in data] == [(6, 99), (25, 2)]
+    assert data[0].keyword_id == 1
+
+
+def test_compact_hits_to_json(tmp_path, keywords_file):
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("clean\nsample keyword and banned keyword\n")
+    _, data = FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt").find()
+    _, hits = FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt").find_hits()
+
+    assert isinstance(hits, HitList) and hits == data
+    assert json.loads(json.dumps(hits, default=json_default)) == json.loads(json.dumps(hits.to_dicts())) == data
+
+    # The report keeps the hits of a file compactly
+    report = ScanReport()
+    report.add(str(txt_file), 2, data)
+    assert isinstance(report.files[str(txt_file)]["hits"], HitList) and report.files[str(txt_file)]["hits"] == data
@@ -0,0 +1,91 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest parity tests of the streaming HTML parser against BeautifulSoup.
+@note: Both the extracted text/title and the FindKeyword results must be the same.
+"""
+
+
+import pytest
+from bs4 import BeautifulSoup
+from src.core.find_keyword import FindKeyword
+from src.core.html_extractor import HTMLTextExtractor, extract_html_text
+
+
+HTML_SAMPLES = {
+    "simple": "<html><head><title> Sample Page </title></head><body><p>A SAMPLE KEYWORD here. Clean one.</p></body></html>",
+    "no_title": "<html><body><p>No title but a BANNED KEYWORD? Yes.</p></body></html>",
+    "script_style": (
+        "<html><head><title>Scripts</title><style>.KEYWORD { color: red; }</style>"
+        "<script>var s = 'BANNED KEYWORD';</script></head>"
+        "<body><template>SPECIAL KEYWORD</template><p>Visible VERSION KEYWORD.</p>"
+        "<script type='text/javascript'>if (a < b) { x = '</p>'; }</script></body></html>"
+    ),
+    "entities_comments": (
+        "<!DOCTYPE html><html><head><title>A &amp; B</title></head><body>"
+        "<!-- SAMPLE KEYWORD in a comment --><p>Caf&eacute; &lt;BANNED&nbsp;KEYWORD&gt; &#169; 2025.</p>"
+        "<p>SPECIAL\n   KEYWORD split over\nlines. e.g. an abbreviation Mr. Smith.</p></body></html>"
+    ),
+    "nested_unclosed": (
+        "<html><head><title>First</title><title>Second</title></head><body><div><p>IMPORTENT KEYWORD"
+        "<li>unclosed item<li>another SAMPLE KEYWORD item.<br>After break<![CDATA[ KEYWORD cdata ]]></div>"
+        "<textarea>KEYWORD in textarea</textarea><noscript>noscript KEYWORD</noscript></body></html>"
+    ),
+    "unicode": "<html><head><meta charset='utf-8'><title>Ünïcödé</title></head><body>Grüße KEYWORD. 日本語 KEYWORD。</body></html>",
+    # Not UTF-8; the encoding is declared, given by the byte order mark or guessed
+    "cp1252_meta": ("<html><head><meta charset=\"windows-1252\"><title>Café</title></head>"
+                    "<body><p>Un café KEYWORD à 5€. Grüße.</p></body></html>").encode("cp1252"),
+    "cp1252_http_equiv": ("<html><head><meta http-equiv='Content-Type' content='text/html; charset=iso-8859-1'>"
+                          "</head><body><p>Déjà vu BANNED KEYWORD.</p></body></html>").encode("latin-1"),
+    "utf16_bom": "\ufeff<html><title>Ünï</title><body>Grüße SAMPLE KEYWORD.</body></html>".encode("utf-16-le"),
+    "cp1252_undeclared": "<html><body><p>Crème brûlée KEYWORD.</p></body></html>".encode("cp1252"),
+}
+
+
+@pytest.fixture(params=list(HTML_SAMPLES))
+def html_file(request, tmp_path):
+    html_file = tmp_path / f"{request.param}.html"
+    sample = HTML_SAMPLES[request.param]
+    html_file.write_bytes(sample if isinstance(sample, bytes) else sample.encode("utf-8"))
+    return str(html_file)
+
+
+def test_extracted_text_same_as_bs4(html_file):
+    with open(html_file, 'rb') as file:
+        page_soup = BeautifulSoup(file, 'html.parser')
+
+    title, text = extract_html_text(html_file)
+    assert text == page_soup.text
+    assert title == (page_soup.title.text if page_soup.title else None)
+
+
+def test_extracted_text_chunk_size_independent(html_file):
+    expected = extract_html_text(html_file)[1]
+    assert "".join(HTMLTextExtractor(chunk_size=7).iter_text(html_file)) == expected
+
+
+def test_find_keyword_same_as_bs4(html_file):
+    results = {
+        html_parser: FindKeyword(src_file=html_file, keywords_file="./rules/keywords.txt", file_ext="html",
+                                 html_parser=html_parser).find()
+        for html_parser in ("bs4", "stream")
+    }
+    assert results["stream"] == results["bs4"]
+
+
+def test_declared_encoding(tmp_path, make_keywords_file):
+    html_file = tmp_path / "cafe.html"
+    html_file.write_bytes(HTML_SAMPLES["cp1252_meta"])
+    keywords_file = make_keywords_file("CAFÉ KEYWORD")
+
+    extractor = HTMLTextExtractor(chunk_size=16)
+    assert "Un café KEYWORD à 5€." in "".join(extractor.iter_text(str(html_file)))
+    assert extractor.detected_encoding == "cp1252" and extractor.title == "Café"
+    for html_parser in ("bs4", "stream"):
+        assert FindKeyword(src_file=str(html_file), keywords_file=keywords_file, html_parser=html_parser).find()[0] == 1
+
+
+def test_unsupported_html_parser():
+    with pytest.raises(ValueError):
+        FindKeyword(src_file="x.html", keywords_file="./rules/keywords.txt", html_parser="lxml")
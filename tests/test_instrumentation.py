@@ -0,0 +1,69 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the scan instrumentation (stage timers, counters and profile capture).
+"""
+
+
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.utilities.instrumentation import NULL_METRICS, ScanMetrics
+
+
+def make_finder(tmp_path, metrics, file_ext: str = "html", html_parser: str = "bs4") -> FindKeyword:
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text("BANNED KEYWORD\n")
+    src_file = tmp_path / f"doc.{file_ext}"
+    src_file.write_text("<html><title>T</title><body><p>A banned keyword here. Clean one.</p></body></html>")
+    return FindKeyword(src_file=str(src_file), keywords_file=str(keywords_file), file_ext=file_ext,
+                       html_parser=html_parser, metrics=metrics)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.mark.parametrize("html_parser", ["bs4", "stream"])
+def test_find_records_stages_and_counters(tmp_path, html_parser):
+    metrics = ScanMetrics()
+    with metrics.capture():
+        result = make_finder(tmp_path, metrics, html_parser=html_parser).find()
+
+    assert result[0] == 1
+    assert {"total", "extraction", "segmentation", "matching"} <= set(metrics.timings)
+    assert metrics.counters["sentences"] == 2 and metrics.counters["matches"] == 1
+    assert ("scan_matches", 1) in metrics.properties()
+
+
+def test_timed_and_merge_with_pluggable_clock():
+    metrics = ScanMetrics(clock=FakeClock())
+    assert list(metrics.timed(iter("ab"), "extraction", counter="pages")) == ["a", "b"]
+    with metrics.stage("matching"):
+        pass
+
+    # Each timed step takes 1 "second" with the fake clock (2 items + the end of the iteration)
+    assert metrics.timings == {"extraction": 3.0, "matching": 1.0}
+    assert ScanMetrics().merge(metrics).merge(metrics).as_dict()["counters"] == {"pages": 4}
+
+
+@pytest.mark.parametrize("profile", ["cprofile", "tracemalloc"])
+def test_profile_capture(tmp_path, profile):
+    metrics = ScanMetrics(profile=profile)
+    with metrics.capture():
+        make_finder(tmp_path, metrics).find()
+    assert metrics.profile_report
+
+    with pytest.raises(ValueError):
+        ScanMetrics(profile="unknown")
+
+
+def test_null_metrics_records_nothing(tmp_path):
+    with NULL_METRICS.capture():
+        make_finder(tmp_path, None).find()
+    assert NULL_METRICS.timings == {} and NULL_METRICS.counters == {}
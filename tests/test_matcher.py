@@ -0,0 +1,53 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the keyword matcher engines.
+@note: Every engine must give the same result as the nested loop
+    `keyword.lower() in sentence.lower()` used before.
+"""
+
+
+import pytest
+from src.core.matcher import MATCHER_ENGINES, build_matcher
+
+
+KEYWORDS = ["KEYWORD", "SAMPLE KEYWORD", "key", "Build 1.2", "build 1.2.3", "KEYWORD", "a+b (c)"]
+SENTENCES = [
+    "This is a SAMPLE keyword in a sentence.",
+    "Nothing to see here.",
+    "Upgrade from build 1.2.3 to build 1.3?",
+    "keys and monkeys",
+    "Regex chars a+b (c) are escaped.",
+    "",
+]
+
+
+def nested_loop(keywords, sentence):
+    return [keyword_id for keyword_id, keyword in enumerate(keywords) if keyword.lower() in sentence.lower()]
+
+
+@pytest.mark.parametrize("engine", list(MATCHER_ENGINES))
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_matcher_same_as_nested_loop(engine, sentence):
+    matcher = build_matcher(KEYWORDS, engine=engine)
+    assert matcher.find(sentence) == nested_loop(KEYWORDS, sentence)
+
+
+@pytest.mark.parametrize("engine", list(MATCHER_ENGINES))
+def test_matcher_offsets(engine):
+    matcher = build_matcher(["ab", "abc", "bcd"], engine=engine)
+    matches = sorted(matcher.iter_matches("xABCD"))
+    assert matches == [(1, 3, 0), (1, 4, 1), (2, 5, 2)]
+
+
+@pytest.mark.parametrize("engine", list(MATCHER_ENGINES))
+def test_matcher_empty_keyword_matches_everything(engine):
+    matcher = build_matcher(["", "foo"], engine=engine)
+    assert matcher.find("bar") == [0]
+    assert matcher.find_keywords("a foo") == ["", "foo"]
+
+
+def test_matcher_unsupported_engine():
+    with pytest.raises(ValueError):
+        build_matcher(["foo"], engine="unknown")
@@ -0,0 +1,120 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the PDF page cache (unchanged pages reused, changed pages scanned again, eviction).
+"""
+
+
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.core.page_cache import PageCache
+from src.utilities.instrumentation import ScanMetrics
+
+
+PAGES = [
+    "Page one is clean. A banned keyword starts here and",
+    "goes on to page two. A sample keyword.",
+    "Page three is clean.",
+    "Page four has a banned keyword. The end.",
+]
+
+
+def scan(pdf_file: str, keywords_file: str, page_cache: PageCache = None, **kwargs) -> tuple:
+    metrics = ScanMetrics()
+    result = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf", metrics=metrics,
+                         page_cache=page_cache, **kwargs).find()
+    return result, metrics.counters
+
+
+@pytest.mark.parametrize("page_key", ["content", "text"])
+def test_unchanged_pages_are_reused(tmp_path, keywords_file, make_pdf, page_key):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, PAGES)
+    expected, _ = scan(pdf_file, keywords_file)
+    page_cache = PageCache(str(tmp_path / "pages.sqlite"), page_key=page_key)
+
+    cold, counters = scan(pdf_file, keywords_file, page_cache)
+    assert cold == expected and counters["page_cache_misses"] == 4 and counters["pages"] == 4
+
+    # Regenerated document; the matches come from the cache (the text is only extracted with the "text" key)
+    make_pdf(pdf_file, PAGES)
+    warm, counters = scan(pdf_file, keywords_file, page_cache)
+    assert warm == expected
+    assert counters["page_cache_hits"] == 4 and counters.get("pages", 0) == (4 if page_key == "text" else 0)
+    assert (page_cache.hits, page_cache.misses) == (4, 4)
+
+
+def test_changed_pages_are_scanned_again(tmp_path, keywords_file, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, PAGES)
+    page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+    scan(pdf_file, keywords_file, page_cache)
+
+    # Page 1 changes its last (unfinished) sentence; page 2 is scanned again since it continues it
+    changed = ["Page one is clean. A sample keyword starts here and"] + PAGES[1:]
+    make_pdf(pdf_file, changed)
+    result, counters = scan(pdf_file, keywords_file, page_cache)
+    assert result == scan(pdf_file, keywords_file)[0]
+    assert (counters["page_cache_misses"], counters["page_cache_hits"]) == (2, 2)
+    assert [(hit["keyword"], hit["page"]) for hit in result[1]] == \
+        [("SAMPLE KEYWORD", 1), ("SAMPLE KEYWORD", 2), ("BANNED KEYWORD", 4)]
+
+    # The gate mode uses the cache too; the first match is known once its sentence ends (page 2)
+    gate, counters = scan(pdf_file, keywords_file, page_cache, mode="gate")
+    assert gate == (1, result[1][:1]) and counters["page_cache_hits"] == 2
+
+
+def write_pdf_with_encoding(pdf_file: str, glyph: str):
+    """A page drawing "hello world." whose font encoding maps the code of 'h' to the given glyph."""
+    import fitz
+
+    pdf_doc = fitz.open()
+    pdf_doc.new_page().insert_text((72, 72), "hello world.")
+    font_xref = pdf_doc.get_page_fonts(0)[0][0]
+    encoding_xref = pdf_doc.get_new_xref()
+    pdf_doc.update_object(encoding_xref, f"<</Type/Encoding/BaseEncoding/WinAnsiEncoding/Differences[104/{glyph}]>>")
+    pdf_doc.xref_set_key(font_xref, "Encoding", f"{encoding_xref} 0 R")
+    pdf_doc.save(pdf_file)
+    pdf_doc.close()
+
+
+def test_changed_font_encoding_is_scanned_again(tmp_path, make_keywords_file):
+    keywords_file = make_keywords_file("SELLO WORLD")
+    pdf_file = str(tmp_path / "doc.pdf")
+    page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+    write_pdf_with_encoding(pdf_file, "h")
+    assert scan(pdf_file, keywords_file, page_cache)[0] == (0, [])
+
+    # Same content stream and font; only the /Encoding /Differences change the text ("sello world.")
+    write_pdf_with_encoding(pdf_file, "s")
+    result, counters = scan(pdf_file, keywords_file, page_cache)
+    assert result == scan(pdf_file, keywords_file)[0] and result[0] == 1
+    assert counters["page_cache_misses"] == 1 and not counters.get("page_cache_hits")
+
+
+def test_eviction_and_stats(tmp_path, keywords_file, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, PAGES)
+    page_cache = PageCache(str(tmp_path / "pages.sqlite"), max_size_mb=100 / (1024 * 1024))
+
+    scan(pdf_file, keywords_file, page_cache)
+    stats = page_cache.stats()
+    assert stats["evictions"] > 0 and stats["size_mb"] * 1024 * 1024 <= 100
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (0, 4, 0.0)
+    assert "0 hits, 4 misses" in page_cache.format_stats()
+
+    page_cache.close()
+    assert page_cache.stats()["entries"] == stats["entries"]
+    page_cache.clear()
+    assert page_cache.stats()["entries"] == 0
+
+
+def test_unusable_cache_file(tmp_path, keywords_file, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, PAGES)
+    (tmp_path / "not_a_dir").write_text("")
+
+    page_cache = PageCache(str(tmp_path / "not_a_dir" / "pages.sqlite"))
+    assert scan(pdf_file, keywords_file, page_cache)[0] == scan(pdf_file, keywords_file)[0]
+    assert page_cache.connection is None
@@ -0,0 +1,89 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the page by page PDF scan (`FindKeyword.stream`): sentences crossing pages,
+    `max_matches` early exit and the document closed when the stream stops.
+"""
+
+
+import fitz
+import pytest
+from src.core.find_keyword import FindKeyword
+
+
+PAGES = [
+    "Page one is clean. A banned keyword starts here and",
+    "goes on to page two. A sample keyword.",
+    "Page three is clean.",
+    "Page four has a banned keyword. The end.",
+]
+
+
+@pytest.fixture
+def pdf_file(tmp_path, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, PAGES)
+    return pdf_file
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Fixture to record the PDF documents opened by `fitz.open`."""
+    opened = []
+    fitz_open = fitz.open
+
+    def open_document(*args, **kwargs):
+        opened.append(fitz_open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(fitz, "open", open_document)
+    return opened
+
+
+def test_stream_same_as_find(pdf_file, keywords_file):
+    finder = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf")
+    issue_counter, hits = finder.find()
+
+    assert list(finder.stream()) == hits and issue_counter == 3
+    # The sentence crossing pages 1-2 is matched as a whole, on the page it starts on
+    assert [(hit["page"], hit["line"]) for hit in hits] == [(1, 2), (2, 3), (4, 5)]
+    assert hits[0]["sentence"] == "A banned keyword starts here and goes on to page two."
+
+
+def test_max_matches_stops_early(pdf_file, keywords_file, monkeypatch):
+    pages = []
+    get_text = fitz.Page.get_text
+    monkeypatch.setattr(fitz.Page, "get_text", lambda page, *args, **kwargs: pages.append(page.number) or
+                        get_text(page, *args, **kwargs))
+    finder = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf")
+
+    first = list(finder.stream(max_matches=1))
+    assert [hit["page"] for hit in first] == [1]
+    # The first match is known once its sentence ends (page 2); the pages after it are not read
+    assert pages == [0, 1]
+    assert list(finder.stream(max_matches=0)) == []
+
+
+def test_document_closed_on_early_exit(pdf_file, keywords_file, opened):
+    finder = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf")
+
+    # Stopped by max_matches
+    assert len(list(finder.stream(max_matches=2))) == 2
+    assert opened[-1].is_closed
+
+    # Stopped by the caller (the generator is closed before the end)
+    matches = finder.stream()
+    next(matches)
+    assert not opened[-1].is_closed
+    matches.close()
+    assert opened[-1].is_closed
+
+
+def test_document_closed_on_error(pdf_file, keywords_file, opened, monkeypatch):
+    monkeypatch.setattr(fitz.Page, "get_text", lambda page, *args, **kwargs: 1 / 0)
+    finder = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf")
+
+    with pytest.raises(ZeroDivisionError):
+        list(finder.stream())
+    assert opened[-1].is_closed
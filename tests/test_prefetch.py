@@ -0,0 +1,137 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the file prefetch (read ahead with bounded concurrency and memory) and the scans
+    of prefetched content.
+"""
+
+
+import threading
+import time
+import pytest
+import src.core.prefetch as prefetch
+from src.core.batch_scan import scan_files
+from src.core.find_keyword import FindKeyword
+from src.core.prefetch import FilePrefetcher, prefetch_files
+
+
+@pytest.fixture
+def keywords_file(make_keywords_file):
+    # With a regex rule
+    return make_keywords_file("BANNED KEYWORD", "re:[0-9]{3}-[0-9]{4}")
+
+
+def make_files(tmp_path, sizes: list) -> list:
+    paths = []
+    for number, size in enumerate(sizes):
+        path = tmp_path / f"file_{number}.txt"
+        path.write_bytes(bytes([65 + number]) * size)
+        paths.append(str(path))
+    return paths
+
+
+def test_prefetch_in_order_with_errors(tmp_path):
+    paths = make_files(tmp_path, [10, 5000, 1, 300])
+    paths.insert(2, str(tmp_path / "missing.txt"))
+
+    items = list(prefetch_files(paths, depth=3))
+
+    assert [path for path, _, _ in items] == paths
+    assert [len(data) for _, data, _ in items if data is not None] == [10, 5000, 1, 300]
+    _, data, error = items[2]
+    assert data is None and isinstance(error, FileNotFoundError)
+
+
+def test_prefetch_depth_and_byte_budget(tmp_path, monkeypatch):
+    paths = make_files(tmp_path, [100] * 12)
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0, "started": 0}
+    read_file = prefetch._read_file
+
+    def slow_read(src_file):
+        with lock:
+            state["active"] += 1
+            state["started"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return read_file(src_file)
+    monkeypatch.setattr(prefetch, "_read_file", slow_read)
+
+    # Unbounded memory; the reads in flight are bounded by the depth
+    assert len(list(prefetch_files(paths, depth=3))) == 12
+    assert 1 < state["max_active"] <= 3
+
+    # At most 2 files (250 bytes) held: the one being consumed and the next one
+    state.update(active=0, max_active=0, started=0)
+    for number, (_, data, _) in enumerate(prefetch_files(paths, depth=8, max_buffer_bytes=250)):
+        time.sleep(0.02)
+        assert len(data) == 100
+        assert state["started"] <= number + 2
+
+
+def test_prefetch_file_larger_than_the_budget(tmp_path):
+    paths = make_files(tmp_path, [10, 1000, 10])
+    assert [len(data) for _, data, _ in prefetch_files(paths, depth=2, max_buffer_bytes=100)] == [10, 1000, 10]
+
+
+def test_prefetch_stops_early(tmp_path):
+    paths = make_files(tmp_path, [10] * 20)
+    threads = threading.active_count()
+
+    files = prefetch_files(paths, depth=4)
+    assert next(files)[0] == paths[0]
+    files.close()
+
+    assert threading.active_count() == threads
+
+
+def test_file_prefetcher(tmp_path):
+    paths = make_files(tmp_path, [10, 20, 30, 40])
+    prefetcher = FilePrefetcher(paths, depth=2)
+
+    assert prefetcher.get(paths[0]) == b"A" * 10
+    # A skipped file (e.g. deselected) is dropped; requested again, it is not prefetched
+    assert prefetcher.get(paths[2]) == b"C" * 30
+    assert prefetcher.get(paths[1]) is None
+    assert prefetcher.get(str(tmp_path / "unknown.txt")) is None
+    assert prefetcher.get(paths[3]) == b"D" * 40
+    prefetcher.close()
+
+
+def make_documents(tmp_path, make_pdf) -> list:
+    html_file = tmp_path / "doc.html"
+    html_file.write_text("<html><title>T</title><body><p>Call 555-1234. A banned keyword here.</p>"
+                         "<p>Clean text.</p></body></html>")
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("clean\na BANNED keyword\n\ncall 555-1234 now\n")
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, ["Clean page.", "A banned keyword. Call 555-1234."])
+    return [(str(html_file), "html", "bs4"), (str(html_file), "html", "stream"), (str(txt_file), "txt", "bs4"),
+            (pdf_file, "pdf", "bs4")]
+
+
+def test_find_keyword_from_prefetched_content(tmp_path, keywords_file, make_pdf):
+    for src_file, file_ext, html_parser in make_documents(tmp_path, make_pdf):
+        expected = FindKeyword(src_file=src_file, keywords_file=keywords_file, file_ext=file_ext,
+                               html_parser=html_parser).find()
+        with open(src_file, 'rb') as file:
+            data = file.read()
+        result = FindKeyword(src_file=src_file, keywords_file=keywords_file, file_ext=file_ext,
+                             html_parser=html_parser, src_data=data).find()
+
+        assert expected[0] == 2
+        assert result == expected
+
+
+def test_scan_files_with_prefetch(tmp_path, keywords_file, make_pdf):
+    paths = [src_file for src_file, _, html_parser in make_documents(tmp_path, make_pdf) if html_parser == "bs4"]
+    paths.append(str(tmp_path / "missing.txt"))
+
+    expected = [result for _, result, _ in scan_files(paths, keywords_file, file_ext="html,txt,pdf")]
+    results = [result for _, result, _ in scan_files(paths, keywords_file, file_ext="html,txt,pdf", prefetch=2)]
+
+    assert results == expected
+    assert [issue_counter for issue_counter, _ in results] == [2, 2, 2, -1]
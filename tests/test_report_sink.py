@@ -0,0 +1,59 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the report sinks.
+"""
+
+
+import csv
+import gzip
+import json
+import pytest
+from src.utilities.report_sink import open_report_sink
+from src.utilities.write_logs import write_csv_logs_for_keyword_search
+
+
+ROWS = [
+    {"file": "a.pdf", "page": 1, "line": 2, "sentence": 'Sentence, with a comma and "quotes".'},
+    {"file": "b.pdf", "page": 3, "line": 4, "sentence": "Multi\nline sentence."},
+]
+
+
+def read_report(report_file: str) -> list:
+    open_report = gzip.open if report_file.endswith(".gz") else open
+    with open_report(report_file, 'rt', newline='', encoding='utf-8') as file:
+        if ".csv" in report_file:
+            return list(csv.DictReader(file))
+        return [json.loads(line) for line in file]
+
+
+@pytest.mark.parametrize("report_name", ["report.csv", "report.jsonl", "report.csv.gz", "report.jsonl.gz"])
+def test_report_sink_round_trip_and_append(tmp_path, report_name):
+    report_file = str(tmp_path / report_name)
+
+    with open_report_sink(report_file, mode='w', batch_size=1) as sink:
+        sink.write_rows(ROWS)
+    with open_report_sink(report_file, mode='a') as sink:
+        sink.write_rows(ROWS)
+
+    # Appended rows, header only once
+    rows = read_report(report_file)
+    assert len(rows) == 4
+    assert rows[0]["sentence"] == ROWS[0]["sentence"]
+    assert rows[3]["sentence"] == ROWS[1]["sentence"]
+
+
+def test_unsupported_report_format(tmp_path):
+    with pytest.raises(ValueError):
+        open_report_sink(str(tmp_path / "report.xml"))
+
+
+def test_write_csv_logs_for_keyword_search(tmp_path):
+    report_file = str(tmp_path / "find_keyword_issues.csv")
+    write_csv_logs_for_keyword_search(report_file, ROWS + [{"file": "c.pdf", "page": 5, "line": 6, "sentence": "x" * 100}])
+
+    rows = read_report(report_file)
+    assert [row["file"] for row in rows] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert rows[0]["sentence"] == ROWS[0]["sentence"]
+    assert rows[2]["sentence"] == "x" * 80
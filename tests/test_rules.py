@@ -0,0 +1,102 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the keyword rules compiler (modifiers, normalization and compiled artifacts).
+"""
+
+
+import os
+import pytest
+from src.core import rules as rules_module
+from src.core.find_keyword import FindKeyword
+from src.core.matcher import MATCHER_ENGINES
+from src.core.rules import build_rules_matcher, compile_rules, parse_rules
+
+
+RULES = """
+Banned   Keyword
+banned keyword
+word:cat
+case:NASA
+word+case:Go
+re:v\\d+\\.\\d+
+re:foo.*bar
+
+re: subject
+"""
+
+
+def test_parse_rules_normalizes_and_deduplicates():
+    rules = parse_rules(RULES.splitlines())
+    assert [rule.source for rule in rules] == ["Banned Keyword", "word:cat", "case:NASA", "word+case:Go",
+                                               r"re:v\d+\.\d+", "re:foo.*bar", "re: subject"]
+    assert rules[-1].regex is False
+
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_rules(["KEYWORD", "re:(unclosed"])
+
+
+@pytest.mark.parametrize("engine", list(MATCHER_ENGINES))
+def test_rule_modifiers(engine):
+    matcher = build_rules_matcher(parse_rules(RULES.splitlines()), engine=engine)
+    assert matcher.find_keywords("A BANNED keyword, a cat and a concatenation.") == ["Banned Keyword", "word:cat"]
+    assert matcher.find_keywords("concatenate") == []
+    assert matcher.find_keywords("nasa and NASA") == ["case:NASA"]
+    assert matcher.find_keywords("nasa, go, Gopher") == []
+    assert matcher.find_keywords("Let's Go to V2.10, re: subject") == ["word+case:Go", r"re:v\d+\.\d+", "re: subject"]
+
+
+def test_regex_rules_do_not_span_sentences_or_lines(tmp_path):
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text("re:foo.*bar\nword:cat\n")
+
+    html_file = tmp_path / "doc.html"
+    html_file.write_text("<html><body><p>A foo. Then a bar. The foo bar. Concat.</p></body></html>")
+    issue_counter, data = FindKeyword(src_file=str(html_file), keywords_file=str(keywords_file)).find()
+    assert issue_counter == 1 and data[0]["sentence"] == "The foo bar."
+
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("a foo\nbar\nfoo and bar\nthe cat_\ncat!\n")
+    issue_counter, data = FindKeyword(src_file=str(txt_file), keywords_file=str(keywords_file), file_ext="txt").find()
+    assert [(hit["line"], hit["offset"]) for hit in data] == [(3, 10), (5, 31)]
+
+
+def test_compiled_artifact_is_reused(tmp_path, monkeypatch):
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text(RULES)
+    artifact_dir = str(tmp_path / "rules_cache")
+
+    matcher = compile_rules(str(keywords_file), artifact_dir=artifact_dir)
+    assert len(os.listdir(artifact_dir)) == 1
+    assert compile_rules(str(keywords_file), artifact_dir=artifact_dir) is matcher
+
+    # Another process (empty memo) loads the artifact instead of building the matcher
+    monkeypatch.setattr(rules_module, "_compiled", {})
+    monkeypatch.setattr(rules_module, "build_rules_matcher", lambda *args, **kwargs: pytest.fail("rebuilt"))
+    loaded = compile_rules(str(keywords_file), artifact_dir=artifact_dir)
+    assert loaded is not matcher and loaded.keywords == matcher.keywords
+    assert loaded.find_keywords("a cat, v1.2") == ["word:cat", r"re:v\d+\.\d+"]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX owner/mode bits")
+def test_artifact_must_be_private(tmp_path, monkeypatch):
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text(RULES)
+    artifact_dir = tmp_path / "rules_cache"
+    compile_rules(str(keywords_file), artifact_dir=str(artifact_dir))
+    artifact_path = artifact_dir / os.listdir(artifact_dir)[0]
+    assert (artifact_dir.stat().st_mode & 0o777, artifact_path.stat().st_mode & 0o777) == (0o700, 0o600)
+
+    # An artifact others could have written is not loaded (unpickling runs code); the rules are built again
+    built = []
+    build_rules_matcher = rules_module.build_rules_matcher
+    monkeypatch.setattr(rules_module, "build_rules_matcher", lambda *args, **kwargs: built.append(1) or
+                        build_rules_matcher(*args, **kwargs))
+    for folder_mode, file_mode in ((0o700, 0o666), (0o777, 0o600)):
+        monkeypatch.setattr(rules_module, "_compiled", {})
+        artifact_dir.chmod(folder_mode)
+        artifact_path.chmod(file_mode)
+        assert compile_rules(str(keywords_file), artifact_dir=str(artifact_dir)).find_keywords("a cat") == ["word:cat"]
+    assert len(built) == 2
+
@@ -0,0 +1,83 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the scan result cache.
+"""
+
+
+import os
+from src.core.find_keyword import FindKeyword
+from src.core.scan_cache import ScanCache, cached_find
+
+
+def make_finder(tmp_path, content: str, keywords: str = "BANNED KEYWORD\n") -> FindKeyword:
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text(keywords)
+    src_file = tmp_path / "doc.txt"
+    src_file.write_text(content)
+    return FindKeyword(src_file=str(src_file), keywords_file=str(keywords_file), file_ext="txt")
+
+
+def test_cached_find_hit_and_invalidation(tmp_path):
+    cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+
+    expected = make_finder(tmp_path, "a banned keyword\n").find()
+    assert cached_find(make_finder(tmp_path, "a banned keyword\n"), cache) == expected
+    assert cached_find(make_finder(tmp_path, "a banned keyword\n"), cache) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Changed document or keywords; scanned again
+    assert cached_find(make_finder(tmp_path, "clean\n"), cache) == (0, [])
+    assert cached_find(make_finder(tmp_path, "clean\n", keywords="clean\n"), cache)[0] == 1
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+    for index in range(3):
+        cache.put(f"key{index}", (1, [{"file": "doc.txt", "line": index, "sentence": "x" * 30}]))
+        os.utime(os.path.join(cache.cache_dir, f"key{index}.json"), (index, index))
+
+    # Room for 2.5 entries, evicted down to 90%; the least recently used one (key1) goes
+    cache.get("key0")
+    cache.max_size = 5 * os.path.getsize(os.path.join(cache.cache_dir, "key0.json")) // 2
+    cache.evict()
+    assert cache.get("key1") is None
+    assert cache.get("key0") is not None
+    assert cache.get("key2") is not None
+
+
+def test_cache_lists_the_directory_only_to_evict(tmp_path, monkeypatch):
+    listings = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: listings.append(path) or scandir(path))
+
+    cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+    for index in range(200):
+        cache.put(f"key{index}", (1, [{"file": "doc.txt", "line": index, "sentence": "x" * 30}]))
+    # Listed once, for the size of the existing entries
+    assert len(listings) == 1
+    entry_size = os.path.getsize(os.path.join(cache.cache_dir, "key0.json"))
+    assert cache.size == sum(os.path.getsize(entry.path) for entry in scandir(cache.cache_dir))
+
+    # Over the limit; evicted down to the low-water mark, so the next puts do not list it again
+    cache.max_size = 100 * entry_size
+    cache.put("key200", (1, []))
+    assert len(listings) == 2 and cache.size <= 0.9 * cache.max_size
+    for index in range(5):
+        cache.put(f"more{index}", (1, [{"file": "doc.txt", "line": index, "sentence": "x" * 30}]))
+    assert len(listings) == 2 and cache.size <= cache.max_size
+
+
+def test_cached_find_same_content_other_path(tmp_path):
+    cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+    finder = make_finder(tmp_path, "a banned keyword\n")
+    cached_find(finder, cache)
+
+    copy_file = tmp_path / "copy.txt"
+    copy_file.write_text("a banned keyword\n")
+    finder.src_file = str(copy_file)
+    issue_counter, file_data = cached_find(finder, cache)
+    assert cache.hits == 1
+    assert [hit["file"] for hit in file_data] == [str(copy_file)]
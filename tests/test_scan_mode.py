@@ -0,0 +1,70 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the "gate" scan mode (stop at the first keyword match) against the "report" mode.
+"""
+
+
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.utilities.instrumentation import ScanMetrics
+
+
+def test_gate_stops_at_the_first_pdf_match(tmp_path, keywords_file, make_pdf):
+    pdf_file = str(tmp_path / "doc.pdf")
+    make_pdf(pdf_file, ["Clean page.", "A banned keyword.", "A sample keyword.", "Clean again."])
+
+    report = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf").find()
+    metrics = ScanMetrics()
+    gate = FindKeyword(src_file=pdf_file, keywords_file=keywords_file, file_ext="pdf", mode="gate", metrics=metrics).find()
+
+    assert report[0] == 2
+    assert gate == (1, report[1][:1])
+    # The pages after the first match are not read
+    assert metrics.counters["pages"] == 2
+
+
+@pytest.mark.parametrize("html_parser", ["bs4", "stream"])
+def test_gate_html_and_txt(tmp_path, keywords_file, html_parser):
+    html_file = tmp_path / "doc.html"
+    html_file.write_text("<html><title>T</title><body><p>A sample keyword. Banned keyword too.</p></body></html>")
+    txt_file = tmp_path / "doc.txt"
+    txt_file.write_text("clean\na banned keyword\nsample keyword\n")
+
+    for src_file, file_ext in ((str(html_file), "html"), (str(txt_file), "txt")):
+        report = FindKeyword(src_file=src_file, keywords_file=keywords_file, file_ext=file_ext, html_parser=html_parser).find()
+        gate = FindKeyword(src_file=src_file, keywords_file=keywords_file, file_ext=file_ext, html_parser=html_parser,
+                           mode="gate").find()
+        assert report[0] == 2 and gate == (1, report[1][:1])
+
+    txt_file.write_text("all clean\n")
+    assert FindKeyword(src_file=str(txt_file), keywords_file=keywords_file, file_ext="txt", mode="gate").find() == (0, [])
+
+
+def test_gate_errors_and_invalid_mode(tmp_path, keywords_file):
+    pdf_file = tmp_path / "broken.pdf"
+    pdf_file.write_bytes(b"not a pdf")
+    assert FindKeyword(src_file=str(pdf_file), keywords_file=keywords_file, file_ext="pdf", mode="gate").find() == (-1, [])
+
+    with pytest.raises(ValueError):
+        FindKeyword(src_file=None, keywords_file=keywords_file, mode="fast")
+
+
+def test_gate_html_uses_the_chosen_parser(tmp_path, make_keywords_file):
+    keywords_file = make_keywords_file("CAFÉ KEYWORD")
+    # windows-1252, declared; and undeclared after 64 KB of ASCII (only BeautifulSoup checks the whole page)
+    declared = tmp_path / "declared.html"
+    declared.write_bytes("<html><head><meta charset='windows-1252'></head><body><p>Un café KEYWORD.</p></body></html>"
+                         .encode("cp1252"))
+    undeclared = tmp_path / "undeclared.html"
+    undeclared.write_bytes(("<html><body>" + "<p>Clean text.</p>" * 5000 + "<p>Un café KEYWORD.</p></body></html>")
+                           .encode("cp1252"))
+
+    for html_file in (declared, undeclared):
+        report = FindKeyword(src_file=str(html_file), keywords_file=keywords_file).find()
+        gate = FindKeyword(src_file=str(html_file), keywords_file=keywords_file, mode="gate").find()
+        assert report[0] == 1 and gate == (1, report[1][:1])
+
+    stream = FindKeyword(src_file=str(declared), keywords_file=keywords_file, html_parser="stream", mode="gate").find()
+    assert stream[0] == 1
@@ -0,0 +1,46 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the run level keyword search report.
+"""
+
+
+import csv
+import json
+from src.core.matcher import build_matcher
+from src.utilities.scan_report import ScanReport
+
+
+HITS_A = [
+    {"file": "a.pdf", "page": 1, "line": 1, "sentence": "Old BUILD 1.2 and KEYWORD."},
+    {"file": "a.pdf", "page": 1, "line": 1, "sentence": "Old BUILD 1.2 and KEYWORD."},
+]
+HITS_B = [{"file": "b.html", "title": "B", "line": 3, "sentence": "A keyword, again."}]
+
+
+def test_merged_partial_reports(tmp_path):
+    matcher = build_matcher(["build 1.2", "keyword"])
+
+    # Two partial reports (e.g. two workers/shards), saved and merged
+    partial_a, partial_b = ScanReport(matcher=matcher), ScanReport(matcher=matcher)
+    partial_a.add("a.pdf", 2, HITS_A, elapsed=0.5)
+    partial_b.add("b.html", 1, HITS_B, elapsed=0.25)
+    partial_b.add("c.pdf", 0, [], elapsed=0.25)
+    partial_a.save(str(tmp_path / "a.json"))
+    partial_b.save(str(tmp_path / "b.json"))
+
+    report = ScanReport.load(str(tmp_path / "a.json")).merge(ScanReport.load(str(tmp_path / "b.json")))
+    issues_path, summary_path = report.write(report_dir=str(tmp_path / "out"))
+
+    with open(summary_path) as file:
+        summary = json.load(file)
+    assert (summary["files"], summary["files_with_issues"], summary["issues"]) == (3, 2, 3)
+    assert summary["elapsed"] == 1.0
+    assert summary["keyword_counts"] == {"keyword": 2, "build 1.2": 1}
+    assert summary["per_file"]["a.pdf"]["keyword_counts"] == {"build 1.2": 1, "keyword": 1}
+
+    with open(issues_path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert [row["file"] for row in rows] == ["a.pdf", "a.pdf", "b.html"]
+    assert (rows[0]["page"], rows[2]["title"]) == ("1", "B")
@@ -1,7 +1,7 @@
 """
 @author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
 @created: 5 Jun 2025
-@last_modified: 06 Jun 2025
+@last_modified: 17 Oct 2026
 @desc: pytest test to search for keywords in files with a specific extension.
 @note: This test will fail if any keyword is found in the files.
     
@@ -17,15 +17,17 @@ Example:
 """
 
 
-import os
+import time
 import pytest
 from src.core.find_keyword import FindKeyword
-from src.utilities.utilities import Utilities
-from src.utilities.write_logs import write_csv_logs_for_keyword_search
+from src.core.scan_cache import cached_find
+from src.utilities.file_discovery import file_ext_for
 
 
-@pytest.mark.usefixtures("file_ext", "keyword_file")
-def test_seach_keywords(file_list, file_ext, keyword_file):
+@pytest.mark.usefixtures("file_ext", "keyword_file", "scan_results", "scan_cache", "html_parser", "scan_report", "scan_metrics",
+                         "scan_mode", "src_data", "page_cache")
+def test_seach_keywords(file_list, file_ext, keyword_file, scan_results, scan_cache, html_parser, scan_report, scan_metrics,
+                        scan_mode, src_data, page_cache):
     """
     Test to search for keywords in files with a specific extension in the target directory.
     This test will fail if any keyword is found in the files.
@@ -34,7 +36,15 @@ def test_seach_keywords(file_list, file_ext, keyword_file):
         file_list (list): List of files to search for keywords. 
                         [this is a (parameterized) fixture that provides the list of files 
                         from the target directory with given extensions for tests.]
-        file_ext (str): The file extension to filter files by.
+        file_ext (str): The file extension(s) to filter files by; each file is scanned by its own extension.
+        scan_results (dict): The pre-scanned results by file (only when '--workers' is given).
+        scan_cache (ScanCache): The scan result cache (None when '--no-cache' is given).
+        html_parser (str): The HTML parser backend (bs4 or stream).
+        scan_report (ScanReport): The run level report; written once at the end of the session (conftest.py).
+        scan_metrics (ScanMetrics): The stage timers/counters of the scan (JUnit XML properties, HTML report).
+        scan_mode (str): "report" (every match) or "gate" (stop at the first match; faster CI gating).
+        src_data (bytes): The content of the file, read ahead by the prefetcher ('--prefetch'); None to read it here.
+        page_cache (PageCache): The cache of the PDF page matches (None when '--no-cache' is given).
     Raises:
         AssertionError: If any keyword is found in the files.
     Example:
@@ -44,13 +54,22 @@ def test_seach_keywords(file_list, file_ext, keyword_file):
     # Perform the Search / Find keywords for a file (given by the parameterized fixture in conftest.py)
     # ------------------------------
     print(f"\n\n>>> Given: Keyword file: {keyword_file}, Src file: {file_list} with file extension: {file_ext}\n")
-    find_keyword = FindKeyword(src_file=file_list, keywords_file=keyword_file, file_ext=file_ext, verbose=False)
-    issue_counter, data = find_keyword.find()
+    if file_list in scan_results:
+        # Already scanned by the worker processes (--workers)
+        (issue_counter, data), elapsed = scan_results[file_list]
+    else:
+        start = time.perf_counter()
+        with scan_metrics.capture():
+            find_keyword = FindKeyword(src_file=file_list, keywords_file=keyword_file,
+                                       file_ext=file_ext_for(file_list, file_ext), verbose=False,
+                                       html_parser=html_parser, metrics=scan_metrics, mode=scan_mode,
+                                       src_data=src_data, page_cache=page_cache)
+            issue_counter, data = cached_find(find_keyword, scan_cache)
+        elapsed = time.perf_counter() - start
     
-    # Write the data to a CSV file
+    # Collect the data for the run level report (./out/find_keyword_issues.csv, written once at the end)
     # ------------------------------
-    csv_file_path = os.path.abspath("./out/find_keyword_issues.csv")
-    write_csv_logs_for_keyword_search(csv_log_file=csv_file_path, data=data, mode='w')
+    scan_report.add(file_list, issue_counter, data, elapsed=elapsed)
     
     # Assert now
     # ------------------------------
@@ -0,0 +1,88 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the sentence segmenter.
+@note: The span based matching must give the same result as splitting the text into sentence
+    strings and matching each normalized sentence, also when the text is given in blocks.
+"""
+
+
+import random
+import re
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.core.matcher import build_matcher
+from src.core.segmenter import SENTENCE_SPLIT_REGEX, SentenceBlocks, SentenceSpans, iter_sentence_matches, normalize_sentence
+
+
+KEYWORDS = ["a b", "b. a", "ab", "e", "A  B", "mr. z"]
+PIECES = list("ab. ?A\nZe.g \r\n\t\x0c\x85") + ["Mr.", "e.g.", "a b", "A  B", " "]
+
+
+def reference_matches(text: str, keywords: list) -> list:
+    """Split into sentence strings, then match each normalized sentence."""
+    matches = []
+    for index, sentence in enumerate(re.split(SENTENCE_SPLIT_REGEX, text)):
+        sentence = normalize_sentence(sentence)
+        keyword_ids = [keyword_id for keyword_id, keyword in enumerate(keywords) if keyword.lower() in sentence.lower()]
+        if keyword_ids:
+            matches.append((index + 1, keyword_ids, sentence))
+    return matches
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_span_matching_same_as_sentence_strings(seed):
+    rnd = random.Random(seed)
+    matcher = build_matcher(KEYWORDS)
+
+    for _ in range(100):
+        text = "".join(rnd.choice(PIECES) for _ in range(rnd.randint(0, 60)))
+        expected = reference_matches(text, KEYWORDS)
+
+        spans = SentenceSpans(text)
+        assert [(index + 1, keyword_ids, spans.sentence(index)) for index, keyword_ids in spans.match(matcher)] == expected
+
+        # The same text in blocks (e.g. pages)
+        cuts = sorted(rnd.sample(range(len(text) + 1), min(len(text) + 1, rnd.randint(0, 5))))
+        blocks = [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+        assert [(number, ids, sentence) for number, _, ids, sentence in iter_sentence_matches(blocks, matcher)] == expected
+
+
+def test_sentence_block_index():
+    matcher = build_matcher(["KEYWORD"])
+    blocks = ["First KEYWORD. Crosses the", "\npage KEYWORD. Next", " KEYWORD one."]
+    assert [(number, block) for number, block, _, _ in iter_sentence_matches(blocks, matcher)] == [(1, 0), (2, 0), (3, 1)]
+
+
+def test_carry_over_is_bounded():
+    matcher = build_matcher(["KEYWORD"])
+    # A table without any sentence end; the unfinished sentence is closed once it is too long to carry over
+    blocks = ["cell KEYWORD row\n"] * 50 + ["end KEYWORD."]
+    sentences = SentenceBlocks(matcher, max_carry_over=100)
+
+    matches = []
+    for block in blocks:
+        matches += sentences.feed(block)
+        assert len(sentences.carry_over) <= 100
+    matches += sentences.finish()
+
+    assert [(number, block) for number, block, _, _ in matches] == [(number + 1, number * 6) for number in range(9)]
+    assert matches[0][3] == " ".join(["cell KEYWORD row"] * 6)
+    assert matches[-1][3] == "cell KEYWORD row cell KEYWORD row end KEYWORD."
+
+
+def test_lowering_changes_the_length(tmp_path, make_keywords_file):
+    # 'İ' lowers to 2 chars ('i̇'); the later matches must stay in their sentence
+    text = "İ" * 30 + ". hello there. Other İ hello."
+    spans = SentenceSpans(text)
+    assert [(index, keyword_ids) for index, keyword_ids in spans.match(build_matcher(["hello"]))] == [(1, [0]), (2, [0])]
+    assert [(number, ids) for number, _, ids, _ in iter_sentence_matches([text[:20], text[20:]], build_matcher(["hello"]))] == \
+        [(2, [0]), (3, [0])]
+
+    html_file = tmp_path / "doc.html"
+    html_file.write_text(f"<p>{text}</p>", encoding="utf-8")
+    for html_parser in ("bs4", "stream"):
+        issue_counter, hits = FindKeyword(src_file=str(html_file), keywords_file=make_keywords_file("hello"),
+                                          html_parser=html_parser).find()
+        assert issue_counter == 2 and [hit["sentence"] for hit in hits] == ["hello there.", "Other İ hello."]
@@ -0,0 +1,112 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the sharding of the files (balanced, deterministic split), the scan timings and
+    the merge of the partial reports; with a sharded run simulated on one machine (one pytest run per shard).
+"""
+
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+from src.cli import EXIT_ERROR, EXIT_FOUND, main
+from src.utilities.scan_report import ScanReport
+from src.utilities.sharding import ScanTimings, file_weights, merge_partial_reports, shard_files
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_shards_are_balanced_and_complete():
+    sizes = [900, 10, 500, 400, 20, 300, 300, 70]
+    stats = {f"doc_{number}.html": (0, size) for number, size in enumerate(sizes)}
+    files = list(stats)
+    weights = file_weights(stats)
+
+    shards = [shard_files(files, index, 3, weights=weights) for index in range(3)]
+    assert sorted(sum(shards, [])) == sorted(files)
+    assert [sum(stats[path][1] for path in shard) for shard in shards] == [900, 800, 800]
+    # Same split on every node; the files of a shard keep the given order
+    assert shard_files(files, 1, 3, weights=dict(weights)) == shards[1] == [path for path in files if path in shards[1]]
+    assert shard_files(files, 0, 1) == files
+
+    with pytest.raises(ValueError):
+        shard_files(files, 3, 3)
+    with pytest.raises(ValueError):
+        file_weights(stats, shard_by="count")
+
+
+def test_timing_weights(tmp_path):
+    stats = {"slow.pdf": (0, 100), "fast.html": (0, 1000), "new.html": (0, 500)}
+    timings = ScanTimings(str(tmp_path / "timings.json"))
+    report = ScanReport()
+    report.add("slow.pdf", 0, [], elapsed=9.0)
+    report.add("fast.html", 1, [], elapsed=1.0)
+    report.add("broken.pdf", -1, [], elapsed=5.0)
+    timings.update(report)
+    timings.save()
+
+    weights = file_weights(stats, shard_by="timings", timings=ScanTimings(timings.timings_file).files)
+    # The new file is estimated with the average speed of the others (10 s for 1100 bytes)
+    assert weights == {"slow.pdf": 9.0, "fast.html": 1.0, "new.html": pytest.approx(500 * 10 / 1100)}
+    assert shard_files(list(stats), 0, 2, weights=weights) == ["slow.pdf"]
+    # Without timings, by size
+    assert file_weights(stats, shard_by="timings") == {"slow.pdf": 100, "fast.html": 1000, "new.html": 500}
+
+
+def save_partial(path: str, files: dict, index: int, count: int, keywords: str = "k1"):
+    report = ScanReport()
+    for src_file, issue_counter in files.items():
+        report.add(src_file, issue_counter, [], elapsed=0.5)
+    report.meta = {"shard": {"index": index, "count": count, "by": "size"}, "keywords": keywords}
+    report.save(path)
+
+
+def test_merge_problems(tmp_path):
+    save_partial(str(tmp_path / "a.json"), {"a.html": 0}, 0, 3)
+    save_partial(str(tmp_path / "b.json"), {"b.html": 2, "a.html": 0}, 0, 3, keywords="k2")
+
+    report, problems = merge_partial_reports([str(tmp_path / "a.json"), str(tmp_path / "b.json")])
+    assert sorted(report.files) == ["a.html", "b.html"]
+    assert [problem.split(" ")[0] for problem in problems] == ["Shard", "1", "Missing", "The"]
+    assert "shard(s) 1, 2" in problems[2]
+
+
+def run_shard(tmp_path, docs, index: int, count: int):
+    """One sharded pytest run (a CI node), in its own process."""
+    command = [sys.executable, "-m", "pytest", "tests/test_seach_keywords.py", "-q", "-p", "no:cacheprovider",
+               "-o", "addopts=", "--target_dir", str(docs), "--file_ext", "txt", "--no-cache",
+               "--keyword_file", str(tmp_path / "keywords.txt"), "--report_dir", str(tmp_path / "partials"),
+               "--manifest", str(tmp_path / "manifest.json"), "--rules-cache-dir", str(tmp_path / "rules"),
+               "--shard-index", str(index), "--shard-count", str(count), "--shard-by", "timings",
+               "--shard-timings", str(tmp_path / "timings.json")]
+    return subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True)
+
+
+def test_sharded_run_and_merge(tmp_path, capsys):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for number in range(5):
+        (docs / f"doc_{number}.txt").write_text("clean line\n" * (number * 20 + 1) + ("a banned keyword\n" if number == 2 else ""))
+    (tmp_path / "keywords.txt").write_text("BANNED KEYWORD\n")
+
+    results = [run_shard(tmp_path, docs, index, 2) for index in range(2)]
+    assert sorted(result.returncode for result in results) == [0, 1], results[0].stdout + results[1].stdout
+    assert sorted(os.listdir(tmp_path / "partials")) == ["find_keyword_partial_1of2.json", "find_keyword_partial_2of2.json"]
+    assert not (tmp_path / "manifest.json").exists() and not (tmp_path / "timings.json").exists()
+
+    exit_code = main(["merge", str(tmp_path / "partials"), "--report_dir", str(tmp_path / "report"),
+                      "--timings", str(tmp_path / "timings.json")])
+    assert exit_code == EXIT_FOUND
+    with open(tmp_path / "report" / "find_keyword_summary.json") as file:
+        summary = json.load(file)
+    assert (summary["files"], summary["issues"], summary["files_with_issues"]) == (5, 1, 1)
+    assert len(ScanTimings(str(tmp_path / "timings.json")).files) == 5
+    assert "Merged 2 partial report(s): 5 files, 1 issues" in capsys.readouterr().out
+
+    # A missing shard is an error
+    os.remove(tmp_path / "partials" / "find_keyword_partial_2of2.json")
+    assert main(["merge", str(tmp_path / "partials"), "--report_dir", str(tmp_path / "report"), "--timings", ""]) == EXIT_ERROR
@@ -0,0 +1,80 @@
+"""
+@author: Ashutosh Mishra | ashutosh_mishra_@outlook.com
+@created: 17 Oct 2026
+@last_modified: 17 Oct 2026
+@desc: pytest tests for the memory-mapped, chunked text scanner.
+@note: The results must not depend on the chunk size (keywords crossing chunk boundaries, long lines,
+    multi-byte characters) and must match a line by line reference scan.
+"""
+
+
+import random
+import pytest
+from src.core.find_keyword import FindKeyword
+from src.core.matcher import build_matcher
+from src.core.text_scanner import iter_text_matches
+
+
+KEYWORDS = ["KEYWORD", "Grüße", "ab", "long keyword here", "ab"]
+
+
+def reference_scan(text_file: str, keywords: list) -> list:
+    """Line by line scan: (line number, byte offset, keyword id, stripped line)."""
+    matches = []
+    byte_start = 0
+    with open(text_file, 'rb') as file:
+        raw_lines = file.read().split(b"\n")
+
+    for line_number, raw_line in enumerate(raw_lines, start=1):
+        line = raw_line.decode("utf-8", errors="replace")
+        if line.strip():
+            for keyword_id, keyword in enumerate(keywords):
+                position = line.lower().find(keyword.lower())
+                if position != -1:
+                    matches.append((line_number, byte_start + len(line[:position].encode()), keyword_id, line.strip()))
+        byte_start += len(raw_line) + 1
+    return matches
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chunked_scan_same_as_reference(tmp_path, seed):
+    rnd = random.Random(seed)
+    pieces = list("abc é\n\n\r ") + ["KEYWORD", "grüße", "GRÜSSE", "long keyword here", "x" * 120]
+    text_file = tmp_path / "doc.txt"
+    text_file.write_text("".join(rnd.choice(pieces) for _ in range(400)), encoding="utf-8")
+
+    matcher = build_matcher(KEYWORDS)
+    expected = reference_scan(str(text_file), KEYWORDS)
+    for chunk_size in (1, 9, 31, 4096):
+        assert list(iter_text_matches(str(text_file), matcher, chunk_size=chunk_size)) == expected
+
+
+def test_lowering_changes_the_length(tmp_path):
+    # 'İ' lowers to 2 chars ('i̇'); the matches are still mapped to their line and byte offset
+    text_file = tmp_path / "doc.txt"
+    text_file.write_text("İİİİİİİİİİ\nxx hello İ KEYWORD\n", encoding="utf-8")
+
+    matcher = build_matcher(["hello", "KEYWORD", "i"])
+    expected = [(1, 0, 2, "İİİİİİİİİİ"), (2, 24, 0, "xx hello İ KEYWORD"), (2, 33, 1, "xx hello İ KEYWORD"),
+                (2, 30, 2, "xx hello İ KEYWORD")]
+    for chunk_size in (1, 9, 4096):
+        assert list(iter_text_matches(str(text_file), matcher, chunk_size=chunk_size)) == expected
+
+
+def test_find_keyword_txt_line_numbers(tmp_path):
+    text_file = tmp_path / "doc.txt"
+    text_file.write_text("clean\n\n  a SAMPLE KEYWORD  \nlast KEYWORD", encoding="utf-8")
+
+    issue_counter, data = FindKeyword(src_file=str(text_file), keywords_file="./rules/keywords.txt", file_ext="txt").find()
+    assert issue_counter == 3
+    assert [(hit["line"], hit["offset"], hit["sentence"]) for hit in data] == [
+        (3, 18, "a SAMPLE KEYWORD"),  # KEYWORD
+        (3, 11, "a SAMPLE KEYWORD"),  # SAMPLE KEYWORD
+        (4, 33, "last KEYWORD"),
+    ]
+
+
+def test_empty_file(tmp_path):
+    text_file = tmp_path / "empty.txt"
+    text_file.write_bytes(b"")
+    assert list(iter_text_matches(str(text_file), build_matcher(KEYWORDS))) == []